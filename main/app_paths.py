@@ -0,0 +1,9 @@
+import os
+
+
+def app_data_dir(*parts):
+    """사용자별 프로그램 데이터 폴더 (%LOCALAPPDATA%\\to_pdf 아래)"""
+    base = os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), ".local", "share")
+    path = os.path.join(base, "to_pdf", *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
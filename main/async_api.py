@@ -0,0 +1,128 @@
+import os
+import queue
+import asyncio
+import threading
+
+from engine import run_batch
+from scanner import FILE_TYPES
+
+_DONE = object()
+# 확장자별 변환 파이프라인에 미리 넘겨 두는 최대 파일 수 (넘으면 입력을 더 읽지 않고 기다림)
+# 한쪽이 밀려도 다른 쪽이 일감을 계속 받도록 워커 수보다 넉넉하게 둠
+FEED_SIZE = 1000
+
+
+def _file_type_of(item):
+    path = item if isinstance(item, str) else item.path
+    return FILE_TYPES.get(os.path.splitext(path)[1].lower())
+
+
+def _path_of(item):
+    return item if isinstance(item, str) else item.path
+
+
+async def convert_many(paths, output_folder, file_type=None, workers=1, backend="com",
+                       max_pending=None, should_stop=None, log=None, **options):
+    """파일들을 PDF로 변환하며 끝나는 순서대로 결과(dict)를 내놓는 비동기 생성기
+
+        async for result in convert_many(paths, out_dir, workers=4):
+            print(result["filename"], result["status"])
+
+    paths는 파일 경로 또는 스캔 결과(ScannedFile)를 차례로 내놓는 반복 가능 객체이며
+    필요한 만큼만 읽는다. file_type을 주지 않으면 확장자로 한글/워드를 나눠 두 변환기를
+    동시에 돌린다. 결과 status는 done/failed/timeout/skipped 중 하나다.
+
+    가져가지 않은 결과가 max_pending개(기본 워커 수의 2배) 쌓이면 새 파일을 보내지 않고
+    기다린다. 반복을 멈추거나 작업이 취소되면 변환 중인 파일까지만 처리하고 변환기를
+    정리한 뒤 끝난다. options는 run_batch로 그대로 넘어간다 (timeout, manifest, cache 등).
+    """
+    loop = asyncio.get_running_loop()
+    results = asyncio.Queue()
+    slots = threading.Semaphore(max_pending or max(1, workers) * 2)
+    stop = threading.Event()
+
+    def stopping():
+        return stop.is_set() or bool(should_stop and should_stop())
+
+    def emit(item, wait=True):
+        # 가져가지 않은 결과가 max_pending개면 자리가 날 때까지 변환 스레드를 멈춤
+        while wait and not slots.acquire(timeout=0.2):
+            if stop.is_set():
+                return
+        try:
+            loop.call_soon_threadsafe(results.put_nowait, item)
+        except RuntimeError:
+            # 이벤트 루프가 이미 닫힘
+            pass
+
+    def skipped(file_type):
+        return lambda job: emit(dict(job, status="skipped", error=None, file_type=file_type))
+
+    finished = set()
+
+    def pipeline(file_type, items):
+        try:
+            run_batch(file_type, items, output_folder, workers=workers, backend=backend, log=log,
+                      on_result=emit, on_skip=skipped(file_type), should_stop=stopping, **options)
+        except Exception as e:
+            emit(e, wait=False)
+        finally:
+            finished.add(file_type)
+            emit(_DONE, wait=False)
+
+    def feed(feeds, item_type, item):
+        """파이프라인 입력 큐가 차 있으면 자리가 날 때까지 대기 (파이프라인이 끝났으면 버림)"""
+        while item_type not in finished:
+            try:
+                feeds[item_type].put(item, timeout=0.2)
+                return
+            except queue.Full:
+                pass
+
+    def dispatch(feeds):
+        """확장자별로 파일을 나눠 각 변환 파이프라인에 전달"""
+        try:
+            for item in paths:
+                if stopping():
+                    break
+                item_type = _file_type_of(item)
+                if item_type in feeds:
+                    feed(feeds, item_type, item)
+                else:
+                    path = _path_of(item)
+                    emit({"source": os.path.abspath(path), "output": None, "filename": os.path.basename(path),
+                          "file_type": None, "status": "failed", "error": "지원하지 않는 파일 형식입니다."})
+        except Exception as e:
+            emit(e, wait=False)
+        finally:
+            for item_type in feeds:
+                feed(feeds, item_type, _DONE)
+
+    threads = []
+    if file_type is not None:
+        threads.append(threading.Thread(target=pipeline, args=(file_type, paths), daemon=True))
+    else:
+        feeds = {t: queue.Queue(maxsize=FEED_SIZE) for t in ("hwp", "word")}
+        threads.append(threading.Thread(target=dispatch, args=(feeds,), daemon=True))
+        for t, items in feeds.items():
+            threads.append(threading.Thread(target=pipeline, args=(t, iter(items.get, _DONE)), daemon=True))
+    remaining = len(threads) if file_type is not None else len(threads) - 1
+
+    for thread in threads:
+        thread.start()
+    try:
+        while remaining:
+            item = await results.get()
+            if item is _DONE:
+                remaining -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                slots.release()
+                yield item
+    finally:
+        # 남은 결과는 버리고 변환 스레드가 변환기를 정리할 때까지 대기
+        stop.set()
+        for thread in threads:
+            while thread.is_alive():
+                await loop.run_in_executor(None, thread.join, 0.2)
@@ -0,0 +1,475 @@
+import os
+import sys
+import math
+import time
+import random
+
+from dialog_watcher import DialogWatcher
+from page_split import estimate_pages
+
+HWP_EXTENSIONS = (".hwp", ".hwpx")
+WORD_EXTENSIONS = (".doc", ".docx")
+
+HWP_OPEN_OPTIONS = "versionwarning:false;securitywarning:false;updatechecking:false;passworddlg:false;repair:false"
+
+COM_PROGIDS = {"hwp": "HWPFrame.HwpObject", "word": "Word.Application"}
+# PDF 저장 옵션을 바꾸면 올려서 이전 캐시 결과를 무효화
+EXPORT_REVISION = 1
+
+_version_cache = {}
+
+
+def _noop_log(message):
+    pass
+
+
+def process_rss(pid):
+    """프로세스의 메모리 사용량(작업 집합/RSS, 바이트). 알 수 없거나 프로세스가 없으면 None"""
+    if not pid:
+        return None
+    try:
+        import psutil
+        return psutil.Process(pid).memory_info().rss
+    except ImportError:
+        pass
+    except Exception:
+        return None
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + [
+                (name, ctypes.c_size_t) for name in (
+                    "PeakWorkingSetSize", "WorkingSetSize", "QuotaPeakPagedPoolUsage", "QuotaPagedPoolUsage",
+                    "QuotaPeakNonPagedPoolUsage", "QuotaNonPagedPoolUsage", "PagefileUsage", "PeakPagefileUsage")]
+
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        kernel32.OpenProcess.restype = wintypes.HANDLE
+        # PROCESS_QUERY_LIMITED_INFORMATION | PROCESS_VM_READ
+        handle = kernel32.OpenProcess(0x1000 | 0x0010, False, pid)
+        if not handle:
+            return None
+        try:
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            if not kernel32.K32GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+                return None
+            return counters.WorkingSetSize
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        with open(f"/proc/{pid}/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _co_initialize():
+    """워커 프로세스/스레드에서 COM 초기화"""
+    try:
+        import pythoncom
+        pythoncom.CoInitialize()
+        return
+    except ImportError:
+        pass
+    try:
+        import comtypes
+        comtypes.CoInitialize()
+    except ImportError:
+        pass
+
+
+class HwpBackend:
+    """한글(HWPFrame.HwpObject) COM 변환기"""
+
+    file_type = "hwp"
+
+    def __init__(self, log=None):
+        self.log = log or _noop_log
+        self.hwp = None
+        self.dialog_watcher = None
+
+    def start(self):
+        _co_initialize()
+        try:
+            import win32com.client
+            self.log("win32com 라이브러리를 사용합니다.")
+            self.hwp = win32com.client.DispatchEx("HWPFrame.HwpObject")
+        except ImportError:
+            try:
+                import comtypes.client
+            except ImportError:
+                self.log("❌ 오류: 필요한 COM 라이브러리가 없습니다.")
+                self.log("win32com 또는 comtypes 라이브러리가 필요합니다.")
+                raise
+            self.log("comtypes 라이브러리를 사용합니다.")
+            self.hwp = comtypes.client.CreateObject("HWPFrame.HwpObject")
+
+        try:
+            self.hwp.SetMessageBoxMode(0x00000020)
+            self.hwp.RegisterModule("FilePathCheckDLL", "FilePathCheckerModule")
+        except:
+            pass
+
+        # 배치 전체에서 공유하는 권한 대화상자 감시 서비스
+        self.dialog_watcher = DialogWatcher(owner_pid=self.app_pid(), log=self.log)
+        self.dialog_watcher.start()
+
+    def app_pid(self):
+        """한글 프로그램의 프로세스 ID (알 수 없으면 None)"""
+        try:
+            import win32process
+            hwnd = self.hwp.XHwpWindows.Item(0).WindowHandle
+            return win32process.GetWindowThreadProcessId(hwnd)[1]
+        except Exception:
+            return None
+
+    def is_alive(self):
+        """한글이 COM 호출에 응답하는지 확인 (사용자가 창을 닫았거나 죽었으면 False)"""
+        try:
+            self.hwp.XHwpDocuments.Count
+            return True
+        except Exception:
+            return False
+
+    def convert(self, source, output):
+        file_ext = os.path.splitext(source)[1].lower()
+
+        timings = {}
+        self.dialog_watcher.begin_file()
+        try:
+            started = time.perf_counter()
+            # HWPX 파일은 다른 형식으로 열기
+            if file_ext == '.hwpx':
+                self.hwp.Open(source, "HWPX", HWP_OPEN_OPTIONS)
+            else:
+                self.hwp.Open(source, "HWP", HWP_OPEN_OPTIONS)
+
+            # 열기 직후 남아 있는 권한 대화상자 확인 (없으면 바로 진행, 있으면 닫힐 때까지 기다린 뒤 다시 확인)
+            for _ in range(20):
+                if not self.dialog_watcher.check_now():
+                    break
+            timings["open"] = time.perf_counter() - started
+
+            started = time.perf_counter()
+            self.hwp.SaveAs(output, "PDF", "")
+            timings["save"] = time.perf_counter() - started
+
+            started = time.perf_counter()
+            self.hwp.Clear(1)
+            timings["close"] = time.perf_counter() - started
+        except Exception:
+            try:
+                self.hwp.Clear(1)
+            except:
+                pass
+            raise
+        finally:
+            dialog_time, dialog_count = self.dialog_watcher.end_file()
+        timings["dialog"] = dialog_time
+        return {"dialog_time": dialog_time, "dialog_count": dialog_count, "timings": timings}
+
+    def quit(self):
+        if self.dialog_watcher is not None:
+            self.dialog_watcher.stop()
+            self.dialog_watcher = None
+        try:
+            self.hwp.Quit()
+        except:
+            pass
+        self.hwp = None
+
+
+class WordBackend:
+    """Microsoft Word(Word.Application) COM 변환기"""
+
+    file_type = "word"
+
+    def __init__(self, log=None):
+        self.log = log or _noop_log
+        self.word_app = None
+
+    def start(self):
+        _co_initialize()
+        try:
+            import win32com.client
+            self.log("Microsoft Word COM 객체를 사용합니다.")
+        except ImportError:
+            self.log("❌ 오류: win32com 라이브러리가 없습니다.")
+            self.log("pip install pywin32로 설치해주세요.")
+            raise
+
+        try:
+            self.word_app = win32com.client.DispatchEx("Word.Application")
+            self.word_app.Visible = False
+            self.word_app.DisplayAlerts = False
+        except Exception as e:
+            self.log(f"❌ Microsoft Word 실행 실패: {e}")
+            self.log("Microsoft Word가 설치되어 있는지 확인해주세요.")
+            raise
+
+    def app_pid(self):
+        """워드 프로그램의 프로세스 ID (창 제목을 잠시 바꿔 창을 찾음)"""
+        try:
+            import win32gui
+            import win32process
+            caption = self.word_app.Caption
+            marker = f"to_pdf-{os.getpid()}-{id(self)}"
+            self.word_app.Caption = marker
+            try:
+                hwnd = win32gui.FindWindow("OpusApp", marker)
+            finally:
+                self.word_app.Caption = caption
+            return win32process.GetWindowThreadProcessId(hwnd)[1] if hwnd else None
+        except Exception:
+            return None
+
+    def is_alive(self):
+        """워드가 COM 호출에 응답하는지 확인"""
+        try:
+            self.word_app.Documents.Count
+            return True
+        except Exception:
+            return False
+
+    def convert(self, source, output):
+        timings = {}
+        doc = None
+        try:
+            started = time.perf_counter()
+            doc = self.word_app.Documents.Open(source)
+            timings["open"] = time.perf_counter() - started
+
+            started = time.perf_counter()
+            doc.SaveAs2(output, FileFormat=17)  # 17 = PDF format
+            timings["save"] = time.perf_counter() - started
+
+            started = time.perf_counter()
+            doc.Close()
+            timings["close"] = time.perf_counter() - started
+        except Exception:
+            try:
+                if doc is not None:
+                    doc.Close()
+            except:
+                pass
+            raise
+        return {"timings": timings}
+
+    def convert_range(self, source, output, page_from, page_to, last=False):
+        """page_from~page_to쪽만 PDF로 내보냄 (last면 문서 끝까지, 내보낸 쪽 수 포함 반환)"""
+        timings = {}
+        doc = None
+        try:
+            started = time.perf_counter()
+            # 여러 인스턴스가 같은 문서를 동시에 열므로 읽기 전용으로 엶
+            doc = self.word_app.Documents.Open(source, ReadOnly=True, AddToRecentFiles=False)
+            total_pages = doc.ComputeStatistics(2)  # 2 = wdStatisticPages
+            timings["open"] = time.perf_counter() - started
+
+            # 저장된 쪽 수가 실제와 다를 수 있으므로 실제 쪽 수에 맞춤
+            page_to = total_pages if last else min(page_to, total_pages)
+            pages = max(0, page_to - page_from + 1)
+            started = time.perf_counter()
+            if pages:
+                # 17 = wdExportFormatPDF, 3 = wdExportFromTo
+                doc.ExportAsFixedFormat(OutputFileName=output, ExportFormat=17, OpenAfterExport=False,
+                                        OptimizeFor=0, Range=3, From=page_from, To=page_to)
+            timings["save"] = time.perf_counter() - started
+
+            started = time.perf_counter()
+            doc.Close(SaveChanges=0)
+            timings["close"] = time.perf_counter() - started
+        except Exception:
+            try:
+                if doc is not None:
+                    doc.Close(SaveChanges=0)
+            except:
+                pass
+            raise
+        return {"timings": timings, "pages": pages, "total_pages": total_pages}
+
+    def quit(self):
+        try:
+            self.word_app.Quit()
+        except:
+            pass
+        self.word_app = None
+
+
+def write_stub_pdf(path, pages=1):
+    """빈 페이지로 이루어진 최소한의 PDF 파일 생성"""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>"]
+    kids = " ".join(f"{3 + i} 0 R" for i in range(pages))
+    objects.append(f"<< /Type /Pages /Kids [{kids}] /Count {pages} >>")
+    for _ in range(pages):
+        objects.append("<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] >>")
+
+    data = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(data))
+        data += f"{number} 0 obj\n{body}\nendobj\n".encode("ascii")
+    xref_offset = len(data)
+    data += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("ascii")
+    for offset in offsets:
+        data += f"{offset:010d} 00000 n \n".encode("ascii")
+    data += (f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+             f"startxref\n{xref_offset}\n%%EOF\n").encode("ascii")
+
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def parse_latency(spec):
+    """지연 시간 분포 문자열 해석 ("0.1", "fixed:0.1", "uniform:0.05:0.2", "lognormal:중앙값:시그마")"""
+    if isinstance(spec, (int, float)):
+        return ("fixed", float(spec))
+    if isinstance(spec, (tuple, list)):
+        return tuple(spec)
+    kind, _, rest = str(spec).partition(":")
+    if not rest:
+        return ("fixed", float(kind))
+    params = tuple(float(p) for p in rest.split(":"))
+    if kind not in ("fixed", "uniform", "lognormal"):
+        raise ValueError(f"알 수 없는 지연 분포: {spec}")
+    return (kind,) + params
+
+
+def sample_latency(spec, rng):
+    """분포에서 지연 시간(초) 하나를 뽑음"""
+    kind = spec[0]
+    if kind == "fixed":
+        return spec[1]
+    if kind == "uniform":
+        return rng.uniform(spec[1], spec[2])
+    if kind == "lognormal":
+        median, sigma = spec[1], spec[2]
+        return median * math.exp(rng.gauss(0, sigma))
+    raise ValueError(f"알 수 없는 지연 분포: {spec}")
+
+
+class FakeBackend:
+    """COM 없이 동작하는 테스트/벤치마크용 변환기 (지연 후 빈 PDF 작성)
+
+    열기/저장 지연 분포, 대화상자 발생률, 실패율을 지정할 수 있다.
+    파일 이름에 fail_marker가 들어 있으면 항상 실패하고, hang_marker가 들어 있으면 멈춘다.
+    쪽 수는 문서에 기록된 값(없으면 1쪽)을 쓰며, 쪽마다 page_latency초가 더 걸린다.
+    메모리 사용량은 base_mb에서 시작해 문서마다 leak_mb씩 늘어나는 것으로 흉내 낸다.
+    """
+
+    def __init__(self, file_type, log=None, delay=0.05, fail_marker="fail", hang_marker="hang",
+                 open_latency=None, save_latency=0, dialog_rate=0.0, dialog_latency=0.3,
+                 fail_rate=0.0, page_latency=0.0, base_mb=80.0, leak_mb=0.0, seed=None):
+        self.file_type = file_type
+        self.log = log or _noop_log
+        self.open_latency = parse_latency(delay if open_latency is None else open_latency)
+        self.save_latency = parse_latency(save_latency)
+        self.dialog_latency = parse_latency(dialog_latency)
+        self.dialog_rate = dialog_rate
+        self.fail_rate = fail_rate
+        self.page_latency = page_latency
+        self.base_mb = base_mb
+        self.leak_mb = leak_mb
+        self.documents = 0
+        self.fail_marker = fail_marker
+        self.hang_marker = hang_marker
+        self.rng = random.Random(seed)
+        self.started = False
+
+    def start(self):
+        self.log(f"가짜 변환기({self.file_type})를 사용합니다.")
+        self.started = True
+
+    def convert(self, source, output):
+        return self.convert_range(source, output, 1, None, last=True)
+
+    def convert_range(self, source, output, page_from, page_to, last=False):
+        if not self.started:
+            raise RuntimeError("변환기가 시작되지 않았습니다.")
+        if not os.path.exists(source):
+            raise FileNotFoundError(source)
+
+        timings = {}
+        started = time.perf_counter()
+        time.sleep(sample_latency(self.open_latency, self.rng))
+        if self.hang_marker and self.hang_marker in os.path.basename(source):
+            # 손상된 문서에서 멈춘 변환 프로그램 흉내
+            while True:
+                time.sleep(60)
+        dialog_time = 0.0
+        dialog_count = 0
+        if self.dialog_rate and self.rng.random() < self.dialog_rate:
+            dialog_time = sample_latency(self.dialog_latency, self.rng)
+            dialog_count = 1
+            time.sleep(dialog_time)
+        timings["open"] = time.perf_counter() - started
+        timings["dialog"] = dialog_time
+        if self.fail_marker and self.fail_marker in os.path.basename(source):
+            raise RuntimeError("가짜 변환 실패")
+        if self.fail_rate and self.rng.random() < self.fail_rate:
+            raise RuntimeError("가짜 변환 실패 (무작위)")
+
+        self.documents += 1
+        total_pages = estimate_pages(source) or 1
+        page_to = total_pages if last else min(page_to, total_pages)
+        pages = max(0, page_to - page_from + 1)
+        started = time.perf_counter()
+        time.sleep(sample_latency(self.save_latency, self.rng) + self.page_latency * pages)
+        if pages:
+            write_stub_pdf(output, pages)
+        timings["save"] = time.perf_counter() - started
+        return {"dialog_time": dialog_time, "dialog_count": dialog_count, "timings": timings,
+                "pages": pages, "total_pages": total_pages}
+
+    def is_alive(self):
+        return self.started
+
+    def memory_usage(self):
+        return int((self.base_mb + self.leak_mb * self.documents) * 1024 * 1024)
+
+    def quit(self):
+        self.started = False
+
+
+def _com_server_version(progid):
+    """COM 서버로 등록된 실행 파일의 파일 버전 (레지스트리/pywin32를 쓸 수 없으면 None)"""
+    try:
+        import winreg
+        import win32api
+        clsid = winreg.QueryValue(winreg.HKEY_CLASSES_ROOT, progid + "\\CLSID")
+        command = winreg.QueryValue(winreg.HKEY_CLASSES_ROOT, f"CLSID\\{clsid}\\LocalServer32")
+        # "C:\...\Hwp.exe" /Automation 같은 형식에서 실행 파일 경로만 추출
+        exe = command.split('"')[1] if command.startswith('"') else command.split(" /")[0]
+        info = win32api.GetFileVersionInfo(exe.strip(), "\\")
+    except Exception:
+        return None
+    ms, ls = info["FileVersionMS"], info["FileVersionLS"]
+    return f"{ms >> 16}.{ms & 0xFFFF}.{ls >> 16}.{ls & 0xFFFF}"
+
+
+def converter_version(name, file_type):
+    """변환 결과 캐시 키에 쓰는 변환기 식별자 (백엔드/종류/프로그램 버전/변환 옵션 개정)"""
+    key = (name, file_type)
+    if key not in _version_cache:
+        version = None
+        if name == "com":
+            version = _com_server_version(COM_PROGIDS.get(file_type, ""))
+        _version_cache[key] = f"{name}/{file_type}/{version or 'unknown'}/r{EXPORT_REVISION}"
+    return _version_cache[key]
+
+
+def create_backend(name, file_type, log=None, **options):
+    """백엔드 이름("com"/"fake")과 파일 종류로 변환기 생성"""
+    if name == "fake":
+        return FakeBackend(file_type, log=log, **options)
+    if name == "com":
+        if file_type == "hwp":
+            return HwpBackend(log=log)
+        if file_type == "word":
+            return WordBackend(log=log)
+    raise ValueError(f"알 수 없는 변환기: {name}/{file_type}")
@@ -0,0 +1,170 @@
+"""가짜 변환기로 일괄 변환 파이프라인 처리량 측정 (Linux에서도 실행 가능)
+
+예) python benchmark.py --files 1000 --workers 1,2,4,8 --open-latency lognormal:0.02:0.5 --dialog-rate 0.05
+"""
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import threading
+import multiprocessing
+
+from engine import run_batch
+from scanner import FolderScanner
+from log_sink import LogSink
+from run_report import percentile
+
+EXTENSIONS = {"hwp": (".hwp", ".hwpx"), "word": (".doc", ".docx")}
+
+
+def make_synthetic_folder(folder, count, file_type="all", subfolders=0, seed=0):
+    """count개의 가짜 입력 파일 생성 (크기 1~64KB)"""
+    rng = random.Random(seed)
+    types = ["hwp", "word"] if file_type == "all" else [file_type]
+    for i in range(count):
+        ext = rng.choice(EXTENSIONS[rng.choice(types)])
+        subfolder = os.path.join(folder, f"sub{i % subfolders:03d}") if subfolders else folder
+        os.makedirs(subfolder, exist_ok=True)
+        with open(os.path.join(subfolder, f"doc{i:06d}{ext}"), "wb") as f:
+            f.write(b"\0" * rng.randint(1024, 64 * 1024))
+
+
+def run_once(input_folder, output_folder, workers, file_type, recursive, backend_options):
+    """한 번의 일괄 변환을 실행하고 측정값 반환"""
+    sink = LogSink()
+    stop_draining = threading.Event()
+
+    def drain():
+        # 화면 갱신 루프 흉내 (100ms마다 로그를 비움)
+        while not stop_draining.wait(0.1):
+            sink.drain()
+
+    drainer = threading.Thread(target=drain, daemon=True)
+    drainer.start()
+
+    results = []
+    results_lock = threading.Lock()
+
+    def on_start(job):
+        sink.write(f"[{job['index']}] 변환 중: {job['filename']}")
+
+    def on_result(result):
+        sink.write(f"{result['filename']} {result['status']}")
+        with results_lock:
+            results.append(result)
+
+    started = time.perf_counter()
+    scanner = FolderScanner(input_folder, recursive)
+    types = ["hwp", "word"] if file_type == "all" else [file_type]
+    pipelines = [
+        threading.Thread(target=run_batch, args=(t, scanner.files(t), output_folder),
+                         kwargs=dict(workers=workers, backend="fake", backend_options=backend_options,
+                                     log=sink.write, on_start=on_start, on_result=on_result))
+        for t in types
+    ]
+    for pipeline in pipelines:
+        pipeline.start()
+    for pipeline in pipelines:
+        pipeline.join()
+    wall = time.perf_counter() - started
+
+    stop_draining.set()
+    drainer.join()
+    scanner.wait()
+
+    latencies = sorted(r["elapsed"] for r in results if r.get("elapsed") is not None)
+    failed = sum(1 for r in results if r["status"] != "done")
+    return {
+        "workers": workers,
+        "files": len(results),
+        "failed": failed,
+        "wall_seconds": wall,
+        "files_per_second": len(results) / wall if wall else None,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+    }
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="가짜 변환기 기반 일괄 변환 벤치마크")
+    parser.add_argument("--files", type=int, default=1000, help="합성 입력 파일 수 (100~100000)")
+    parser.add_argument("--workers", default="1,2,4", help="비교할 워커 수 목록 (쉼표 구분)")
+    parser.add_argument("--type", choices=["hwp", "word", "all"], default="all")
+    parser.add_argument("--subfolders", type=int, default=0, help="파일을 나눠 담을 하위 폴더 수 (재귀 스캔)")
+    parser.add_argument("--open-latency", default="lognormal:0.01:0.5", help="열기 지연 분포")
+    parser.add_argument("--save-latency", default="fixed:0.005", help="저장 지연 분포")
+    parser.add_argument("--dialog-rate", type=float, default=0.0, help="대화상자 발생 확률")
+    parser.add_argument("--dialog-latency", default="fixed:0.3", help="대화상자 처리 지연 분포")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="무작위 실패 확률")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--keep", metavar="DIR", help="합성 폴더를 지우지 않고 DIR에 생성")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    return parser
+
+
+def main(argv=None):
+    multiprocessing.freeze_support()
+    args = build_parser().parse_args(argv)
+    worker_counts = [int(w) for w in args.workers.split(",") if w.strip()]
+    backend_options = {
+        "open_latency": args.open_latency,
+        "save_latency": args.save_latency,
+        "dialog_rate": args.dialog_rate,
+        "dialog_latency": args.dialog_latency,
+        "fail_rate": args.fail_rate,
+        "fail_marker": None,
+        "seed": args.seed,
+    }
+
+    base = args.keep or tempfile.mkdtemp(prefix="to_pdf_bench_")
+    input_folder = os.path.join(base, "input")
+    try:
+        started = time.perf_counter()
+        make_synthetic_folder(input_folder, args.files, args.type, args.subfolders, args.seed)
+        setup_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        scanned = sum(1 for _ in FolderScanner(input_folder, args.subfolders > 0).files())
+        scan_seconds = time.perf_counter() - started
+
+        runs = []
+        for workers in worker_counts:
+            output_folder = os.path.join(base, f"output_{workers}")
+            runs.append(run_once(input_folder, output_folder, workers, args.type,
+                                 args.subfolders > 0, backend_options))
+            shutil.rmtree(output_folder, ignore_errors=True)
+    finally:
+        if not args.keep:
+            shutil.rmtree(base, ignore_errors=True)
+
+    baseline = runs[0]["files_per_second"] if runs else None
+    for run in runs:
+        run["speedup"] = run["files_per_second"] / baseline if baseline else None
+
+    report = {
+        "files": args.files,
+        "setup_seconds": setup_seconds,
+        "scan_seconds": scan_seconds,
+        "scanned": scanned,
+        "backend_options": backend_options,
+        "runs": runs,
+    }
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return 0
+
+    print(f"파일 {args.files}개, 스캔 {scan_seconds:.3f}초 ({scanned}개)")
+    print(f"{'workers':>7} {'files/s':>9} {'speedup':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'failed':>7}")
+    for run in runs:
+        print(f"{run['workers']:>7} {run['files_per_second']:>9.1f} {run['speedup']:>8.2f} "
+              f"{run['p50'] or 0:>8.4f} {run['p95'] or 0:>8.4f} {run['p99'] or 0:>8.4f} {run['failed']:>7}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,40 +1,80 @@
 # build_exe.py - 실행파일 생성 스크립트
+#
+# 기본은 폴더형(onedir) 빌드: 실행할 때마다 임시 폴더에 압축을 풀지 않아 창이 빨리 뜬다.
+# 파일 하나로 배포해야 하면 --onefile (실행할 때마다 압축을 풀어 시작이 느림)
+# 창 프로그램과 함께 콘솔용 명령줄 실행파일(to_pdf_cli)도 만든다. 창 모드 실행파일은 표준출력이
+# 없어 명령줄 결과(--json 등)를 받을 수 없으므로 작업 스케줄러/배치 파일에서는 콘솔용을 쓴다.
+#   python build_exe.py
+#   python build_exe.py --onefile
 import PyInstaller.__main__
+import argparse
 import sys
 import os
 
-def build_executable():
-    """실행파일 생성"""
-    
-    # PyInstaller 옵션
-    pyinstaller_args = [
-        '--onefile',  # 단일 실행파일 생성
-        '--windowed',  # 콘솔 창 숨기기 (GUI 앱)
-        '--name=한글PDF변환기',  # 실행파일 이름
-        '--icon=icon.ico',  # 아이콘 파일 (선택사항)
-        '--add-data=icon.ico;.',
+APP_NAME = "한글PDF변환기"
+ENTRY_SCRIPT = "to_pdf.py"  # 인자가 있으면 명령줄, 없으면 창 (워커 프로세스도 이 파일로 시작)
+CLI_NAME = "to_pdf_cli"
+CLI_SCRIPT = "cli.py"
+ICON_FILE = "app_icon.ico"
+
+# 쓰지 않는 표준/외부 모듈 (묶음 크기와 시작 시 검사할 파일 수를 줄임)
+# http.server/urllib(변환 서버), xml(pypdf), email(http)은 쓰므로 제외하지 않음
+EXCLUDED_MODULES = [
+    "unittest", "doctest", "pdb", "pydoc", "pydoc_data", "test", "tkinter.test", "idlelib",
+    "lib2to3", "distutils", "setuptools", "pip", "turtle", "turtledemo", "xmlrpc", "ftplib", "ssl",
+    "numpy", "PIL", "cryptography",
+]
+
+def pyinstaller_args(name, script, windowed, onefile, clean):
+    """PyInstaller 옵션"""
+    args = [
+        '--onefile' if onefile else '--onedir',  # 단일 실행파일 또는 폴더형(시작이 빠름)
+        '--windowed' if windowed else '--console',  # 창 프로그램은 콘솔 창 숨기기
+        f'--name={name}',  # 실행파일 이름
+        f'--icon={ICON_FILE}',  # 아이콘 파일
+        f'--add-data={ICON_FILE}{os.pathsep}.',
+        '--noupx',  # 압축된 DLL은 불러올 때마다 풀어야 하므로 UPX 사용 안 함
         '--distpath=dist',  # 출력 폴더
         '--workpath=build',  # 임시 작업 폴더
-        '--clean',  # 이전 빌드 파일 정리
         '--noconfirm',  # 확인 없이 진행
-        'hwp_to_pdf_gui.py'  # 메인 파이썬 파일
     ]
-    
+    if clean:
+        args.append('--clean')  # 이전 빌드 파일 정리
+    args += [f'--exclude-module={module}' for module in EXCLUDED_MODULES]
+    args.append(script)  # 메인 파이썬 파일
+    return args
+
+def build_executable(onefile=False):
+    """실행파일 생성 (창 프로그램과 콘솔용 명령줄 프로그램)"""
+
+    # 상대 경로(아이콘, 진입점, 출력 폴더)는 이 스크립트가 있는 폴더 기준
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
     print("실행파일을 생성합니다...")
     print("이 과정은 몇 분 정도 소요될 수 있습니다.")
-    
+
     try:
-        PyInstaller.__main__.run(pyinstaller_args)
+        PyInstaller.__main__.run(pyinstaller_args(APP_NAME, ENTRY_SCRIPT, True, onefile, clean=True))
+        PyInstaller.__main__.run(pyinstaller_args(CLI_NAME, CLI_SCRIPT, False, onefile, clean=False))
         print("\n✅ 실행파일 생성 완료!")
-        print("생성된 파일: dist/한글PDF변환기.exe")
-        print("\n이 파일을 다른 PC에 복사하여 사용할 수 있습니다.")
+        if onefile:
+            print(f"생성된 파일: dist/{APP_NAME}.exe, dist/{CLI_NAME}.exe (명령줄)")
+            print("\n이 파일을 다른 PC에 복사하여 사용할 수 있습니다.")
+        else:
+            print(f"생성된 폴더: dist/{APP_NAME}/ (실행: {APP_NAME}.exe)")
+            print(f"           dist/{CLI_NAME}/ (명령줄: {CLI_NAME}.exe convert 입력폴더 출력폴더)")
+            print("\n폴더째 다른 PC에 복사하여 사용할 수 있습니다.")
         print("(파이썬이 설치되지 않은 PC에서도 실행 가능합니다)")
-        
+
     except Exception as e:
         print(f"❌ 실행파일 생성 실패: {e}")
         return False
-    
+
     return True
 
 if __name__ == "__main__":
-    build_executable()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="실행파일 생성")
+    parser.add_argument("--onefile", action="store_true",
+                        help="파일 하나로 생성 (실행할 때마다 압축을 풀어 시작이 느림)")
+    args = parser.parse_args()
+    sys.exit(0 if build_executable(onefile=args.onefile) else 1)
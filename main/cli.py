@@ -0,0 +1,426 @@
+"""명령줄 일괄 변환 (tkinter 없이 실행)
+
+창 모듈(hwpword_to_pdf.py)은 tkinter를 불러오므로 명령줄에서는 이 파일이나 to_pdf.py를 실행한다.
+
+예) python cli.py convert 입력폴더 출력폴더 --type all --workers 4 --json
+    python cli.py watch 입력폴더 출력폴더 --settle 2
+    python cli.py serve --workers 2
+    python cli.py submit 파일또는폴더 --output 출력폴더 --priority 5 --wait
+"""
+import os
+import sys
+import json
+import time
+import signal
+import argparse
+import threading
+import multiprocessing
+
+from engine import run_batch, DEFAULT_RECYCLE_DOCUMENTS, DEFAULT_RECYCLE_MEMORY_MB
+from manifest import Manifest
+from pdf_cache import PdfCache, DEFAULT_CACHE_MB
+from page_split import DEFAULT_SPLIT_PAGES
+from journal import Journal, DONE, FAILED, IN_PROGRESS, PENDING
+from leases import LeaseBoard, DEFAULT_LEASE_SECONDS
+from staging import OutputStager, is_remote_path
+from scanner import FolderScanner, iter_files
+from run_report import RunReport
+from scheduling import ORDER_POLICIES, CostModel
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_ERROR = 2
+EXIT_INTERRUPTED = 130
+
+TYPE_LABELS = {"hwp": "한글", "word": "워드"}
+
+
+class Reporter:
+    """결과 출력 (사람용 텍스트 또는 한 줄에 하나씩 JSON)"""
+
+    def __init__(self, as_json, stream=None):
+        self.as_json = as_json
+        self.stream = stream or sys.stdout
+        self._lock = threading.Lock()
+
+    def _emit(self, line, stream=None):
+        with self._lock:
+            print(line, file=stream or self.stream, flush=True)
+
+    def log(self, message):
+        # JSON 모드에서는 표준출력을 결과 전용으로 두고 로그는 표준에러로
+        self._emit(message, sys.stderr if self.as_json else None)
+
+    def event(self, event, **fields):
+        if self.as_json:
+            self._emit(json.dumps(dict(event=event, **fields), ensure_ascii=False))
+
+    def result(self, result):
+        if self.as_json:
+            self.event("result", **result)
+        elif result["status"] == "done":
+            self._emit(f"✅ {result['filename']} 변환 완료" + (" (캐시)" if result.get("cached") else ""))
+        elif result["status"] == "timeout":
+            self._emit(f"⏱️ {result['filename']} 시간 초과: {result['error']}")
+        else:
+            self._emit(f"❌ {result['filename']} 변환 실패: {result['error']}")
+
+    def skipped(self, job):
+        if self.as_json:
+            self.event("result", **dict(job, status="skipped", error=None))
+        else:
+            self._emit(f"⏭️ {job['filename']} 이미 변환됨")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="한글/워드 파일 PDF 일괄 변환")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    convert = commands.add_parser("convert", help="폴더의 파일을 PDF로 변환")
+    add_common_arguments(convert)
+    convert.add_argument("--incremental", action="store_true", help="변경된 파일만 변환")
+    add_batch_arguments(convert)
+    convert.add_argument("--resume", action="store_true", help="중단된 이전 변환을 이어서 진행 (완료된 파일은 건너뜀)")
+    convert.add_argument("--order", choices=ORDER_POLICIES, default="scan",
+                         help="처리 순서 (largest: 큰 파일 먼저, smallest: 작은 파일 먼저, cost: 과거 기록상 오래 걸릴 파일 먼저)")
+    convert.add_argument("--coordinate", action="store_true",
+                         help="같은 출력 폴더를 쓰는 다른 PC/프로세스와 파일을 나눠 변환 (공유 폴더의 임대 파일 사용)")
+    convert.add_argument("--lease-seconds", type=float, default=DEFAULT_LEASE_SECONDS,
+                         help="이 시간(초) 동안 갱신되지 않은 다른 노드의 임대는 회수")
+
+    watch = commands.add_parser("watch", help="폴더를 감시하며 새로 생기거나 바뀐 파일을 계속 변환")
+    add_common_arguments(watch)
+    add_batch_arguments(watch)
+    watch.add_argument("--settle", type=float, default=2.0, help="파일 크기/수정시각이 이 시간(초) 동안 그대로여야 변환")
+    watch.add_argument("--interval", type=float, default=5.0, help="변경 알림을 쓸 수 없을 때의 폴링 간격(초)")
+
+    serve = commands.add_parser("serve", help="여러 사용자의 변환 요청을 공용 변환기로 처리하는 로컬 서버 실행")
+    serve.add_argument("--host", default=None, help="받을 주소 (기본: 이 PC에서만)")
+    serve.add_argument("--port", type=int, default=None, help="받을 포트 (기본: 47615)")
+    serve.add_argument("--data", default=None, help="대기열, 올린 파일, 접속 토큰을 둘 폴더 (기본: 사용자 데이터 폴더)")
+    add_converter_arguments(serve)
+
+    submit = commands.add_parser("submit", help="변환 서버에 파일을 보냄")
+    submit.add_argument("paths", nargs="+", help="변환할 파일 또는 폴더")
+    submit.add_argument("--output", help="PDF를 저장할 폴더 (--upload가 아니면 필수)")
+    submit.add_argument("--priority", type=int, default=0, help="클수록 먼저 변환")
+    submit.add_argument("--upload", action="store_true",
+                        help="경로 대신 파일 내용을 보내고 변환된 PDF를 내려받음 (서버가 파일에 접근할 수 없을 때)")
+    submit.add_argument("--recursive", action="store_true", help="폴더는 하위 폴더까지 포함")
+    submit.add_argument("--wait", action="store_true", help="변환이 끝날 때까지 기다리며 결과 출력")
+    submit.add_argument("--server", default=None, help="변환 서버 주소 (기본: 이 PC의 서버)")
+    submit.add_argument("--token", default=None,
+                        help="서버 접속 토큰 (기본: TO_PDF_SERVER_TOKEN 환경 변수 또는 이 사용자의 서버 데이터 폴더)")
+    submit.add_argument("--json", action="store_true", help="작업별 결과를 JSON 줄로 출력")
+    return parser
+
+
+def add_common_arguments(parser):
+    parser.add_argument("input", help="변환할 파일이 있는 폴더")
+    parser.add_argument("output", help="PDF 파일을 저장할 폴더")
+    parser.add_argument("--type", choices=["hwp", "word", "all"], default="all", help="변환할 파일 종류")
+    parser.add_argument("--recursive", action="store_true", help="하위 폴더 포함 (출력 폴더에 구조 유지)")
+    add_converter_arguments(parser)
+
+
+def add_batch_arguments(parser):
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_MB, metavar="MB",
+                        help="같은 내용의 파일은 이전 변환 결과를 재사용하는 캐시 용량, 0이면 사용 안 함")
+    parser.add_argument("--split-pages", type=int, default=DEFAULT_SPLIT_PAGES, metavar="N",
+                        help="이보다 쪽 수가 많은 워드 문서는 구간으로 나눠 여러 워커가 동시에 변환, 0이면 나누지 않음")
+    parser.add_argument("--staging", choices=["auto", "on", "off"], default="auto",
+                        help="PDF를 로컬 임시 폴더에 만든 뒤 출력 폴더로 옮김 (auto: 출력 폴더가 네트워크 공유일 때만)")
+
+
+def add_converter_arguments(parser):
+    parser.add_argument("--workers", type=int, default=1, help="종류별 동시 변환 수")
+    parser.add_argument("--timeout", type=float, default=600, help="파일당 제한 시간(초), 0이면 제한 없음")
+    parser.add_argument("--recycle-docs", type=int, default=DEFAULT_RECYCLE_DOCUMENTS,
+                        help="변환기 하나가 이만큼 변환하면 다시 시작, 0이면 끄기")
+    parser.add_argument("--recycle-memory", type=int, default=DEFAULT_RECYCLE_MEMORY_MB, metavar="MB",
+                        help="변환기 프로세스 메모리가 이를 넘으면 다시 시작, 0이면 끄기")
+    parser.add_argument("--backend", choices=["com", "fake"], default="com", help="변환기 (fake: 테스트용)")
+    parser.add_argument("--json", action="store_true", help="파일별 결과를 JSON 줄로 출력")
+    parser.add_argument("--no-preflight", dest="preflight", action="store_false",
+                        help="변환 전 파일 헤더 검사(손상/암호/형식 불일치)를 하지 않음")
+
+
+def cmd_convert(args, reporter):
+    if not os.path.isdir(args.input):
+        reporter.log(f"❌ 입력 폴더가 존재하지 않습니다: {args.input}")
+        return EXIT_ERROR
+    if args.coordinate and (args.incremental or args.resume):
+        # 변환 기록과 상태 기록은 한 프로세스만 쓰는 파일이라 여러 노드가 함께 쓸 수 없음
+        reporter.log("❌ --coordinate는 --incremental, --resume과 함께 쓸 수 없습니다 (완료된 파일은 자동으로 건너뜀).")
+        return EXIT_ERROR
+    os.makedirs(args.output, exist_ok=True)
+
+    stop_event = threading.Event()
+    signal.signal(signal.SIGINT, lambda signum, frame: stop_event.set())
+
+    scanner = FolderScanner(args.input, args.recursive, preflight=args.preflight)
+    manifest = Manifest(args.output) if args.incremental else None
+    report = RunReport(args.output)
+    leases = None
+    journal = None
+    if args.coordinate:
+        leases = LeaseBoard(args.output, lease_seconds=args.lease_seconds, log=reporter.log)
+        reporter.log(f"🤝 분산 변환 노드 {leases.node}: 다른 노드와 파일을 나눠 변환합니다.")
+    else:
+        journal = Journal(args.output, resume=args.resume,
+                          run_info={"input": os.path.abspath(args.input), "file_type": args.type,
+                                    "recursive": args.recursive})
+    if args.resume:
+        previous = journal.counts()
+        reporter.log(f"이전 기록: 완료 {previous.get(DONE, 0)}개, 실패 {previous.get(FAILED, 0)}개, "
+                     f"중단 {previous.get(IN_PROGRESS, 0) + previous.get(PENDING, 0)}개")
+    stager = None
+    if args.staging == "on" or (args.staging == "auto" and is_remote_path(args.output)):
+        stager = OutputStager(log=reporter.log)
+        reporter.log(f"📥 PDF를 로컬 임시 폴더({stager.folder})에 만든 뒤 출력 폴더로 옮깁니다.")
+    cost_model = CostModel.default()
+    cache = PdfCache.default(args.cache_size) if args.cache_size > 0 else None
+    file_types = ["hwp", "word"] if args.type == "all" else [args.type]
+    counts = {"done": 0, "failed": 0, "skipped": 0, "cached": 0, "rejected": 0}
+    counts_lock = threading.Lock()
+    errors = []
+
+    def on_start(job):
+        reporter.log(f"[{job['index']}] 변환 중: {job['filename']}")
+
+    def on_result(result):
+        report.add(result)
+        with counts_lock:
+            counts["done" if result["status"] == "done" else "failed"] += 1
+            if result.get("cached"):
+                counts["cached"] += 1
+        reporter.result(result)
+
+    def on_skip(job):
+        with counts_lock:
+            counts["skipped"] += 1
+        reporter.skipped(job)
+
+    def run_pipeline(file_type):
+        try:
+            if not scanner.has_files(file_type):
+                return
+            reporter.log(f"{TYPE_LABELS[file_type]} 파일 변환 시작...")
+            run_batch(file_type, scanner.files(file_type), args.output, workers=args.workers,
+                      backend=args.backend, timeout=args.timeout, max_documents=args.recycle_docs,
+                      max_rss_mb=args.recycle_memory, manifest=manifest, journal=journal, leases=leases,
+                      stager=stager, cache=cache, split_pages=args.split_pages, order=args.order,
+                      cost_model=cost_model, log=reporter.log, on_start=on_start, on_result=on_result,
+                      on_skip=on_skip, on_instance=report.add_instance, should_stop=stop_event.is_set)
+        except Exception as e:
+            errors.append(e)
+            reporter.log(f"❌ {TYPE_LABELS[file_type]} 변환 중 오류 발생: {e}")
+
+    # 한글/워드는 서로 다른 프로그램이므로 동시에 변환
+    pipelines = [threading.Thread(target=run_pipeline, args=(t,), daemon=True) for t in file_types]
+    for pipeline in pipelines:
+        pipeline.start()
+    for pipeline in pipelines:
+        while pipeline.is_alive():
+            pipeline.join(timeout=0.5)
+
+    if stager is not None:
+        stager.close()
+    if journal is not None:
+        journal.close()
+    if leases is not None:
+        leases.close()
+        if leases.finished_elsewhere:
+            reporter.log(f"🤝 다른 노드가 이미 변환한 파일 {leases.finished_elsewhere}개")
+        if leases.failed_elsewhere:
+            reporter.log(f"🤝 이번 실행에서 다른 노드가 변환하지 못한 파일 {leases.failed_elsewhere}개 (다음 실행에서 다시 시도)")
+    preflight = scanner.preflight_results()
+    report.add_preflight(preflight)
+    counts["rejected"] = sum(1 for entry in preflight if entry["action"] == "rejected")
+    if manifest is not None:
+        try:
+            manifest.save()
+        except OSError as e:
+            reporter.log(f"⚠️ 변환 기록 저장 실패: {e}")
+    if cache is not None:
+        try:
+            cache.save()
+        except OSError as e:
+            reporter.log(f"⚠️ 변환 결과 캐시 저장 실패: {e}")
+    try:
+        cost_model.save()
+    except OSError as e:
+        reporter.log(f"⚠️ 변환 시간 기록 저장 실패: {e}")
+
+    if stop_event.is_set():
+        exit_code = EXIT_INTERRUPTED
+    elif errors:
+        exit_code = EXIT_ERROR
+    elif counts["failed"] or counts["rejected"]:
+        exit_code = EXIT_FAILED
+    else:
+        exit_code = EXIT_OK
+
+    report_path = None
+    if report.results or report.preflight:
+        try:
+            # 분산 변환이면 노드마다 따로 보고서를 씀
+            report_path, _ = report.write(f"to_pdf_report_{time.strftime('%Y%m%d_%H%M%S')}_{leases.node}"
+                                          if leases is not None else None)
+        except OSError as e:
+            reporter.log(f"⚠️ 변환 보고서 저장 실패: {e}")
+
+    summary = report.summary()
+    reporter.event("summary", exit_code=exit_code, report=report_path, timing=summary, **counts)
+    if not args.json:
+        reporter.log(f"전체 결과: {counts['done']}개 성공 (캐시 {counts['cached']}개), {counts['failed']}개 실패, "
+                     f"{counts['rejected']}개 제외, {counts['skipped']}개 건너뜀")
+        for line in report.format_summary(summary):
+            reporter.log(line)
+        if report_path:
+            reporter.log(f"📄 변환 보고서: {report_path}")
+    return exit_code
+
+
+def cmd_watch(args, reporter):
+    from folder_watch import FolderWatcher
+    if not os.path.isdir(args.input):
+        reporter.log(f"❌ 입력 폴더가 존재하지 않습니다: {args.input}")
+        return EXIT_ERROR
+
+    os.makedirs(args.output, exist_ok=True)
+
+    stop_event = threading.Event()
+    signal.signal(signal.SIGINT, lambda signum, frame: stop_event.set())
+
+    journal = Journal(args.output, run_info={"input": os.path.abspath(args.input), "file_type": args.type,
+                                             "recursive": args.recursive, "watch": True})
+    stager = None
+    if args.staging == "on" or (args.staging == "auto" and is_remote_path(args.output)):
+        stager = OutputStager(log=reporter.log)
+        reporter.log(f"📥 PDF를 로컬 임시 폴더({stager.folder})에 만든 뒤 출력 폴더로 옮깁니다.")
+    cache = PdfCache.default(args.cache_size) if args.cache_size > 0 else None
+    watcher = FolderWatcher(
+        args.input, args.output,
+        file_types=["hwp", "word"] if args.type == "all" else [args.type],
+        recursive=args.recursive, workers=args.workers, backend=args.backend,
+        timeout=args.timeout, max_documents=args.recycle_docs, max_rss_mb=args.recycle_memory,
+        settle_seconds=args.settle, poll_interval=args.interval, preflight=args.preflight,
+        journal=journal, stager=stager, cache=cache, split_pages=args.split_pages,
+        log=reporter.log, on_start=lambda job: reporter.log(f"변환 중: {job['filename']}"),
+        on_result=reporter.result, on_skip=reporter.skipped)
+    try:
+        watcher.run(should_stop=stop_event.is_set)
+    finally:
+        if stager is not None:
+            stager.close()
+        journal.close()
+        if cache is not None:
+            try:
+                cache.save()
+            except OSError as e:
+                reporter.log(f"⚠️ 변환 결과 캐시 저장 실패: {e}")
+    return EXIT_OK
+
+
+def cmd_serve(args, reporter):
+    # 서버 모듈(http.server/sqlite3)은 serve/submit에서만 불러옴
+    from job_server import JobServer, DEFAULT_HOST, DEFAULT_PORT
+    stop_event = threading.Event()
+    signal.signal(signal.SIGINT, lambda signum, frame: stop_event.set())
+    port = DEFAULT_PORT if args.port is None else args.port
+    try:
+        server = JobServer(args.data, host=args.host or DEFAULT_HOST, port=port, workers=args.workers, backend=args.backend,
+                           timeout=args.timeout, max_documents=args.recycle_docs, max_rss_mb=args.recycle_memory,
+                           preflight=args.preflight, log=reporter.log)
+        server.serve_forever(should_stop=stop_event.is_set)
+    except OSError as e:
+        reporter.log(f"❌ 변환 서버를 시작하지 못했습니다: {e}")
+        return EXIT_ERROR
+    return EXIT_OK
+
+
+def _submit_paths(paths, recursive):
+    for path in paths:
+        if os.path.isdir(path):
+            yield from (item.path for item in iter_files(path, recursive))
+        else:
+            yield path
+
+
+def cmd_submit(args, reporter):
+    from job_server import JobClient, JobServerError, DEFAULT_URL
+    if not args.upload and not args.output:
+        reporter.log("❌ --output 폴더를 지정하세요 (또는 --upload).")
+        return EXIT_ERROR
+    client = JobClient(args.server or DEFAULT_URL, token=args.token)
+    stop_event = threading.Event()
+    signal.signal(signal.SIGINT, lambda signum, frame: stop_event.set())
+
+    def report(job):
+        if args.json:
+            reporter.event("job", **job)
+        elif job["status"] in ("queued", "running"):
+            reporter.log(f"📨 [{job['id']}] {job['filename']} 대기열에 추가")
+        else:
+            reporter.result(dict(job, status="failed" if job["status"] == "rejected" else job["status"]))
+
+    def finished(job):
+        if args.upload and job["status"] == "done":
+            output = os.path.join(args.output or os.path.dirname(uploads[job["id"]]),
+                                  os.path.splitext(os.path.basename(uploads[job["id"]]))[0] + ".pdf")
+            try:
+                os.makedirs(os.path.dirname(output), exist_ok=True)
+                client.download(job["id"], output)
+                job = dict(job, output=output)
+            except (OSError, JobServerError) as e:
+                job = dict(job, status="failed", error=f"PDF 내려받기 실패: {e}")
+        report(job)
+
+    try:
+        paths = list(_submit_paths(args.paths, args.recursive))
+        missing = [path for path in paths if not os.path.isfile(path)]
+        if args.upload and missing:
+            reporter.log(f"❌ 파일이 존재하지 않습니다: {', '.join(missing)}")
+            return EXIT_ERROR
+        if args.upload:
+            uploads = {}
+            jobs = []
+            for path in paths:
+                job = client.upload(path, priority=args.priority)
+                uploads[job["id"]] = path
+                jobs.append(job)
+        else:
+            jobs = client.submit(paths, args.output, priority=args.priority)
+        for job in jobs:
+            report(job)
+        if not args.wait:
+            return EXIT_OK
+        waiting = [job["id"] for job in jobs if job["status"] not in ("rejected",)]
+        results = client.wait(waiting, on_result=finished, should_stop=stop_event.is_set)
+    except (OSError, JobServerError) as e:
+        reporter.log(f"❌ 변환 서버 요청 실패 ({client.url}): {e}")
+        return EXIT_ERROR
+    if stop_event.is_set():
+        return EXIT_INTERRUPTED
+    failed = [job for job in jobs if job["status"] == "rejected"] + [job for job in results if job["status"] != "done"]
+    return EXIT_FAILED if failed else EXIT_OK
+
+
+def main(argv=None):
+    multiprocessing.freeze_support()
+    args = build_parser().parse_args(argv)
+    reporter = Reporter(args.json)
+    if args.command == "convert":
+        return cmd_convert(args, reporter)
+    if args.command == "watch":
+        return cmd_watch(args, reporter)
+    if args.command == "serve":
+        return cmd_serve(args, reporter)
+    if args.command == "submit":
+        return cmd_submit(args, reporter)
+    return EXIT_ERROR
+
+
+if __name__ == "__main__":
+    sys.exit(main())
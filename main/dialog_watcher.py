@@ -0,0 +1,200 @@
+import time
+import threading
+
+DIALOG_TITLES = ("경고", "알림", "Warning", "Alert", "한글")
+
+EVENT_OBJECT_SHOW = 0x8002
+OBJID_WINDOW = 0
+WINEVENT_OUTOFCONTEXT = 0x0000
+WINEVENT_SKIPOWNTHREAD = 0x0001
+WM_QUIT = 0x0012
+
+# 대화상자를 찾은 뒤 키 입력 전 대기 시간
+SETTLE_DELAY = 0.05
+# 키를 보낸 뒤 대화상자가 닫히길 기다리는 최대 시간과 확인 간격
+CLOSE_TIMEOUT = 1.0
+CLOSE_CHECK_INTERVAL = 0.02
+# 훅을 쓸 수 없을 때의 폴링 간격 (파일 변환 중에만 폴링)
+POLL_INTERVAL = 0.05
+MAX_POLL_INTERVAL = 0.3
+
+
+class DialogWatcher:
+    """배치 전체에서 하나만 실행되는 권한 대화상자 감시 서비스
+
+    가능하면 SetWinEventHook으로 창 표시 이벤트를 받아 처리하고,
+    훅을 설치할 수 없으면 파일 변환 중에만 간격을 늘려가며 폴링한다.
+    파일별로 대화상자 처리에 쓴 시간을 end_file()로 돌려준다.
+    """
+
+    def __init__(self, titles=DIALOG_TITLES, owner_pid=None, log=None):
+        self.titles = tuple(titles)
+        self.owner_pid = owner_pid
+        self.log = log or (lambda message: None)
+        self.mode = None
+
+        self._lock = threading.Lock()
+        self._active = threading.Event()
+        self._stop = threading.Event()
+        self._ready = threading.Event()
+        self._thread = None
+        self._thread_id = None
+        self._dialog_time = 0.0
+        self._dialog_count = 0
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="dialog-watcher")
+        self._thread.daemon = True
+        self._thread.start()
+        self._ready.wait(timeout=2)
+
+    def stop(self):
+        self._stop.set()
+        self._active.set()
+        if self.mode == "hook" and self._thread_id:
+            try:
+                import ctypes
+                ctypes.windll.user32.PostThreadMessageW(self._thread_id, WM_QUIT, 0, 0)
+            except Exception:
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def begin_file(self):
+        with self._lock:
+            self._dialog_time = 0.0
+            self._dialog_count = 0
+        self._active.set()
+
+    def end_file(self):
+        """파일 변환 종료. (대화상자 처리 시간, 처리한 대화상자 수) 반환"""
+        self._active.clear()
+        with self._lock:
+            return self._dialog_time, self._dialog_count
+
+    def check_now(self):
+        """남아 있는 대화상자를 즉시 한 번 확인
+
+        대화상자가 없으면 기다리지 않고 False, 있으면 키를 보내고 창이 닫힐 때까지
+        (최대 CLOSE_TIMEOUT초) 기다린 뒤 True를 돌려준다.
+        """
+        hwnd = self._dismiss_any()
+        if not hwnd:
+            return False
+        self._wait_closed(hwnd)
+        return True
+
+    @staticmethod
+    def _wait_closed(hwnd, timeout=CLOSE_TIMEOUT):
+        try:
+            import win32gui
+        except ImportError:
+            return
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            if not win32gui.IsWindow(hwnd) or not win32gui.IsWindowVisible(hwnd):
+                return
+            time.sleep(CLOSE_CHECK_INTERVAL)
+
+    def _record(self, seconds):
+        with self._lock:
+            self._dialog_time += seconds
+            self._dialog_count += 1
+
+    def _owned(self, hwnd):
+        if self.owner_pid is None:
+            return True
+        try:
+            import win32process
+            return win32process.GetWindowThreadProcessId(hwnd)[1] == self.owner_pid
+        except Exception:
+            return True
+
+    def _dismiss(self, hwnd, seen_at):
+        """대화상자에 N키(모두 허용)를 보내 닫음"""
+        try:
+            import win32gui
+            import win32con
+            win32gui.SetForegroundWindow(hwnd)
+            time.sleep(SETTLE_DELAY)
+            win32gui.SendMessage(hwnd, win32con.WM_KEYDOWN, ord('N'), 0)
+            win32gui.SendMessage(hwnd, win32con.WM_KEYUP, ord('N'), 0)
+        except Exception:
+            return False
+        self._record(time.perf_counter() - seen_at)
+        return True
+
+    def _dismiss_any(self):
+        """보이는 대화상자 하나를 닫고 그 창 핸들 반환 (없거나 실패하면 None)"""
+        try:
+            import win32gui
+        except ImportError:
+            return None
+        for title in self.titles:
+            hwnd = win32gui.FindWindow(None, title)
+            if hwnd and self._owned(hwnd):
+                return hwnd if self._dismiss(hwnd, time.perf_counter()) else None
+        return None
+
+    def _run(self):
+        try:
+            self._run_hook()
+        except Exception as e:
+            self.log(f"대화상자 이벤트 훅을 사용할 수 없어 폴링으로 감시합니다: {e}")
+            self._run_poll()
+
+    def _run_hook(self):
+        import ctypes
+        from ctypes import wintypes
+
+        user32 = ctypes.windll.user32
+        kernel32 = ctypes.windll.kernel32
+        WinEventProc = ctypes.WINFUNCTYPE(
+            None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+            wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD)
+
+        buffer = ctypes.create_unicode_buffer(256)
+
+        def callback(hook, event, hwnd, id_object, id_child, thread_id, event_time):
+            if id_object != OBJID_WINDOW or not hwnd or not self._active.is_set():
+                return
+            seen_at = time.perf_counter()
+            user32.GetWindowTextW(hwnd, buffer, 256)
+            if buffer.value in self.titles and self._owned(hwnd):
+                self._dismiss(hwnd, seen_at)
+
+        proc = WinEventProc(callback)
+        # 변환기 프로세스를 알면 그 프로세스의 창 이벤트만 받음 (다른 프로그램 창마다 깨어나지 않음)
+        hook = user32.SetWinEventHook(
+            EVENT_OBJECT_SHOW, EVENT_OBJECT_SHOW, 0, proc, self.owner_pid or 0, 0,
+            WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNTHREAD)
+        if not hook:
+            raise OSError("SetWinEventHook 실패")
+
+        self.mode = "hook"
+        self._thread_id = kernel32.GetCurrentThreadId()
+        self._ready.set()
+        try:
+            msg = wintypes.MSG()
+            while not self._stop.is_set() and user32.GetMessageW(ctypes.byref(msg), 0, 0, 0) > 0:
+                user32.TranslateMessage(ctypes.byref(msg))
+                user32.DispatchMessageW(ctypes.byref(msg))
+        finally:
+            user32.UnhookWinEvent(hook)
+
+    def _run_poll(self):
+        self.mode = "poll"
+        self._ready.set()
+        while not self._stop.is_set():
+            # 변환 중인 파일이 없으면 대기만 함
+            self._active.wait()
+            interval = POLL_INTERVAL
+            while self._active.is_set() and not self._stop.is_set():
+                if self._dismiss_any():
+                    interval = POLL_INTERVAL
+                else:
+                    interval = min(interval * 2, MAX_POLL_INTERVAL)
+                self._stop.wait(interval)
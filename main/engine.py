@@ -0,0 +1,756 @@
+import os
+import time
+import queue
+import signal
+import itertools
+import multiprocessing
+
+from backends import create_backend, converter_version, process_rss, HWP_EXTENSIONS, WORD_EXTENSIONS
+from journal import IN_PROGRESS
+from page_split import estimate_pages, plan_chunks, chunk_jobs, fits_in_merge, merge_available, merge_pdfs
+from scheduling import ORDER_LABELS, order_jobs, estimate_seconds, format_duration
+
+# 오래 켜 둔 한글/워드는 문서를 열고 닫을수록 메모리가 늘어나므로 이 기준을 넘으면 다시 시작
+DEFAULT_RECYCLE_DOCUMENTS = 500
+DEFAULT_RECYCLE_MEMORY_MB = 1024
+
+# 작업 대신 큐에 넣는 상태 확인 요청 (워커는 변환기가 응답하는지 확인해 "pong"으로 답함)
+PING = "ping"
+
+# 같은 폴더에 이름이 같은 원본이 여럿이면 이 순서에서 처음 것이 확장자 없는 PDF 이름을 가짐
+CONVERTIBLE_EXTENSIONS = HWP_EXTENSIONS + WORD_EXTENSIONS
+
+
+def stem_index(folder):
+    """폴더의 변환 대상 파일을 확장자를 뺀 이름별로 모은 색인 {이름: [(확장자 순서, 파일 이름)]}"""
+    index = {}
+    try:
+        names = os.listdir(folder or ".")
+    except OSError:
+        names = []
+    for name in names:
+        stem, ext = os.path.splitext(name)
+        if ext.lower() in CONVERTIBLE_EXTENSIONS:
+            index.setdefault(os.path.normcase(stem), []).append((CONVERTIBLE_EXTENSIONS.index(ext.lower()), name))
+    for entries in index.values():
+        entries.sort()
+    return index
+
+
+def output_name(source, index=None):
+    """원본의 PDF 파일 이름
+
+    같은 폴더에 확장자만 다른 원본(a.hwp와 a.docx 등)이 있으면 CONVERTIBLE_EXTENSIONS 순서에서
+    처음 파일만 "a.pdf", 나머지는 "a (docx).pdf"가 된다. 폴더 내용만으로 정하므로 어떤 종류를
+    먼저 또는 따로 변환하든, 로컬 임시 저장이나 분산 변환을 쓰든 같은 원본은 항상 같은 이름이다.
+    index는 원본 폴더의 stem_index 결과 (없으면 폴더를 읽음).
+    """
+    folder, filename = os.path.split(source)
+    stem, ext = os.path.splitext(filename)
+    if index is None:
+        index = stem_index(folder)
+    entries = index.get(os.path.normcase(stem))
+    if not entries or os.path.normcase(entries[0][1]) == os.path.normcase(filename):
+        return f"{stem}.pdf"
+    return f"{stem} ({ext.lstrip('.').lower()}).pdf"
+
+
+def make_job(source, output_folder, relpath=None, index=None):
+    """입력 파일 하나에 대한 변환 작업 생성 (relpath가 있으면 하위 폴더 구조 유지)"""
+    filename = os.path.basename(source)
+    subfolder = os.path.dirname(relpath) if relpath else ""
+    return {
+        "source": os.path.abspath(source),
+        "output": os.path.abspath(os.path.join(output_folder, subfolder, output_name(source, index))),
+        "filename": relpath or filename,
+    }
+
+
+def iter_jobs(files, output_folder):
+    """경로 또는 스캔 결과(relpath 포함)를 변환 작업으로 변환"""
+    # 스캔 결과는 폴더별로 이어서 나오므로 마지막 폴더의 색인만 유지
+    folder, index = None, None
+    for f in files:
+        path, relpath = (f, None) if isinstance(f, str) else (f.path, f.relpath)
+        if os.path.dirname(path) != folder:
+            folder = os.path.dirname(path)
+            index = stem_index(folder)
+        yield make_job(path, output_folder, relpath, index)
+
+
+def _instance_memory(backend, app_pid):
+    """변환기 인스턴스(한글/워드 프로세스)의 메모리 사용량 (바이트, 모르면 None)"""
+    if hasattr(backend, "memory_usage"):
+        return backend.memory_usage()
+    return process_rss(app_pid)
+
+
+def _wait_app_exit(app_pid, timeout=5.0):
+    """종료한 한글/워드 프로세스가 남아 있으면 기다렸다가 강제 종료"""
+    if not app_pid:
+        return
+    deadline = time.monotonic() + timeout
+    while process_rss(app_pid) is not None:
+        if time.monotonic() > deadline:
+            try:
+                os.kill(app_pid, signal.SIGTERM)
+            except OSError:
+                pass
+            return
+        time.sleep(0.1)
+
+
+def _worker_main(worker_id, backend_name, file_type, backend_options, job_queue, result_queue,
+                 max_documents=None, max_rss=None):
+    """워커 프로세스: 자신의 변환기 인스턴스로 공유 큐의 작업을 처리
+
+    변환한 문서 수가 max_documents에 이르거나 변환기 프로세스 메모리가 max_rss바이트를
+    넘으면 다음 파일을 받기 전에 변환기를 종료하고 새로 띄운다. 상태 확인(PING)에
+    변환기가 응답하지 않을 때도 새로 띄운다.
+    """
+    # 콘솔의 Ctrl+C는 같은 콘솔의 워커에도 전달됨: 중지는 부모의 중지 요청(should_stop)으로만 처리
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    def log(message):
+        result_queue.put(("log", worker_id, message))
+
+    def start_backend():
+        backend = create_backend(backend_name, file_type, log=log, **backend_options)
+        started = time.perf_counter()
+        backend.start()
+        startup_time = time.perf_counter() - started
+        app_pid = backend.app_pid() if hasattr(backend, "app_pid") else None
+        return backend, app_pid, startup_time
+
+    def restart(reason, rss):
+        """변환기를 종료하고 새로 띄운 뒤 결과를 알림 (새 인스턴스 시작에 실패하면 None)"""
+        started = time.perf_counter()
+        backend.quit()
+        _wait_app_exit(app_pid)
+        quit_time = time.perf_counter() - started
+        try:
+            new_backend, new_pid, startup_time = start_backend()
+        except Exception as e:
+            result_queue.put(("fatal", worker_id, str(e)))
+            return None
+        result_queue.put(("recycled", worker_id, {
+            "reason": reason, "documents": documents, "rss_before": rss,
+            "rss_after": _instance_memory(new_backend, new_pid), "quit": quit_time,
+            "startup": startup_time, "app_pid": new_pid}))
+        return new_backend, new_pid
+
+    try:
+        backend, app_pid, startup_time = start_backend()
+    except Exception as e:
+        result_queue.put(("fatal", worker_id, str(e)))
+        return
+    result_queue.put(("ready", worker_id, {"app_pid": app_pid, "startup": startup_time}))
+    documents = 0
+
+    try:
+        while True:
+            job = job_queue.get()
+            if job is None:
+                break
+            if job == PING:
+                alive = backend.is_alive() if hasattr(backend, "is_alive") else True
+                if not alive:
+                    restarted = restart("응답 없음", None)
+                    if restarted is None:
+                        return
+                    backend, app_pid = restarted
+                    documents = 0
+                result_queue.put(("pong", worker_id, alive))
+                continue
+            result_queue.put(("started", worker_id, job))
+            started = time.perf_counter()
+            result = dict(job)
+            try:
+                result["input_size"] = os.path.getsize(job["source"])
+                os.makedirs(os.path.dirname(job["output"]), exist_ok=True)
+                if "page_from" in job:
+                    stats = backend.convert_range(job["source"], job["output"], job["page_from"],
+                                                  job["page_to"], last=job["last"])
+                else:
+                    stats = backend.convert(job["source"], job["output"])
+                result.update(stats or {})
+                # 문서가 예상보다 짧으면 뒤쪽 구간은 내보낼 쪽이 없음
+                result["output_size"] = os.path.getsize(job["output"]) if result.get("pages", 1) else 0
+                result["status"] = "done"
+                result["error"] = None
+            except Exception as e:
+                result["status"] = "failed"
+                result["error"] = str(e)
+            result["elapsed"] = time.perf_counter() - started
+            result["worker"] = worker_id
+            documents += 1
+            rss = _instance_memory(backend, app_pid)
+            result["instance_rss"] = rss
+            result_queue.put(("result", worker_id, result))
+
+            if max_documents and documents >= max_documents:
+                reason = f"문서 {documents}개 변환"
+            elif max_rss and rss and rss >= max_rss:
+                reason = "메모리 기준 초과"
+            else:
+                continue
+            # 다음 파일을 받기 전에 변환기를 깨끗하게 다시 시작
+            restarted = restart(reason, rss)
+            if restarted is None:
+                return
+            backend, app_pid = restarted
+            documents = 0
+    finally:
+        started = time.perf_counter()
+        backend.quit()
+        result_queue.put(("stopped", worker_id, {"quit": time.perf_counter() - started}))
+
+
+class ConversionPool:
+    """변환기 인스턴스를 하나씩 가진 워커 프로세스 N개와 공유 작업 큐
+
+    timeout(초)을 주면 한 파일이 그 시간을 넘길 때 해당 워커와 변환 프로그램을
+    강제 종료하고, 파일을 시간 초과로 처리한 뒤 새 워커로 교체한다.
+    max_documents(문서 수)나 max_rss_mb(변환기 프로세스 메모리)를 넘긴 인스턴스는
+    파일 사이에 다시 시작한다.
+    """
+
+    def __init__(self, file_type, workers=1, backend="com", backend_options=None, log=None, timeout=None,
+                 max_documents=None, max_rss_mb=None, on_instance=None):
+        self.file_type = file_type
+        self.workers = max(1, int(workers))
+        self.backend = backend
+        self.backend_options = backend_options or {}
+        self.log = log or (lambda message: None)
+        self.timeout = timeout or None
+        self.max_documents = max_documents or None
+        self.max_rss = max_rss_mb * 1024 * 1024 if max_rss_mb else None
+        self.on_instance = on_instance
+
+        self._context = multiprocessing.get_context()
+        self._job_queue = None
+        self._result_queue = None
+        self._processes = {}
+        self._current = {}
+        self._started_at = {}
+        self._app_pids = {}
+        self._instance_stats = {}
+        self._next_worker_id = 1
+        self._started = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def start(self):
+        if self._started:
+            return
+        self._job_queue = self._context.Queue()
+        self._result_queue = self._context.Queue()
+        for _ in range(self.workers):
+            self._spawn()
+        self._started = True
+
+    def _spawn(self):
+        worker_id = self._next_worker_id
+        self._next_worker_id += 1
+        process = self._context.Process(
+            target=_worker_main,
+            args=(worker_id, self.backend, self.file_type, self.backend_options,
+                  self._job_queue, self._result_queue, self.max_documents, self.max_rss),
+            daemon=True,
+        )
+        process.start()
+        self._processes[worker_id] = process
+        self._current[worker_id] = None
+        return worker_id
+
+    def _alive_workers(self):
+        return [wid for wid, p in self._processes.items() if p.is_alive()]
+
+    def _kill_app(self, worker_id):
+        """워커가 띄운 한글/워드 프로세스 강제 종료"""
+        pid = self._app_pids.pop(worker_id, None)
+        if not pid:
+            return
+        try:
+            os.kill(pid, signal.SIGTERM)  # Windows에서는 TerminateProcess
+        except OSError:
+            pass
+
+    def _replace_worker(self, worker_id):
+        """멈췄거나 죽은 워커를 정리하고 새 워커로 교체 (이전 워커의 메시지는 무시됨)"""
+        process = self._processes.pop(worker_id)
+        self._current.pop(worker_id, None)
+        stats = self._instance_stats.pop(worker_id, None)
+        if stats and self.on_instance:
+            self.on_instance(stats)
+        self._started_at.pop(worker_id, None)
+        self._kill_app(worker_id)
+        if process.is_alive():
+            process.terminate()
+        process.join(timeout=5)
+        new_id = self._spawn()
+        self.log(f"🔄 멈춘 워커 {worker_id} 종료, 새 변환기 인스턴스 시작 (워커 {new_id})")
+
+    def _recycled(self, worker_id, payload):
+        """워커가 변환기를 다시 시작함: 이전 인스턴스 기록을 마감하고 새 인스턴스 기록 시작"""
+        if payload.get("app_pid"):
+            self._app_pids[worker_id] = payload["app_pid"]
+        else:
+            self._app_pids.pop(worker_id, None)
+        before, after = payload.get("rss_before"), payload.get("rss_after")
+        stats = self._instance_stats.get(worker_id)
+        if stats is not None:
+            stats.update(quit=payload["quit"], documents=payload["documents"], recycle_reason=payload["reason"],
+                         rss_before=before, rss_after=after)
+            if self.on_instance:
+                self.on_instance(stats)
+        self._instance_stats[worker_id] = {"file_type": self.file_type, "worker": worker_id,
+                                           "startup": payload["startup"], "quit": None}
+        memory = ""
+        if before is not None and after is not None:
+            memory = (f", 메모리 {before / 1048576:.0f}MB → {after / 1048576:.0f}MB"
+                      f" ({(before - after) / 1048576:.0f}MB 회수)")
+        self.log(f"♻️ 워커 {worker_id} 변환기 재시작 ({payload['reason']}{memory}, "
+                 f"{payload['quit'] + payload['startup']:.1f}초)")
+
+    def _drain_job_queue(self):
+        """아직 시작되지 않은 작업을 큐에서 회수"""
+        drained = []
+        while True:
+            try:
+                job = self._job_queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(job, dict):
+                drained.append(job)
+        return drained
+
+    def _handle_status(self, kind, worker_id, payload):
+        """작업 결과가 아닌 워커 상태 메시지 처리"""
+        if kind == "log":
+            self.log(payload)
+        elif kind == "fatal":
+            self.log(f"❌ 워커 {worker_id} 시작 실패: {payload}")
+        elif kind == "ready":
+            if payload.get("app_pid"):
+                self._app_pids[worker_id] = payload["app_pid"]
+            self._instance_stats[worker_id] = {"file_type": self.file_type, "worker": worker_id,
+                                               "startup": payload.get("startup"), "quit": None}
+        elif kind == "recycled":
+            self._recycled(worker_id, payload)
+
+    def health_check(self, timeout=60):
+        """작업이 없을 때 각 변환기가 응답하는지 확인 (응답하지 않는 변환기는 워커가 다시 띄움)
+
+        죽은 워커는 새로 띄우고, 모든 워커가 timeout초 안에 답하면 True를 반환한다.
+        """
+        self.start()
+        for worker_id in list(self._processes):
+            if not self._processes[worker_id].is_alive():
+                self.log(f"❌ 워커 {worker_id}가 비정상 종료되었습니다.")
+                self._replace_worker(worker_id)
+        for _ in self._processes:
+            self._job_queue.put(PING)
+        answered = 0
+        deadline = time.monotonic() + timeout
+        while answered < len(self._processes) and time.monotonic() < deadline:
+            try:
+                kind, worker_id, payload = self._result_queue.get(timeout=0.2)
+            except queue.Empty:
+                if not self._alive_workers():
+                    break
+                continue
+            if worker_id not in self._processes:
+                continue
+            if kind == "pong":
+                answered += 1
+            else:
+                self._handle_status(kind, worker_id, payload)
+        if answered < len(self._processes):
+            # 답하지 못한 워커가 나중에 받을 상태 확인 요청 회수
+            self._drain_job_queue()
+            return False
+        return True
+
+    def run(self, jobs, on_start=None, on_result=None, should_stop=None):
+        """작업을 워커에 분배하고 완료된 결과를 순서대로 콜백/리스트로 반환"""
+        self.start()
+        should_stop = should_stop or (lambda: False)
+        jobs = iter(jobs)
+        results = []
+        pending = 0
+        submitted = 0
+        exhausted = False
+
+        def finish(result):
+            results.append(result)
+            if on_result:
+                on_result(result)
+
+        def check_workers():
+            """시간 초과 또는 비정상 종료된 워커 처리 (처리한 작업 수 반환)"""
+            handled = 0
+            now = time.monotonic()
+            for worker_id in list(self._processes):
+                job = self._current.get(worker_id)
+                if job is None:
+                    continue
+                if not self._processes[worker_id].is_alive():
+                    self.log(f"❌ 워커 {worker_id}가 비정상 종료되었습니다.")
+                    self._replace_worker(worker_id)
+                    finish(dict(job, status="failed", error="워커 프로세스가 비정상 종료되었습니다.",
+                                elapsed=None, worker=worker_id))
+                    handled += 1
+                elif self.timeout and now - self._started_at[worker_id] > self.timeout:
+                    elapsed = now - self._started_at[worker_id]
+                    self.log(f"⏱️ {job['filename']} 변환이 {self.timeout:g}초를 넘겨 강제 종료합니다.")
+                    self._replace_worker(worker_id)
+                    finish(dict(job, status="timeout", error=f"제한 시간 {self.timeout:g}초 초과",
+                                elapsed=elapsed, worker=worker_id))
+                    handled += 1
+            return handled
+
+        while True:
+            stopping = should_stop()
+            while not exhausted and not stopping and pending < self.workers:
+                job = next(jobs, None)
+                if job is None:
+                    exhausted = True
+                    break
+                submitted += 1
+                job["index"] = submitted
+                self._job_queue.put(job)
+                pending += 1
+
+            if stopping:
+                pending -= len(self._drain_job_queue())
+            if pending <= 0 and (exhausted or stopping):
+                break
+
+            pending -= check_workers()
+
+            try:
+                kind, worker_id, payload = self._result_queue.get(timeout=0.2)
+            except queue.Empty:
+                if not self._alive_workers():
+                    self.log("❌ 사용 가능한 변환기 인스턴스가 없습니다.")
+                    self._drain_job_queue()
+                    break
+                continue
+
+            if worker_id not in self._processes:
+                # 이미 교체된 워커가 남긴 메시지
+                continue
+            if kind == "started":
+                self._current[worker_id] = payload
+                self._started_at[worker_id] = time.monotonic()
+                if on_start:
+                    on_start(payload)
+            elif kind == "result":
+                self._current[worker_id] = None
+                self._started_at.pop(worker_id, None)
+                pending -= 1
+                finish(payload)
+            else:
+                self._handle_status(kind, worker_id, payload)
+
+        return results
+
+    def close(self):
+        if not self._started:
+            return
+        for _ in self._processes:
+            self._job_queue.put(None)
+        deadline = time.monotonic() + 10
+        for worker_id, process in self._processes.items():
+            process.join(timeout=max(0.1, deadline - time.monotonic()))
+            if process.is_alive():
+                process.terminate()
+                process.join(timeout=1)
+                self._kill_app(worker_id)
+        # 종료 중 남은 로그, 마지막 파일 뒤의 재시작 기록과 인스턴스 종료 시간 전달
+        while True:
+            try:
+                kind, worker_id, payload = self._result_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "log":
+                self.log(payload)
+            elif kind == "recycled" and worker_id in self._processes:
+                self._recycled(worker_id, payload)
+            elif kind == "stopped" and worker_id in self._instance_stats:
+                self._instance_stats[worker_id]["quit"] = payload.get("quit")
+        if self.on_instance:
+            for stats in self._instance_stats.values():
+                self.on_instance(stats)
+        self._instance_stats.clear()
+        self._processes.clear()
+        self._current.clear()
+        self._started_at.clear()
+        self._app_pids.clear()
+        self._started = False
+
+
+def _serve_from_cache(jobs, cache, version, on_hit, deferred, log):
+    """캐시에 결과가 있는 작업은 바로 내보내고 나머지만 전달
+
+    같은 내용의 파일이 이미 변환 중이면 그 결과를 기다렸다 쓰도록 deferred에 모은다.
+    """
+    in_flight = set()
+    for job in jobs:
+        started = time.perf_counter()
+        try:
+            job["cache_key"] = cache.key(job["source"], version)
+            hit = cache.fetch(job["cache_key"], job["output"])
+        except OSError as e:
+            log(f"⚠️ {job['filename']} 캐시 확인 실패: {e}")
+            yield job
+            continue
+        if hit:
+            on_hit(job, started)
+        elif job["cache_key"] in in_flight:
+            deferred.append(job)
+        else:
+            in_flight.add(job["cache_key"])
+            yield job
+
+
+def _split_large(jobs, split_pages, workers, log):
+    """쪽 수가 split_pages를 넘는 문서는 워커 수만큼의 쪽 구간 작업으로 나눔"""
+    for job in jobs:
+        pages = estimate_pages(job["source"])
+        if not pages or pages <= split_pages:
+            yield job
+            continue
+        chunks = plan_chunks(pages, workers)
+        if len(chunks) < 2:
+            yield job
+            continue
+        if not fits_in_merge(job["source"], pages):
+            log(f"⚠️ {job['filename']} ({pages}쪽)은 합칠 때 메모리가 너무 많이 필요해 나누지 않고 변환합니다.")
+            yield job
+            continue
+        log(f"📑 {job['filename']} ({pages}쪽)을 {len(chunks)}개 구간으로 나눠 동시에 변환합니다.")
+        yield from chunk_jobs(job, chunks)
+
+
+def _merge_chunks(parent, parts, started):
+    """구간별 결과를 합쳐 원래 작업 하나의 결과로 만들고 구간 PDF 삭제"""
+    result = dict(parent, worker=None, chunks=len(parts), elapsed=time.perf_counter() - started)
+    timings = {}
+    for part in parts:
+        for stage, seconds in (part.get("timings") or {}).items():
+            timings[stage] = timings.get(stage, 0.0) + seconds
+    result["timings"] = timings
+    failed = [part for part in parts if part["status"] != "done"]
+    try:
+        if failed:
+            result["status"] = failed[0]["status"]
+            result["error"] = f"{failed[0]['filename']}: {failed[0]['error']}"
+            return result
+        try:
+            result["pages"] = merge_pdfs([part["output"] for part in parts if part.get("pages")], parent["output"])
+            result["input_size"] = os.path.getsize(parent["source"])
+            result["output_size"] = os.path.getsize(parent["output"])
+            result["status"] = "done"
+            result["error"] = None
+        except Exception as e:
+            result["status"] = "failed"
+            result["error"] = f"PDF 합치기 실패: {e}"
+        return result
+    finally:
+        for part in parts:
+            _remove_quietly(part["output"])
+
+
+def _final(job):
+    """출력 폴더에 놓일 최종 경로 기준의 작업 (로컬 임시 저장 중이면 final_output)"""
+    return dict(job, output=job["final_output"]) if "final_output" in job else job
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def run_batch(file_type, files, output_folder, workers=1, backend="com", backend_options=None,
+              timeout=None, max_documents=None, max_rss_mb=None, manifest=None, journal=None, leases=None,
+              stager=None, cache=None, split_pages=None, order="scan", cost_model=None, session=None, log=None,
+              on_start=None, on_result=None, on_skip=None, on_instance=None, should_stop=None):
+    """파일들을 워커 풀로 변환하고 결과 목록 반환 (GUI/CLI 공용)
+
+    manifest가 있으면 변경되지 않은 파일은 on_skip으로 넘기고 건너뛰며,
+    변환할 파일이 없으면 변환기 인스턴스를 띄우지 않는다.
+    journal이 있으면 파일별 상태(대기/진행 중/완료/실패)를 기록하고,
+    이어서 변환 중이면 이미 완료된 파일을 건너뛴다.
+    leases(LeaseBoard)가 있으면 같은 출력 폴더를 쓰는 다른 PC/프로세스와 파일을 나눠,
+    임대를 잡은 파일만 변환하고 다른 쪽이 끝내지 못하고 죽은 파일은 회수해 변환한다.
+    stager(OutputStager)가 있으면 변환기는 로컬 임시 폴더에 쓰고, 완성된 PDF를 출력 폴더로
+    옮긴 뒤에 결과를 기록/전달한다 (반환하기 전에 이동이 모두 끝남).
+    cache가 있으면 같은 내용을 이미 변환한 적 있는 파일은 캐시의 PDF로 바로 완료 처리한다.
+    split_pages를 주면 그보다 쪽 수가 많은 워드 문서를 쪽 구간으로 나눠 여러 워커가
+    동시에 내보낸 뒤 하나의 PDF로 합친다 (pypdf 필요, 워커가 2개 이상일 때만).
+    order가 "scan"이 아니면 파일 목록을 모두 모아 정렬하고 예상 소요 시간을 알린다.
+    max_documents/max_rss_mb는 변환기 재시작 기준이다 (ConversionPool 참고).
+    session(InstanceSession)이 있으면 변환기를 새로 띄우지 않고 켜 둔 인스턴스를 빌려 쓴다.
+    """
+    log = log or (lambda message: None)
+    cached_results = []
+    merged_results = []
+    deferred = []
+    chunk_state = {}
+    # 진행 표시용 원본 문서 번호 (구간으로 나눈 문서는 모든 구간이 같은 번호)
+    document_numbers = itertools.count(1)
+
+    def start(job):
+        if "chunk" in job:
+            state = chunk_state.setdefault(job["parent"]["output"], {"started": time.perf_counter(), "parts": {}})
+            if "index" not in state:
+                state["index"] = next(document_numbers)
+                if journal is not None:
+                    journal.mark(_final(job["parent"]), IN_PROGRESS)
+            job["index"] = state["index"]
+        else:
+            job["index"] = next(document_numbers)
+            if journal is not None:
+                journal.mark(_final(job), IN_PROGRESS)
+        if on_start:
+            on_start(job)
+
+    def finish(result, local_pdf=None):
+        result["file_type"] = file_type
+        if journal is not None:
+            journal.mark_result(result)
+        if leases is not None:
+            leases.complete(result)
+        if result["status"] == "done" and manifest is not None:
+            try:
+                manifest.record(result["source"], result["output"])
+            except OSError as e:
+                log(f"⚠️ {result['filename']} 변환 기록 실패: {e}")
+        if result["status"] == "done" and cache is not None and result.get("cache_key") and not result.get("cached"):
+            try:
+                cache.store(result["cache_key"], local_pdf or result["output"])
+            except OSError as e:
+                log(f"⚠️ {result['filename']} 캐시 저장 실패: {e}")
+        if on_result:
+            on_result(result)
+
+    def finish_chunk(result):
+        parent = result["parent"]
+        state = chunk_state.setdefault(parent["output"], {"started": time.perf_counter(), "parts": {}})
+        state["parts"][result["chunk"]] = result
+        if len(state["parts"]) < result["chunks"]:
+            return
+        del chunk_state[parent["output"]]
+        merged = _merge_chunks(parent, [state["parts"][i] for i in range(result["chunks"])], state["started"])
+        merged_results.append(merged)
+        complete(merged)
+
+    def complete(result):
+        if "final_output" not in result:
+            finish(result)
+        elif result["status"] == "done":
+            # 출력 폴더로 옮긴 뒤 이동 스레드에서 기록
+            stager.deliver(result, finish)
+        else:
+            stager.discard(result)
+            finish(result)
+
+    def dispatch(result):
+        if "chunk" in result:
+            finish_chunk(result)
+        else:
+            complete(result)
+
+    def finish_cached(job, started):
+        result = dict(job, status="done", error=None, cached=True, worker=None)
+        try:
+            result["input_size"] = os.path.getsize(job["source"])
+            result["output_size"] = os.path.getsize(job["output"])
+        except OSError:
+            pass
+        result["elapsed"] = time.perf_counter() - started
+        cached_results.append(result)
+        complete(result)
+
+    jobs = iter_jobs(files, output_folder)
+    if manifest is not None:
+        jobs = manifest.iter_changed(jobs, on_skip=on_skip)
+    if journal is not None:
+        jobs = journal.track(jobs, on_skip=on_skip)
+    if stager is not None:
+        jobs = stager.stage(jobs)
+    if cache is not None:
+        jobs = _serve_from_cache(jobs, cache, converter_version(backend, file_type), finish_cached, deferred, log)
+    if split_pages and file_type == "word" and workers > 1:
+        if merge_available():
+            jobs = _split_large(jobs, split_pages, workers, log)
+        else:
+            log("⚠️ pypdf가 설치되어 있지 않아 큰 문서를 나누지 않고 변환합니다.")
+
+    if order != "scan":
+        jobs = order_jobs(jobs, order, cost_model)
+        if jobs:
+            eta = estimate_seconds(jobs, workers, cost_model)
+            finish_at = time.strftime("%H:%M", time.localtime(time.time() + eta))
+            log(f"📋 {ORDER_LABELS[order]} 순서로 {len(jobs)}개 파일을 변환합니다. "
+                f"예상 소요 시간: 약 {format_duration(eta)} (완료 예정 {finish_at})")
+        jobs = iter(jobs)
+    if leases is not None:
+        # 워커가 다음 작업을 받을 때 임대를 잡도록 맨 마지막 단계에 둠
+        jobs = leases.claim(jobs, on_skip=on_skip)
+
+    first_job = next(jobs, None)
+    if first_job is None and not (leases is not None and leases.waiting):
+        if stager is not None:
+            stager.flush()
+        return cached_results
+    if first_job is not None:
+        jobs = itertools.chain([first_job], jobs)
+
+    pool_options = dict(workers=workers, backend=backend, backend_options=backend_options, log=log, timeout=timeout,
+                        max_documents=max_documents, max_rss_mb=max_rss_mb, on_instance=on_instance)
+    pool_context = session.pool(file_type, **pool_options) if session else ConversionPool(file_type, **pool_options)
+    with pool_context as pool:
+        results = pool.run(jobs, on_start=start, on_result=dispatch, should_stop=should_stop)
+        # 같은 내용의 파일이 변환되길 기다린 작업: 캐시에서 꺼내고, 원본 변환이 실패했으면 직접 변환
+        # (로컬에 임시 저장하면 캐시 저장은 출력 폴더로 옮긴 뒤 이동 스레드에서 하므로 먼저 기다림)
+        if deferred and stager is not None:
+            stager.flush()
+        retry = []
+        for job in deferred:
+            started = time.perf_counter()
+            try:
+                hit = cache.fetch(job["cache_key"], job["output"])
+            except OSError:
+                hit = False
+            if hit:
+                finish_cached(job, started)
+            else:
+                retry.append(job)
+        if retry and not (should_stop and should_stop()):
+            results += pool.run(iter(retry), on_start=start, on_result=dispatch, should_stop=should_stop)
+        # 다른 PC가 잡고 있던 파일: 끝나길 기다리다 그 PC가 죽으면 가져와 변환
+        if leases is not None:
+            for reclaimed in leases.reclaim_waiting(should_stop=should_stop):
+                results += pool.run(iter(reclaimed), on_start=start, on_result=dispatch, should_stop=should_stop)
+
+    # 중지 등으로 끝내 합치지 못한 구간 PDF 정리
+    for state in chunk_state.values():
+        for part in state["parts"].values():
+            _remove_quietly(part["output"])
+    if stager is not None:
+        stager.flush()
+    results = [r for r in results if "chunk" not in r]
+    if cost_model is not None:
+        # 구간으로 나눠 변환한 문서는 합친 결과(첫 구간 시작부터 합치기까지)로 기록
+        cost_model.update(results + merged_results)
+    return results + merged_results + cached_results
@@ -0,0 +1,303 @@
+import os
+import time
+import queue
+import threading
+
+from engine import run_batch
+from instance_session import InstanceSession
+from manifest import Manifest
+from preflight import check, describe
+from scanner import FILE_TYPES, ScannedFile, iter_files
+
+FILE_LIST_DIRECTORY = 0x0001
+# 변환에 실패한 파일은 내용이 바뀌지 않으면 이 시간(초)이 지난 뒤 다시 시도
+DEFAULT_RETRY_INTERVAL = 300
+
+
+def _signature(path):
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns
+
+
+def _can_open(path):
+    """다른 프로그램이 아직 쓰는 중(잠금)인지 확인"""
+    try:
+        with open(path, "rb"):
+            return True
+    except OSError:
+        return False
+
+
+class FolderWatcher:
+    """입력 폴더를 감시해 새로 생기거나 바뀐 파일만 변환하는 상주 모드
+
+    Windows에서는 ReadDirectoryChangesW 알림으로 바로 깨어나고, 그 밖에는
+    주기적으로 폴더를 다시 훑는다. 크기/수정시각이 settle_seconds 동안 그대로인
+    파일만 변환하며, 한글/워드 인스턴스는 감시가 끝날 때까지 켜 둔다. session(InstanceSession)이
+    있으면 변환기를 따로 띄우지 않고 세션의 인스턴스를 빌려 쓴다. 변환에 성공한 파일만 처리한
+    것으로 기록하고, 실패한 파일은 retry_interval초 뒤에 다시 시도한다.
+    준비된 파일은 engine.run_batch로 변환하므로 journal/stager/cache/split_pages는 일괄 변환과
+    같은 뜻이다 (닫기/저장은 부른 쪽에서 함).
+    """
+
+    def __init__(self, input_folder, output_folder, file_types=("hwp", "word"), recursive=False,
+                 workers=1, backend="com", backend_options=None, timeout=None, max_documents=None, max_rss_mb=None,
+                 settle_seconds=2.0, poll_interval=5.0, rescan_interval=60.0, retry_interval=DEFAULT_RETRY_INTERVAL,
+                 preflight=True, journal=None, stager=None, cache=None, split_pages=None, session=None, log=None,
+                 on_start=None, on_result=None, on_skip=None):
+        self.input_folder = os.path.abspath(input_folder)
+        self.output_folder = output_folder
+        self.file_types = tuple(file_types)
+        self.recursive = recursive
+        self.workers = workers
+        self.backend = backend
+        self.backend_options = backend_options
+        self.timeout = timeout
+        self.max_documents = max_documents
+        self.max_rss_mb = max_rss_mb
+        self.settle_seconds = settle_seconds
+        self.poll_interval = poll_interval
+        self.rescan_interval = rescan_interval
+        self.retry_interval = retry_interval
+        self.preflight = preflight
+        self.journal = journal
+        self.stager = stager
+        self.cache = cache
+        self.split_pages = split_pages
+        self.session = session
+        self.log = log or (lambda message: None)
+        self.on_start = on_start
+        self.on_result = on_result
+        self.on_skip = on_skip
+
+        self.manifest = Manifest(output_folder)
+        self.native = False
+        # session이 없을 때 감시하는 동안 변환기를 켜 두려고 직접 만든 세션
+        self._own_session = None
+        self._handled = {}
+        self._retry_at = {}
+        self._converting = {}
+        self._candidates = {}
+        self._changes = queue.SimpleQueue()
+        self._wake = threading.Event()
+
+    def _start_native_watch(self):
+        """Windows 폴더 변경 알림 스레드 시작 (실패하면 None, 성공하면 알림을 멈추는 함수)
+
+        겹친(overlapped) 읽기로 알림과 중지 이벤트를 함께 기다리므로 변경이 없어도 바로 멈춘다.
+        """
+        try:
+            import pywintypes
+            import win32con
+            import win32event
+            import win32file
+        except ImportError:
+            return None
+        try:
+            handle = win32file.CreateFile(
+                self.input_folder, FILE_LIST_DIRECTORY,
+                win32con.FILE_SHARE_READ | win32con.FILE_SHARE_WRITE | win32con.FILE_SHARE_DELETE,
+                None, win32con.OPEN_EXISTING, win32con.FILE_FLAG_BACKUP_SEMANTICS | win32con.FILE_FLAG_OVERLAPPED, None)
+        except Exception as e:
+            self.log(f"⚠️ 폴더 변경 알림을 사용할 수 없어 폴링으로 감시합니다: {e}")
+            return None
+
+        flags = (win32con.FILE_NOTIFY_CHANGE_FILE_NAME | win32con.FILE_NOTIFY_CHANGE_SIZE
+                 | win32con.FILE_NOTIFY_CHANGE_LAST_WRITE)
+        stop_handle = win32event.CreateEvent(None, True, False, None)
+        overlapped = pywintypes.OVERLAPPED()
+        overlapped.hEvent = win32event.CreateEvent(None, True, False, None)
+        buffer = win32file.AllocateReadBuffer(64 * 1024)
+
+        def watch():
+            try:
+                while True:
+                    win32event.ResetEvent(overlapped.hEvent)
+                    win32file.ReadDirectoryChangesW(handle, buffer, self.recursive, flags, overlapped)
+                    signaled = win32event.WaitForMultipleObjects([overlapped.hEvent, stop_handle], False,
+                                                                 win32event.INFINITE)
+                    if signaled != win32event.WAIT_OBJECT_0:
+                        # 중지 요청: 걸어 둔 읽기를 취소하고 끝날 때까지 기다린 뒤 종료
+                        win32file.CancelIo(handle)
+                        try:
+                            win32file.GetOverlappedResult(handle, overlapped, True)
+                        except pywintypes.error:
+                            pass
+                        return
+                    size = win32file.GetOverlappedResult(handle, overlapped, True)
+                    if not size:
+                        # 버퍼 넘침: 전체 재검색 요청
+                        self._changes.put(None)
+                    for action, name in win32file.FILE_NOTIFY_INFORMATION(buffer, size):
+                        self._changes.put(os.path.join(self.input_folder, name))
+                    self._wake.set()
+            except Exception as e:
+                self.log(f"⚠️ 폴더 변경 알림 중단, 폴링으로 전환합니다: {e}")
+                self.native = False
+            finally:
+                handle.Close()
+
+        thread = threading.Thread(target=watch, name="folder-notify", daemon=True)
+        thread.start()
+
+        def stop():
+            win32event.SetEvent(stop_handle)
+            thread.join(timeout=5)
+
+        return stop
+
+    def _consider(self, path, relpath, file_type, now):
+        """파일 상태를 갱신하고 아직 처리하지 않은 변경이면 대기 목록에 올림"""
+        try:
+            signature = _signature(path)
+        except OSError:
+            self._candidates.pop(path, None)
+            return
+        if self._handled.get(path) == signature:
+            return
+        retry = self._retry_at.get(path)
+        if retry is not None:
+            if retry[0] == signature and now < retry[1]:
+                return
+            del self._retry_at[path]
+        previous = self._candidates.get(path)
+        if previous is None or previous[0] != signature:
+            # 새 파일이거나 아직 쓰는 중: 안정화 시간을 다시 잼
+            self._candidates[path] = (signature, now, ScannedFile(path, relpath, file_type, signature[0]))
+
+    def _scan_all(self, now):
+        for item in iter_files(self.input_folder, self.recursive):
+            if item.file_type in self.file_types:
+                self._consider(item.path, item.relpath, item.file_type, now)
+
+    def _apply_changes(self, now):
+        """변경 알림으로 받은 경로만 확인. 전체 재검색이 필요하면 True"""
+        rescan = False
+        while True:
+            try:
+                path = self._changes.get_nowait()
+            except queue.Empty:
+                return rescan
+            if path is None:
+                rescan = True
+                continue
+            file_type = FILE_TYPES.get(os.path.splitext(path)[1].lower())
+            if file_type not in self.file_types or not os.path.isfile(path):
+                continue
+            relpath = os.path.relpath(path, self.input_folder)
+            if not self.recursive and os.path.dirname(relpath):
+                continue
+            self._consider(path, relpath, file_type, now)
+
+    def _ready_files(self, now):
+        """안정화 시간이 지났고 열 수 있는 파일을 대기 목록에서 꺼냄"""
+        ready = {file_type: [] for file_type in self.file_types}
+        for path, (signature, since, item) in list(self._candidates.items()):
+            try:
+                current = _signature(path)
+            except OSError:
+                del self._candidates[path]
+                continue
+            if current != signature:
+                # 아직 쓰는 중
+                self._candidates[path] = (current, now, item._replace(size=current[0]))
+                continue
+            if now - since >= self.settle_seconds and _can_open(path):
+                del self._candidates[path]
+                checked = self._check(item)
+                if checked is None:
+                    # 손상/암호 파일은 내용이 바뀌기 전까지 다시 검사하지 않음
+                    self._handled[path] = signature
+                else:
+                    self._converting[path] = signature
+                    ready[checked.file_type].append(checked)
+        return ready
+
+    def _check(self, item):
+        """헤더 검사: 손상/암호 파일은 제외하고 형식이 다른 파일은 실제 종류로 보냄"""
+        if not self.preflight:
+            return item
+        action, verdict = check(item.path, item.file_type)
+        if action == "rejected":
+            self.log(f"⛔ {item.relpath} 변환 제외 ({describe(verdict)})")
+            return None
+        if action == "routed":
+            if verdict.file_type not in self.file_types:
+                self.log(f"⛔ {item.relpath} 변환 제외 (실제 형식 {verdict.format})")
+                return None
+            self.log(f"↪️ {item.relpath} 실제 형식({verdict.format})에 맞는 변환기로 보냅니다.")
+            return item._replace(file_type=verdict.file_type)
+        if action == "warning":
+            self.log(f"⚠️ {item.relpath}: {describe(verdict)}")
+        return item
+
+    def _convert(self, file_type, files, should_stop):
+        def handled(job):
+            # 대기 목록에서 꺼낼 때의 크기/수정시각을 처리한 상태로 기록
+            signature = self._converting.pop(job["source"], None)
+            if signature is not None:
+                self._handled[job["source"]] = signature
+
+        def skip(job):
+            handled(job)
+            if self.on_skip:
+                self.on_skip(job)
+
+        def finish(result):
+            if result["status"] == "done":
+                handled(result)
+            else:
+                signature = self._converting.pop(result["source"], None)
+                if signature is not None:
+                    self._retry_at[result["source"]] = (signature, time.monotonic() + self.retry_interval)
+            if self.on_result:
+                self.on_result(result)
+
+        run_batch(file_type, files, self.output_folder, workers=self.workers, backend=self.backend,
+                  backend_options=self.backend_options, timeout=self.timeout, max_documents=self.max_documents,
+                  max_rss_mb=self.max_rss_mb, manifest=self.manifest, journal=self.journal, stager=self.stager,
+                  cache=self.cache, split_pages=self.split_pages, session=self.session or self._own_session,
+                  log=self.log, on_start=self.on_start, on_result=finish, on_skip=skip, should_stop=should_stop)
+
+    def run(self, should_stop):
+        """should_stop()이 True가 될 때까지 감시/변환 반복"""
+        os.makedirs(self.output_folder, exist_ok=True)
+        stop_native = self._start_native_watch()
+        self.native = stop_native is not None
+        self.log(f"👀 폴더 감시 시작: {self.input_folder} ({'변경 알림' if self.native else '폴링'})")
+        if self.session is None:
+            self._own_session = InstanceSession(idle_timeout=0, log=self.log)
+
+        last_scan = None
+        try:
+            while not should_stop():
+                now = time.monotonic()
+                interval = self.rescan_interval if self.native else self.poll_interval
+                if self._apply_changes(now) or last_scan is None or now - last_scan >= interval:
+                    self._scan_all(now)
+                    last_scan = now
+
+                ready = self._ready_files(now)
+                pipelines = [threading.Thread(target=self._convert, args=(file_type, files, should_stop), daemon=True)
+                             for file_type, files in ready.items() if files]
+                for pipeline in pipelines:
+                    pipeline.start()
+                for pipeline in pipelines:
+                    pipeline.join()
+                if pipelines:
+                    self.manifest.save()
+
+                # 변경 알림이 오면 바로 깨어나고, 중지 요청은 1초 안에 반영
+                self._wake.wait(timeout=0.5 if self._candidates else 1.0)
+                self._wake.clear()
+        finally:
+            if stop_native is not None:
+                stop_native()
+            if self._own_session is not None:
+                self._own_session.close()
+                self._own_session = None
+            try:
+                self.manifest.save()
+            except OSError as e:
+                self.log(f"⚠️ 변환 기록 저장 실패: {e}")
+            self.log("⏹️ 폴더 감시를 종료합니다.")
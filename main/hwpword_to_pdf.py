@@ -1,18 +1,41 @@
 import os
 import sys
-import glob
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
+import importlib
 import threading
-from pathlib import Path
+import multiprocessing
+
+from pdf_cache import DEFAULT_CACHE_MB
+from page_split import DEFAULT_SPLIT_PAGES
+from log_sink import LogSink, default_log_file
+from scheduling import ORDER_POLICIES, ORDER_LABELS
+
+# 로그 창 갱신 간격(ms)과 화면에 유지할 최대 로그 줄 수
+LOG_FLUSH_INTERVAL_MS = 100
+MAX_LOG_LINES = 2000
+# 파일 하나의 기본 변환 제한 시간(초), 0이면 제한 없음
+DEFAULT_FILE_TIMEOUT = 600
+# 창이 뜬 뒤 한글/워드를 미리 띄우기 시작할 때까지의 지연(ms)
+PREWARM_DELAY_MS = 1000
+# 창을 빨리 띄우려고 변환 모듈은 필요할 때 불러오며, 창이 뜬 뒤 이 순서로 미리 불러 둠
+PRELOAD_MODULES = ("instance_session", "async_api", "scanner", "manifest", "journal", "run_report",
+                   "staging", "leases", "folder_watch")
+NO_FILES_MESSAGES = {
+    "hwp": "선택한 폴더에 .hwp/.hwpx 파일이 없습니다.",
+    "word": "선택한 폴더에 .doc/.docx 파일이 없습니다.",
+    "all": "선택한 폴더에 변환할 파일이 없습니다.",
+}
 
 class HwpWordToPdfConverter:
-    def __init__(self, root):
+    def __init__(self, root, backend="com"):
         self.root = root
+        self.backend = backend
         self.root.title("한글/워드 파일 PDF 변환기")
-        # 아이콘 설정 (ICO 파일 경로를 실제 경로로 변경하세요)
+        # 아이콘 설정 (실행파일로 묶었으면 풀린 폴더, 아니면 이 파일이 있는 폴더에서 찾음)
         try:
-            self.root.iconbitmap("app_icon.ico")
+            self.root.iconbitmap(os.path.join(getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__))),
+                                              "app_icon.ico"))
         except Exception:
             pass
 
@@ -31,7 +54,105 @@ class HwpWordToPdfConverter:
         self.input_folder_selected = False
         self.output_folder_selected = False
 
+        # 동시에 실행할 변환기 인스턴스(워커 프로세스) 수
+        self.worker_count = tk.IntVar(value=1)
+        # 파일당 제한 시간(초): 넘기면 변환 프로그램을 재시작하고 다음 파일로 진행
+        self.file_timeout = tk.IntVar(value=DEFAULT_FILE_TIMEOUT)
+        # 처리 순서 (파일 크기/과거 변환 시간 기준 정렬)와 확장자별 변환 시간 기록
+        self.order = tk.StringVar(value=ORDER_LABELS["scan"])
+        self.cost_model = None
+        # 변경된 파일만 변환 (출력 폴더의 변환 기록 사용)
+        self.incremental = tk.BooleanVar(value=False)
+        self.manifest = None
+        # 파일별 변환 상태 기록 (비정상 종료 후 이어서 변환할 때 사용)
+        self.journal = None
+        # 같은 내용의 파일은 이전 변환 결과 재사용 (0MB면 사용 안 함)
+        self.cache_size = tk.IntVar(value=DEFAULT_CACHE_MB)
+        self.pdf_cache = None
+        # 이보다 쪽 수가 많은 워드 문서는 구간으로 나눠 동시에 변환 (0이면 나누지 않음)
+        self.split_pages = tk.IntVar(value=DEFAULT_SPLIT_PAGES)
+        # 현재 실행의 파일별/단계별 시간 기록
+        self.report = None
+        # 하위 폴더 포함 여부와 입력 폴더 스캔 결과 캐시
+        self.recursive = tk.BooleanVar(value=False)
+        self.scanner = None
+        # 변환 전 파일 헤더 검사 (손상/암호 파일 제외, 확장자와 다른 형식은 맞는 변환기로)
+        self.preflight = tk.BooleanVar(value=True)
+        # 같은 공유 출력 폴더를 쓰는 다른 PC와 파일을 나눠 변환
+        self.coordinate = tk.BooleanVar(value=False)
+        self.leases = None
+        # 출력 폴더가 네트워크 공유면 로컬에서 PDF를 만든 뒤 백그라운드에서 옮김
+        self.stager = None
+
+        # 작업 스레드 → UI 로그/진행 상태 전달 큐 (전체 로그는 파일에 기록)
+        try:
+            log_file = default_log_file()
+        except OSError:
+            log_file = None
+        self.log_sink = LogSink(log_file)
+        # 배치 사이에 켜 두는 한글/워드 인스턴스 (창이 뜬 뒤 만들며, 오래 쓰지 않거나 창을 닫으면 종료)
+        self.session = None
+        self.closed = False
+        self.session_lock = threading.Lock()
+
         self.setup_ui()
+        self.root.after(LOG_FLUSH_INTERVAL_MS, self.flush_log)
+        self.root.after(PREWARM_DELAY_MS, self.prewarm_instances)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+
+    def pool_options(self):
+        """변환기 인스턴스 설정 (같은 설정이면 켜 둔 인스턴스를 다음 변환에서 재사용)"""
+        from engine import DEFAULT_RECYCLE_DOCUMENTS, DEFAULT_RECYCLE_MEMORY_MB
+        return {"workers": self.get_worker_count(), "backend": self.backend,
+                "max_documents": DEFAULT_RECYCLE_DOCUMENTS, "max_rss_mb": DEFAULT_RECYCLE_MEMORY_MB}
+
+    def get_session(self):
+        """배치 사이에 켜 두는 변환기 세션 (처음 부를 때 만들고, 창을 닫은 뒤에는 None)"""
+        with self.session_lock:
+            if self.session is None and not self.closed:
+                from instance_session import InstanceSession
+                self.session = InstanceSession(log=self.log)
+            return self.session
+
+    def prewarm_instances(self):
+        """첫 변환을 기다리지 않도록 변환 모듈과 한글/워드를 백그라운드에서 미리 불러옴"""
+        thread = threading.Thread(target=self.preload)
+        thread.daemon = True
+        thread.start()
+
+    def preload(self):
+        for name in PRELOAD_MODULES:
+            try:
+                importlib.import_module(name)
+            except ImportError as e:
+                self.log(f"⚠️ {name} 모듈을 불러오지 못했습니다: {e}")
+        session = self.get_session()
+        if session is not None and not self.is_converting:
+            session.prewarm(**self.pool_options())
+
+    def on_closing(self):
+        self.stop_requested = True
+        self.root.withdraw()
+        with self.session_lock:
+            self.closed = True
+            session = self.session
+        if session is None:
+            self.log_sink.close()
+            self.root.destroy()
+            return
+        # 변환기 종료(변환 중이면 끝나길 기다림)는 창 스레드를 막지 않도록 따로 실행하고 끝나면 창을 닫음
+        thread = threading.Thread(target=session.close)
+        thread.daemon = True
+        thread.start()
+        self.destroy_when_done(thread)
+
+    def destroy_when_done(self, thread):
+        if thread.is_alive():
+            self.root.after(LOG_FLUSH_INTERVAL_MS, self.destroy_when_done, thread)
+        else:
+            # 변환기를 닫는 동안 남긴 로그까지 파일에 쓴 뒤 닫음
+            self.log_sink.close()
+            self.root.destroy()
 
     def setup_ui(self):
         """UI 구성"""
@@ -51,9 +172,27 @@ class HwpWordToPdfConverter:
         ttk.Entry(main_frame, textvariable=self.output_folder, width=50).grid(row=2, column=1, padx=(10, 5), pady=5, sticky=(tk.W, tk.E))
         ttk.Button(main_frame, text="폴더 선택", command=self.select_output_folder).grid(row=2, column=2, padx=(5, 0), pady=5)
         
+        # 변환 옵션
+        ttk.Label(main_frame, text="동시 변환 수:", font=("맑은 고딕", 10)).grid(row=3, column=0, sticky=tk.W, pady=5)
+        option_frame = ttk.Frame(main_frame)
+        option_frame.grid(row=3, column=1, columnspan=2, padx=(10, 5), pady=5, sticky=tk.W)
+        ttk.Spinbox(option_frame, from_=1, to=max(1, os.cpu_count() or 1), textvariable=self.worker_count, width=5).grid(row=0, column=0, sticky=tk.W)
+        ttk.Checkbutton(option_frame, text="변경된 파일만 변환", variable=self.incremental).grid(row=0, column=1, padx=(20, 0), sticky=tk.W)
+        ttk.Checkbutton(option_frame, text="하위 폴더 포함", variable=self.recursive, command=self.rescan_input_folder).grid(row=0, column=2, padx=(20, 0), sticky=tk.W)
+        ttk.Checkbutton(option_frame, text="변환 전 파일 검사", variable=self.preflight, command=self.rescan_input_folder).grid(row=0, column=3, padx=(20, 0), sticky=tk.W)
+        ttk.Label(option_frame, text="파일당 제한 시간(초):").grid(row=1, column=0, columnspan=2, pady=(5, 0), sticky=tk.W)
+        ttk.Spinbox(option_frame, from_=0, to=3600, increment=30, textvariable=self.file_timeout, width=6).grid(row=1, column=2, padx=(20, 0), pady=(5, 0), sticky=tk.W)
+        ttk.Checkbutton(option_frame, text="여러 PC가 나눠 변환", variable=self.coordinate).grid(row=1, column=3, padx=(20, 0), pady=(5, 0), sticky=tk.W)
+        ttk.Label(option_frame, text="처리 순서:").grid(row=2, column=0, columnspan=2, pady=(5, 0), sticky=tk.W)
+        ttk.Combobox(option_frame, textvariable=self.order, values=[ORDER_LABELS[p] for p in ORDER_POLICIES], state="readonly", width=20).grid(row=2, column=2, padx=(20, 0), pady=(5, 0), sticky=tk.W)
+        ttk.Label(option_frame, text="변환 결과 캐시(MB, 0이면 끔):").grid(row=3, column=0, columnspan=2, pady=(5, 0), sticky=tk.W)
+        ttk.Spinbox(option_frame, from_=0, to=102400, increment=512, textvariable=self.cache_size, width=8).grid(row=3, column=2, padx=(20, 0), pady=(5, 0), sticky=tk.W)
+        ttk.Label(option_frame, text="워드 분할 변환 기준 쪽 수(0이면 끔):").grid(row=4, column=0, columnspan=2, pady=(5, 0), sticky=tk.W)
+        ttk.Spinbox(option_frame, from_=0, to=10000, increment=100, textvariable=self.split_pages, width=8).grid(row=4, column=2, padx=(20, 0), pady=(5, 0), sticky=tk.W)
+        
         # 변환 버튼들
         button_frame = ttk.Frame(main_frame)
-        button_frame.grid(row=3, column=0, columnspan=3, pady=20)
+        button_frame.grid(row=4, column=0, columnspan=3, pady=20)
                 
         self.all_convert_button = ttk.Button(button_frame, text="일괄 변환", command=self.start_all_conversion, state="disabled")
         self.all_convert_button.grid(row=0, column=0, padx=5)
@@ -64,25 +203,31 @@ class HwpWordToPdfConverter:
         self.word_convert_button = ttk.Button(button_frame, text="워드 변환", command=self.start_word_conversion, state="disabled")
         self.word_convert_button.grid(row=0, column=2, padx=5)
         
+        self.watch_button = ttk.Button(button_frame, text="폴더 감시", command=self.start_watch, state="disabled")
+        self.watch_button.grid(row=0, column=3, padx=5)
+        
+        self.resume_button = ttk.Button(button_frame, text="이어서 변환", command=self.start_resume_conversion, state="disabled")
+        self.resume_button.grid(row=0, column=4, padx=5)
+        
         self.stop_button = ttk.Button(button_frame, text="정지", command=self.stop_conversion)
-        self.stop_button.grid(row=0, column=3, padx=5)
+        self.stop_button.grid(row=0, column=5, padx=5)
         
         # 진행 상태 표시
         self.progress_var = tk.StringVar(value="변환 대기 중...")
-        ttk.Label(main_frame, textvariable=self.progress_var, font=("맑은 고딕", 10)).grid(row=4, column=0, columnspan=3, pady=5)
+        ttk.Label(main_frame, textvariable=self.progress_var, font=("맑은 고딕", 10)).grid(row=5, column=0, columnspan=3, pady=5)
         
         self.progress_bar = ttk.Progressbar(main_frame, mode='indeterminate')
-        self.progress_bar.grid(row=5, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=5)
+        self.progress_bar.grid(row=6, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=5)
         
         # 로그 표시
-        ttk.Label(main_frame, text="변환 로그:", font=("맑은 고딕", 10)).grid(row=6, column=0, sticky=tk.W, pady=(20, 5))
+        ttk.Label(main_frame, text="변환 로그:", font=("맑은 고딕", 10)).grid(row=7, column=0, sticky=tk.W, pady=(20, 5))
         self.log_text = scrolledtext.ScrolledText(main_frame, height=15, width=70)
-        self.log_text.grid(row=7, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
+        self.log_text.grid(row=8, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
         
         # 그리드 설정
         self.root.grid_rowconfigure(0, weight=1)
         self.root.grid_columnconfigure(0, weight=1)
-        main_frame.grid_rowconfigure(7, weight=1)
+        main_frame.grid_rowconfigure(8, weight=1)
         main_frame.grid_columnconfigure(1, weight=1)
         
         # 초기 메시지
@@ -91,7 +236,8 @@ class HwpWordToPdfConverter:
         self.log("1. 입력 폴더: 변환할 .hwp/.hwpx/.doc/.docx 파일들이 있는 폴더를 선택하세요.")
         self.log("2. 출력 폴더: PDF 파일이 저장될 폴더를 선택하세요.")
         self.log("3. 입력/출력 폴더를 모두 선택하면 변환 버튼이 활성화됩니다.")
-        self.log("4. '한글 변환', '워드 변환', 또는 '일괄 변환' 버튼을 클릭하여 변환을 시작하세요.\n")
+        self.log("4. '한글 변환', '워드 변환', 또는 '일괄 변환' 버튼을 클릭하여 변환을 시작하세요.")
+        self.log("5. '폴더 감시'를 누르면 입력 폴더에 새로 들어오거나 바뀐 파일을 정지할 때까지 계속 변환합니다.\n")
         
         if sys.platform != "win32":
             self.log("⚠️ 경고: 이 프로그램은 Windows에서만 작동합니다.\n")
@@ -103,22 +249,42 @@ class HwpWordToPdfConverter:
             self.input_folder_selected = True
             self.log(f"입력 폴더 선택: {folder}")
             
-            # 한글 파일 개수 확인 (.hwp, .hwpx)
-            hwp_files = glob.glob(os.path.join(folder, "*.hwp"))
-            hwpx_files = glob.glob(os.path.join(folder, "*.hwpx"))
-            total_hwp_files = len(hwp_files + hwpx_files)
-            
-            # 워드 파일 개수 확인 (.doc, .docx)
-            doc_files = glob.glob(os.path.join(folder, "*.doc"))
-            docx_files = glob.glob(os.path.join(folder, "*.docx"))
-            total_word_files = len(doc_files + docx_files)
-            
-            self.log(f"발견된 한글 파일: {total_hwp_files}개")
-            self.log(f"발견된 워드 파일: {total_word_files}개\n")
+            # 폴더는 한 번만 스캔하고 결과를 세션 동안 재사용
+            self.rescan_input_folder()
             
             # 버튼 상태 업데이트
             self.update_button_state()
     
+    def rescan_input_folder(self):
+        if not self.input_folder_selected or self.is_converting:
+            return
+        scanner = self.get_scanner(refresh=True)
+        thread = threading.Thread(target=self.report_scan_result, args=(scanner,))
+        thread.daemon = True
+        thread.start()
+
+    def get_scanner(self, refresh=False):
+        """현재 입력 폴더/하위 폴더 설정에 맞는 스캐너 (캐시 재사용)"""
+        folder = self.input_folder.get()
+        recursive = self.recursive.get()
+        preflight = self.preflight.get()
+        if refresh or self.scanner is None or not self.scanner.matches(folder, recursive, preflight):
+            from scanner import FolderScanner
+            self.scanner = FolderScanner(folder, recursive, preflight=preflight)
+            self.scanner.start()
+        return self.scanner
+
+    def report_scan_result(self, scanner):
+        try:
+            scanner.wait()
+        except OSError as e:
+            self.log(f"❌ 폴더 검색 실패: {e}")
+            return
+        self.log(f"발견된 한글 파일: {scanner.count('hwp')}개")
+        self.log(f"발견된 워드 파일: {scanner.count('word')}개\n")
+        if scanner.errors:
+            self.log(f"⚠️ 읽을 수 없는 항목: {len(scanner.errors)}개\n")
+
     def select_output_folder(self):
         folder = filedialog.askdirectory(title="PDF 파일을 저장할 폴더를 선택하세요")
         if folder:
@@ -135,15 +301,37 @@ class HwpWordToPdfConverter:
             self.hwp_convert_button.config(state="normal")
             self.word_convert_button.config(state="normal")
             self.all_convert_button.config(state="normal")
+            self.watch_button.config(state="normal")
+            self.resume_button.config(state="normal")
         else:
             self.hwp_convert_button.config(state="disabled")
             self.word_convert_button.config(state="disabled")
             self.all_convert_button.config(state="disabled")
+            self.watch_button.config(state="disabled")
+            self.resume_button.config(state="disabled")
     
     def log(self, message):
-        self.log_text.insert(tk.END, message + "\n")
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
+        # 어느 스레드에서든 호출 가능 (화면 반영은 flush_log에서)
+        self.log_sink.write(message)
+
+    def set_progress(self, text):
+        self.log_sink.set_progress(text)
+
+    def flush_log(self):
+        """쌓인 로그/진행 상태를 한 번에 화면에 반영 (메인 스레드)"""
+        self.root.after(LOG_FLUSH_INTERVAL_MS, self.flush_log)
+        messages, progress, calls = self.log_sink.drain()
+        if messages:
+            self.log_text.insert(tk.END, "\n".join(messages) + "\n")
+            # 오래된 줄은 버려 화면 로그가 무한히 커지지 않도록 함
+            line_count = int(self.log_text.index("end-1c").split(".")[0])
+            if line_count > MAX_LOG_LINES:
+                self.log_text.delete("1.0", f"{line_count - MAX_LOG_LINES + 1}.0")
+            self.log_text.see(tk.END)
+        if progress is not None:
+            self.progress_var.set(progress)
+        for func, args in calls:
+            func(*args)
 
     def start_hwp_conversion(self):
         if self.is_converting:
@@ -154,20 +342,14 @@ class HwpWordToPdfConverter:
         if not os.path.exists(self.input_folder.get()):
             messagebox.showerror("오류", "선택한 입력 폴더가 존재하지 않습니다.")
             return
-            
-        hwp_files = glob.glob(os.path.join(self.input_folder.get(), "*.hwp"))
-        hwpx_files = glob.glob(os.path.join(self.input_folder.get(), "*.hwpx"))
-        total_hwp_files = hwp_files + hwpx_files
-        
-        if not total_hwp_files:
-            messagebox.showwarning("경고", "선택한 폴더에 .hwp/.hwpx 파일이 없습니다.")
-            return
 
         self.is_converting = True
         self.stop_requested = False
         self.hwp_convert_button.config(state="disabled")
         self.word_convert_button.config(state="disabled")
         self.all_convert_button.config(state="disabled")
+        self.watch_button.config(state="disabled")
+        self.resume_button.config(state="disabled")
         self.progress_bar.start()
 
         thread = threading.Thread(target=lambda: self.convert_files("hwp"))
@@ -183,20 +365,14 @@ class HwpWordToPdfConverter:
         if not os.path.exists(self.input_folder.get()):
             messagebox.showerror("오류", "선택한 입력 폴더가 존재하지 않습니다.")
             return
-            
-        doc_files = glob.glob(os.path.join(self.input_folder.get(), "*.doc"))
-        docx_files = glob.glob(os.path.join(self.input_folder.get(), "*.docx"))
-        word_files = doc_files + docx_files
-        
-        if not word_files:
-            messagebox.showwarning("경고", "선택한 폴더에 .doc/.docx 파일이 없습니다.")
-            return
 
         self.is_converting = True
         self.stop_requested = False
         self.hwp_convert_button.config(state="disabled")
         self.word_convert_button.config(state="disabled")
         self.all_convert_button.config(state="disabled")
+        self.watch_button.config(state="disabled")
+        self.resume_button.config(state="disabled")
         self.progress_bar.start()
 
         thread = threading.Thread(target=lambda: self.convert_files("word"))
@@ -212,80 +388,215 @@ class HwpWordToPdfConverter:
         if not os.path.exists(self.input_folder.get()):
             messagebox.showerror("오류", "선택한 입력 폴더가 존재하지 않습니다.")
             return
-            
-        # 한글 파일과 워드 파일 검색
-        hwp_files = glob.glob(os.path.join(self.input_folder.get(), "*.hwp"))
-        hwpx_files = glob.glob(os.path.join(self.input_folder.get(), "*.hwpx"))
-        total_hwp_files = hwp_files + hwpx_files
-        
-        doc_files = glob.glob(os.path.join(self.input_folder.get(), "*.doc"))
-        docx_files = glob.glob(os.path.join(self.input_folder.get(), "*.docx"))
-        word_files = doc_files + docx_files
-        
-        if not total_hwp_files and not word_files:
-            messagebox.showwarning("경고", "선택한 폴더에 변환할 파일이 없습니다.")
-            return
 
         self.is_converting = True
         self.stop_requested = False
         self.hwp_convert_button.config(state="disabled")
         self.word_convert_button.config(state="disabled")
         self.all_convert_button.config(state="disabled")
+        self.watch_button.config(state="disabled")
+        self.resume_button.config(state="disabled")
         self.progress_bar.start()
 
         thread = threading.Thread(target=lambda: self.convert_files("all"))
         thread.daemon = True
         thread.start()
 
+    def start_resume_conversion(self):
+        """출력 폴더에 남은 변환 기록을 읽어 중단된 변환을 이어서 진행"""
+        if self.is_converting:
+            return
+        from journal import read_journal
+        previous = read_journal(self.output_folder.get())
+        if previous is None:
+            messagebox.showwarning("경고", "출력 폴더에 이어서 변환할 기록이 없습니다.")
+            return
+        run_info, _ = previous
+        file_type = run_info.get("file_type", "all")
+
+        # 이전 변환과 같은 입력 폴더/하위 폴더 설정으로 진행
+        if run_info.get("input") and os.path.normcase(os.path.abspath(self.input_folder.get())) != os.path.normcase(run_info["input"]):
+            self.input_folder.set(run_info["input"])
+            self.log(f"이전 변환의 입력 폴더 사용: {run_info['input']}")
+        if "recursive" in run_info:
+            self.recursive.set(run_info["recursive"])
+        if not os.path.exists(self.input_folder.get()):
+            messagebox.showerror("오류", "이전 변환의 입력 폴더가 존재하지 않습니다.")
+            return
+
+        self.is_converting = True
+        self.stop_requested = False
+        self.hwp_convert_button.config(state="disabled")
+        self.word_convert_button.config(state="disabled")
+        self.all_convert_button.config(state="disabled")
+        self.watch_button.config(state="disabled")
+        self.resume_button.config(state="disabled")
+        self.progress_bar.start()
+
+        thread = threading.Thread(target=lambda: self.convert_files(file_type, resume=True))
+        thread.daemon = True
+        thread.start()
+
+    def start_watch(self):
+        if self.is_converting:
+            return
+        if not os.path.exists(self.input_folder.get()):
+            messagebox.showerror("오류", "선택한 입력 폴더가 존재하지 않습니다.")
+            return
+
+        self.is_converting = True
+        self.stop_requested = False
+        self.hwp_convert_button.config(state="disabled")
+        self.word_convert_button.config(state="disabled")
+        self.all_convert_button.config(state="disabled")
+        self.watch_button.config(state="disabled")
+        self.resume_button.config(state="disabled")
+        self.progress_bar.start()
+
+        thread = threading.Thread(target=self.watch_folder)
+        thread.daemon = True
+        thread.start()
+
+    def watch_folder(self):
+        """정지할 때까지 입력 폴더를 감시하며 새 파일/바뀐 파일만 변환"""
+        from engine import DEFAULT_RECYCLE_DOCUMENTS, DEFAULT_RECYCLE_MEMORY_MB
+        from folder_watch import FolderWatcher
+        from journal import Journal
+        from staging import OutputStager, is_remote_path
+        journal = stager = cache = None
+        try:
+            self.log("=" * 50)
+            self.set_progress("폴더 감시 중...")
+
+            def on_start(job):
+                self.set_progress(f"폴더 감시 중... 변환: {job['filename']}")
+                self.log(f"변환 중: {job['filename']}")
+
+            output_folder = self.output_folder.get()
+            os.makedirs(output_folder, exist_ok=True)
+            journal = Journal(output_folder, run_info={"input": os.path.abspath(self.input_folder.get()),
+                                                       "file_type": "all", "recursive": self.recursive.get(),
+                                                       "watch": True})
+            if is_remote_path(output_folder):
+                stager = OutputStager(log=self.log)
+                self.log("📥 출력 폴더가 네트워크 공유라 PDF를 로컬에서 만든 뒤 옮깁니다.")
+            cache = self.get_pdf_cache()
+            watcher = FolderWatcher(
+                self.input_folder.get(), output_folder,
+                recursive=self.recursive.get(), preflight=self.preflight.get(), workers=self.get_worker_count(),
+                backend=self.backend, timeout=self.get_file_timeout(), max_documents=DEFAULT_RECYCLE_DOCUMENTS,
+                max_rss_mb=DEFAULT_RECYCLE_MEMORY_MB, journal=journal, stager=stager, cache=cache,
+                split_pages=self.get_split_pages(), session=self.get_session(), log=self.log,
+                on_start=on_start, on_result=self.log_result)
+            watcher.run(should_stop=lambda: self.stop_requested)
+            self.set_progress("폴더 감시 종료")
+        except Exception as e:
+            self.log(f"❌ 폴더 감시 중 오류 발생: {e}")
+            self.set_progress("폴더 감시 중 오류 발생")
+        finally:
+            if stager is not None:
+                stager.close()
+            if journal is not None:
+                journal.close()
+            if cache is not None:
+                try:
+                    cache.save()
+                except OSError as e:
+                    self.log(f"⚠️ 변환 결과 캐시 저장 실패: {e}")
+            self.log_sink.call(self.conversion_finished)
+
     def stop_conversion(self):
         if self.is_converting:
             self.stop_requested = True
             self.log("⏹️ 변환 중지 요청됨")
 
-    def convert_files(self, file_type):
+    def convert_files(self, file_type, resume=False):
+        from journal import Journal, DONE, FAILED, IN_PROGRESS, PENDING
+        from leases import LeaseBoard
+        from manifest import Manifest
+        from run_report import RunReport
+        from scheduling import CostModel
+        from staging import OutputStager, is_remote_path
         try:
             self.log("=" * 50)
-            
+
+            # 폴더를 고른 뒤 추가/삭제된 파일도 반영하도록 변환할 때마다 다시 스캔
+            # (파일 확인은 찾는 즉시 끝나지만 창이 멈추지 않도록 변환 스레드에서 함)
+            scanner = self.get_scanner(refresh=True)
+            if not scanner.has_files(None if file_type == "all" else file_type):
+                self.log(f"⚠️ {NO_FILES_MESSAGES[file_type]}")
+                self.set_progress("변환할 파일 없음")
+                self.log_sink.call(messagebox.showwarning, "경고", NO_FILES_MESSAGES[file_type])
+                return
+
             output_folder = self.output_folder.get()
             os.makedirs(output_folder, exist_ok=True)
-            
+            if self.coordinate.get():
+                # 변환 기록/상태 기록 파일은 여러 PC가 함께 쓸 수 없으므로 임대 파일로 대신함
+                self.manifest = None
+                self.leases = LeaseBoard(output_folder, log=self.log)
+                self.log(f"🤝 분산 변환 노드 {self.leases.node}: 다른 PC와 파일을 나눠 변환합니다.")
+                if self.incremental.get() or resume:
+                    self.log("ℹ️ 분산 변환에서는 다른 PC가 끝낸 파일을 자동으로 건너뜁니다.")
+            else:
+                self.manifest = Manifest(output_folder) if self.incremental.get() else None
+                self.journal = Journal(output_folder, resume=resume,
+                                       run_info={"input": os.path.abspath(self.input_folder.get()),
+                                                 "file_type": file_type, "recursive": self.recursive.get()})
+            if resume and self.journal is not None:
+                previous = self.journal.counts()
+                self.log(f"이어서 변환: 이전 기록 완료 {previous.get(DONE, 0)}개, 실패 {previous.get(FAILED, 0)}개, "
+                         f"중단 {previous.get(IN_PROGRESS, 0) + previous.get(PENDING, 0)}개")
+            self.report = RunReport(output_folder)
+            if is_remote_path(output_folder):
+                self.stager = OutputStager(log=self.log)
+                self.log("📥 출력 폴더가 네트워크 공유라 PDF를 로컬에서 만든 뒤 옮깁니다.")
+            if self.cost_model is None:
+                try:
+                    self.cost_model = CostModel.default()
+                except OSError:
+                    self.cost_model = CostModel()
+            self.pdf_cache = self.get_pdf_cache()
+
             if file_type == "hwp":
-                hwp_files = glob.glob(os.path.join(self.input_folder.get(), "*.hwp"))
-                hwpx_files = glob.glob(os.path.join(self.input_folder.get(), "*.hwpx"))
-                files_to_convert = hwp_files + hwpx_files
+                files_to_convert = scanner.files("hwp")
                 self.log(f"한글 파일 변환을 시작합니다...")
                 self.convert_hwp_files(files_to_convert, output_folder)
             elif file_type == "word":
-                doc_files = glob.glob(os.path.join(self.input_folder.get(), "*.doc"))
-                docx_files = glob.glob(os.path.join(self.input_folder.get(), "*.docx"))
-                files_to_convert = doc_files + docx_files
+                files_to_convert = scanner.files("word")
                 self.log(f"워드 파일 변환을 시작합니다...")
                 self.convert_word_files(files_to_convert, output_folder)
             elif file_type == "all":
                 self.log(f"일괄 변환을 시작합니다...")
                 
-                total_hwp_success = 0
-                total_hwp_failed = []
-                total_word_success = 0
-                total_word_failed = []
-                
-                # 한글 파일 먼저 변환
-                hwp_files = glob.glob(os.path.join(self.input_folder.get(), "*.hwp"))
-                hwpx_files = glob.glob(os.path.join(self.input_folder.get(), "*.hwpx"))
-                total_hwp_files = hwp_files + hwpx_files
+                # 한글/워드는 서로 다른 프로그램을 쓰므로 각자의 스레드에서 동시에 변환
+                pipeline_results = {}
+                pipeline_errors = []
                 
-                if total_hwp_files and not self.stop_requested:
-                    self.log(f"한글 파일 변환 시작...")
-                    total_hwp_success, total_hwp_failed = self.convert_hwp_files(total_hwp_files, output_folder, show_result=False)
+                def run_pipeline(key, label, convert):
+                    try:
+                        # 스캔이 진행 중이어도 해당 종류 파일이 보이는 즉시 시작
+                        if not scanner.has_files(key) or self.stop_requested:
+                            return
+                        self.log(f"{label} 파일 변환 시작...")
+                        pipeline_results[key] = convert(scanner.files(key), output_folder, show_result=False)
+                    except Exception as e:
+                        pipeline_errors.append(e)
                 
-                # 워드 파일 변환
-                doc_files = glob.glob(os.path.join(self.input_folder.get(), "*.doc"))
-                docx_files = glob.glob(os.path.join(self.input_folder.get(), "*.docx"))
-                word_files = doc_files + docx_files
+                pipelines = [
+                    threading.Thread(target=run_pipeline, args=("hwp", "한글", self.convert_hwp_files)),
+                    threading.Thread(target=run_pipeline, args=("word", "워드", self.convert_word_files)),
+                ]
+                for pipeline in pipelines:
+                    pipeline.daemon = True
+                    pipeline.start()
+                for pipeline in pipelines:
+                    pipeline.join()
                 
-                if word_files and not self.stop_requested:
-                    self.log(f"워드 파일 변환 시작...")
-                    total_word_success, total_word_failed = self.convert_word_files(word_files, output_folder, show_result=False)
+                if pipeline_errors:
+                    raise pipeline_errors[0]
+                total_hwp_success, total_hwp_failed = pipeline_results.get("hwp", (0, []))
+                total_word_success, total_word_failed = pipeline_results.get("word", (0, []))
                 
                 # 일괄 변환 결과 표시
                 self.show_batch_conversion_result(total_hwp_success, total_hwp_failed, 
@@ -293,129 +604,160 @@ class HwpWordToPdfConverter:
                     
         except Exception as e:
             self.log(f"❌ 전체 변환 중 오류 발생: {e}")
-            self.progress_var.set("변환 중 오류 발생")
-            messagebox.showerror("오류", f"변환 중 오류가 발생했습니다:\n{e}")
+            self.set_progress("변환 중 오류 발생")
+            self.log_sink.call(messagebox.showerror, "오류", f"변환 중 오류가 발생했습니다:\n{e}")
         finally:
-            self.conversion_finished()
+            if self.stager is not None:
+                self.stager.close()
+                self.stager = None
+            if self.journal is not None:
+                self.journal.close()
+                self.journal = None
+            if self.leases is not None:
+                self.leases.close()
+                self.leases = None
+            if self.manifest is not None:
+                try:
+                    self.manifest.save()
+                except OSError as e:
+                    self.log(f"⚠️ 변환 기록 저장 실패: {e}")
+                self.manifest = None
+            if self.report is not None and self.scanner is not None:
+                self.report.add_preflight(self.scanner.preflight_results())
+            if self.report is not None and (self.report.results or self.report.preflight):
+                try:
+                    jsonl_path, csv_path = self.report.write()
+                    self.log(f"📄 변환 보고서: {jsonl_path}")
+                except OSError as e:
+                    self.log(f"⚠️ 변환 보고서 저장 실패: {e}")
+            self.report = None
+            if self.pdf_cache is not None:
+                try:
+                    self.pdf_cache.save()
+                except OSError as e:
+                    self.log(f"⚠️ 변환 결과 캐시 저장 실패: {e}")
+            if self.cost_model is not None:
+                try:
+                    self.cost_model.save()
+                except OSError as e:
+                    self.log(f"⚠️ 변환 시간 기록 저장 실패: {e}")
+            self.log_sink.call(self.conversion_finished)
 
-    def convert_hwp_files(self, hwp_files, output_folder, show_result=True):
+    def get_worker_count(self):
         try:
-            import win32com.client
-            import win32gui
-            import win32con
-            import time
-            self.log("win32com 라이브러리를 사용합니다.")
-            use_win32com = True
-        except ImportError:
-            try:
-                import comtypes.client
-                self.log("comtypes 라이브러리를 사용합니다.")
-                use_win32com = False
-            except ImportError:
-                self.log("❌ 오류: 필요한 COM 라이브러리가 없습니다.")
-                self.log("win32com 또는 comtypes 라이브러리가 필요합니다.")
-                return 0, []
-
-        total_files = len(hwp_files)
-        self.log(f"총 {total_files}개의 한글 파일을 변환합니다.\n")
-
-        if use_win32com:
-            import win32com.client
-            hwp = win32com.client.Dispatch("HWPFrame.HwpObject")
-        else:
-            import comtypes.client
-            hwp = comtypes.client.CreateObject("HWPFrame.HwpObject")
-            
+            return max(1, int(self.worker_count.get()))
+        except (tk.TclError, ValueError):
+            return 1
+
+    def get_file_timeout(self):
         try:
-            hwp.SetMessageBoxMode(0x00000020)
-            hwp.RegisterModule("FilePathCheckDLL", "FilePathCheckerModule")
-        except:
-            pass
+            return max(0, int(self.file_timeout.get())) or None
+        except (tk.TclError, ValueError):
+            return DEFAULT_FILE_TIMEOUT
 
+    def get_split_pages(self):
+        try:
+            return max(0, int(self.split_pages.get())) or None
+        except (tk.TclError, ValueError):
+            return DEFAULT_SPLIT_PAGES
+
+    def get_pdf_cache(self):
+        """설정한 용량의 변환 결과 캐시 (0MB거나 캐시 폴더를 쓸 수 없으면 None)"""
+        try:
+            size_mb = max(0, int(self.cache_size.get()))
+        except (tk.TclError, ValueError):
+            size_mb = DEFAULT_CACHE_MB
+        if not size_mb:
+            return None
+        if self.pdf_cache is None:
+            from pdf_cache import PdfCache
+            try:
+                self.pdf_cache = PdfCache.default(size_mb)
+            except OSError as e:
+                self.log(f"⚠️ 변환 결과 캐시를 사용할 수 없습니다: {e}")
+                return None
+        self.pdf_cache.max_bytes = size_mb * 1024 * 1024
+        return self.pdf_cache
+
+    def get_order(self):
+        for policy, label in ORDER_LABELS.items():
+            if label == self.order.get():
+                return policy
+        return "scan"
+
+    def describe_total(self, files, file_type):
+        """변환할 파일 수 (스캔 중이라 아직 모르면 None)"""
+        if hasattr(files, "__len__"):
+            return len(files)
+        if self.scanner is not None and self.scanner.done:
+            return self.scanner.count(file_type)
+        return None
+
+    def run_conversion(self, file_type, files, output_folder, label):
+        """변환 API(convert_many)로 파일을 변환하고 (성공 개수, 실패 파일 목록) 반환"""
+        import asyncio
+        from async_api import convert_many
+        skipped = []
         success_count = 0
         failed_files = []
 
-        def handle_permission_dialog():
-            """권한 관련 대화상자 처리"""
-            try:
-                # 권한 대화상자 찾기
-                dialog_titles = ["경고", "알림", "Warning", "Alert", "한글"]
-                for title in dialog_titles:
-                    hwnd = win32gui.FindWindow(None, title)
-                    if hwnd:
-                        # N키 누르기 (모두 허용)
-                        win32gui.SetForegroundWindow(hwnd)
-                        time.sleep(0.1)
-                        win32gui.SendMessage(hwnd, win32con.WM_KEYDOWN, ord('N'), 0)
-                        win32gui.SendMessage(hwnd, win32con.WM_KEYUP, ord('N'), 0)
-                        return True
-            except Exception:
-                pass
-            return False
-
-        def watch_permission_dialog(stop_event):
-            """권한 팝업이 나타날 때까지 대기 후 N 키를 눌러 닫음"""
-            while not stop_event.is_set():
-                if handle_permission_dialog():
-                    break
-                time.sleep(0.3)
-
-        for i, hwp_file in enumerate(hwp_files, 1):
-            if self.stop_requested:
-                self.log("⏹️ 변환을 중단합니다.")
-                break
-
-            filename = os.path.basename(hwp_file)
-            filename_without_ext = os.path.splitext(filename)[0]
-            output_path = os.path.join(output_folder, f"{filename_without_ext}.pdf")
-            file_ext = os.path.splitext(filename)[1].lower()
-
-            self.progress_var.set(f"한글 파일 변환 중... ({i}/{total_files}) {filename}")
-            self.log(f"[{i}/{total_files}] 변환 중: {filename}")
+        def on_start(job):
+            total_files = self.describe_total(files, file_type)
+            total_text = "?" if total_files is None else total_files - len(skipped)
+            self.set_progress(f"{label} 파일 변환 중... ({job['index']}/{total_text}) {job['filename']}")
+            self.log(f"[{job['index']}/{total_text}] 변환 중: {job['filename']}")
+
+        async def consume():
+            nonlocal success_count
+            async for result in convert_many(
+                    files, output_folder, file_type=file_type, should_stop=lambda: self.stop_requested,
+                    log=self.log, timeout=self.get_file_timeout(), session=self.get_session(), **self.pool_options(),
+                    manifest=self.manifest, journal=self.journal, leases=self.leases, stager=self.stager,
+                    cache=self.pdf_cache, split_pages=self.get_split_pages(), order=self.get_order(),
+                    cost_model=self.cost_model, on_start=on_start,
+                    on_instance=self.report.add_instance if self.report is not None else None):
+                if result["status"] == "skipped":
+                    skipped.append(result)
+                    continue
+                if self.report is not None:
+                    self.report.add(result)
+                self.log_result(result)
+                if result["status"] == "done":
+                    success_count += 1
+                else:
+                    failed_files.append(result["filename"])
+
+        # 작업 스레드마다 자체 이벤트 루프에서 결과를 받음
+        asyncio.run(consume())
+
+        if self.stop_requested:
+            self.log("⏹️ 변환을 중단합니다.")
+        if skipped:
+            self.log(f"⏭️ 변경되지 않은 {label} 파일 {len(skipped)}개를 건너뛰었습니다.")
 
-            try:
-                hwp_file_abs = os.path.abspath(hwp_file)
-                output_path_abs = os.path.abspath(output_path)
-                open_opts = "versionwarning:false;securitywarning:false;updatechecking:false;passworddlg:false;repair:false"
-                
-                stop_event = threading.Event()
-                watcher = threading.Thread(target=watch_permission_dialog, args=(stop_event,))
-                watcher.daemon = True
-                watcher.start()
-
-                # HWPX 파일은 다른 형식으로 열기
-                if file_ext == '.hwpx':
-                    hwp.Open(hwp_file_abs, "HWPX", open_opts)
-                else:
-                    hwp.Open(hwp_file_abs, "HWP", open_opts)
-
-                stop_event.set()
-                watcher.join(timeout=0.1)
-
-                # 추가로 권한 대화상자가 남아있는지 확인
-                for _ in range(20):  # 약 6초 동안 재확인
-                    if handle_permission_dialog():
-                        time.sleep(0.3)
-                    else:
-                        break
-                    
-                hwp.SaveAs(output_path_abs, "PDF", "")
-                hwp.Clear(1)
-
-                success_count += 1
-                self.log(f"✅ {filename} 변환 완료")
-            except Exception as e:
-                failed_files.append(filename)
-                self.log(f"❌ {filename} 변환 실패: {e}")
-                try:
-                    hwp.Clear(1)
-                except:
-                    pass
+        return success_count, failed_files
 
-        try:
-            hwp.Quit()
-        except:
-            pass
+    def log_result(self, result):
+        if result["status"] == "done":
+            if result.get("cached"):
+                self.log(f"✅ {result['filename']} 변환 완료 (캐시)")
+            elif result.get("dialog_count"):
+                self.log(f"✅ {result['filename']} 변환 완료 (대화상자 {result['dialog_count']}개, {result['dialog_time']:.1f}초)")
+            else:
+                self.log(f"✅ {result['filename']} 변환 완료")
+        elif result["status"] == "timeout":
+            self.log(f"⏱️ {result['filename']} 시간 초과: {result['error']}")
+        else:
+            self.log(f"❌ {result['filename']} 변환 실패: {result['error']}")
+
+    def convert_hwp_files(self, hwp_files, output_folder, show_result=True):
+        total_files = self.describe_total(hwp_files, "hwp")
+        if total_files is None:
+            self.log(f"한글 파일을 찾는 대로 변환합니다.\n")
+        else:
+            self.log(f"총 {total_files}개의 한글 파일을 변환합니다.\n")
+
+        success_count, failed_files = self.run_conversion("hwp", hwp_files, output_folder, "한글")
 
         if show_result:
             self.show_conversion_result("한글", success_count, failed_files, output_folder)
@@ -423,64 +765,13 @@ class HwpWordToPdfConverter:
         return success_count, failed_files
 
     def convert_word_files(self, word_files, output_folder, show_result=True):
-        try:
-            import win32com.client
-            self.log("Microsoft Word COM 객체를 사용합니다.")
-        except ImportError:
-            self.log("❌ 오류: win32com 라이브러리가 없습니다.")
-            self.log("pip install pywin32로 설치해주세요.")
-            return 0, []
-
-        total_files = len(word_files)
-        self.log(f"총 {total_files}개의 워드 파일을 변환합니다.\n")
-
-        try:
-            word_app = win32com.client.Dispatch("Word.Application")
-            word_app.Visible = False
-            word_app.DisplayAlerts = False
-        except Exception as e:
-            self.log(f"❌ Microsoft Word 실행 실패: {e}")
-            self.log("Microsoft Word가 설치되어 있는지 확인해주세요.")
-            return 0, []
-
-        success_count = 0
-        failed_files = []
-
-        for i, word_file in enumerate(word_files, 1):
-            if self.stop_requested:
-                self.log("⏹️ 변환을 중단합니다.")
-                break
-
-            filename = os.path.basename(word_file)
-            filename_without_ext = os.path.splitext(filename)[0]
-            output_path = os.path.join(output_folder, f"{filename_without_ext}.pdf")
-
-            self.progress_var.set(f"워드 파일 변환 중... ({i}/{total_files}) {filename}")
-            self.log(f"[{i}/{total_files}] 변환 중: {filename}")
-
-            try:
-                word_file_abs = os.path.abspath(word_file)
-                output_path_abs = os.path.abspath(output_path)
-                
-                doc = word_app.Documents.Open(word_file_abs)
-                doc.SaveAs2(output_path_abs, FileFormat=17)  # 17 = PDF format
-                doc.Close()
-
-                success_count += 1
-                self.log(f"✅ {filename} 변환 완료")
-            except Exception as e:
-                failed_files.append(filename)
-                self.log(f"❌ {filename} 변환 실패: {e}")
-                try:
-                    if 'doc' in locals():
-                        doc.Close()
-                except:
-                    pass
+        total_files = self.describe_total(word_files, "word")
+        if total_files is None:
+            self.log(f"워드 파일을 찾는 대로 변환합니다.\n")
+        else:
+            self.log(f"총 {total_files}개의 워드 파일을 변환합니다.\n")
 
-        try:
-            word_app.Quit()
-        except:
-            pass
+        success_count, failed_files = self.run_conversion("word", word_files, output_folder, "워드")
 
         if show_result:
             self.show_conversion_result("워드", success_count, failed_files, output_folder)
@@ -508,11 +799,12 @@ class HwpWordToPdfConverter:
                     self.log(f"  - {f}")
         
         self.log(f"전체 결과: {total_success}개 성공, {total_failed}개 실패")
+        self.log_report_summary()
         
-        self.progress_var.set(f"일괄 변환 완료! 성공: {total_success}개, 실패: {total_failed}개")
+        self.set_progress(f"일괄 변환 완료! 성공: {total_success}개, 실패: {total_failed}개")
         
         if total_success > 0:
-            messagebox.showinfo("일괄 변환 완료",
+            self.log_sink.call(messagebox.showinfo, "일괄 변환 완료",
                 f"일괄 변환이 완료되었습니다!\n\n"
                 f"한글 파일: {hwp_success}개 성공, {len(hwp_failed)}개 실패\n"
                 f"워드 파일: {word_success}개 성공, {len(word_failed)}개 실패\n"
@@ -526,15 +818,27 @@ class HwpWordToPdfConverter:
             self.log(f"변환 실패: {len(failed_files)}개")
             for f in failed_files:
                 self.log(f"  - {f}")
+        self.log_report_summary()
 
-        self.progress_var.set(f"{file_type} 변환 완료! 성공: {success_count}개, 실패: {len(failed_files)}개")
+        self.set_progress(f"{file_type} 변환 완료! 성공: {success_count}개, 실패: {len(failed_files)}개")
         if success_count > 0:
-            messagebox.showinfo("변환 완료",
+            self.log_sink.call(messagebox.showinfo, "변환 완료",
                 f"{file_type} 파일 변환이 완료되었습니다!\n\n"
                 f"성공: {success_count}개\n"
                 f"실패: {len(failed_files)}개\n\n"
                 f"PDF 파일은 다음 폴더에 저장됨:\n{output_folder}")
 
+    def log_report_summary(self):
+        """사전 검사 결과와 단계별 시간 요약 (백분위수, 가장 느린 파일) 표시"""
+        from run_report import RunReport
+        if self.report is None:
+            return
+        if self.scanner is not None:
+            for line in RunReport.format_preflight(self.scanner.preflight_results()):
+                self.log(line)
+        for line in self.report.format_summary():
+            self.log(line)
+
     def conversion_finished(self):
         self.is_converting = False
         self.update_button_state()  # 변환 완료 후 버튼 상태 업데이트
@@ -542,6 +846,12 @@ class HwpWordToPdfConverter:
 
 
 def main():
+    multiprocessing.freeze_support()
+    if len(sys.argv) > 1:
+        # 인자가 있으면 명령줄 모드로 넘김 (이 창 모듈은 이미 tkinter를 불러왔으므로
+        # 창 없는 PC/작업 스케줄러에서는 cli.py나 to_pdf.py를 직접 실행)
+        from cli import main as cli_main
+        sys.exit(cli_main())
     if sys.platform != "win32":
         messagebox.showerror("오류", "이 프로그램은 Windows에서만 실행 가능합니다.")
         return
@@ -553,4 +863,4 @@ def main():
         pass
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
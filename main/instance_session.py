@@ -0,0 +1,153 @@
+import time
+import threading
+from contextlib import contextmanager
+
+from engine import ConversionPool
+
+# 이 시간(초) 동안 쓰지 않은 변환기 인스턴스는 종료
+DEFAULT_IDLE_TIMEOUT = 600
+TYPE_LABELS = {"hwp": "한글", "word": "워드"}
+
+
+class _Slot:
+    """변환 종류 하나의 풀과 그 풀을 쓰는 배치 사이의 잠금"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pool = None
+        self.key = None
+        self.last_used = time.monotonic()
+
+
+class InstanceSession:
+    """프로그램이 켜져 있는 동안 한글/워드 변환기 인스턴스를 배치 사이에 유지
+
+    변환할 때마다 한글/워드를 새로 띄우고 끝에 종료하는 대신, 종류별 워커 풀을 한 번
+    띄워 두고 다음 배치에서 상태를 확인한 뒤 그대로 쓴다. prewarm()으로 미리 띄워 둘 수
+    있으며, idle_timeout초 동안 쓰지 않은 풀과 close() 때 남은 풀은 종료한다.
+    워커 수나 재시작 기준 등 풀 설정이 바뀌면 기존 풀을 닫고 새로 띄운다.
+    """
+
+    def __init__(self, idle_timeout=DEFAULT_IDLE_TIMEOUT, health_timeout=60, log=None):
+        self.idle_timeout = idle_timeout or None
+        self.health_timeout = health_timeout
+        self.log = log or (lambda message: None)
+        self._slots = {}
+        self._slots_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._idle_thread = None
+
+    def _slot(self, file_type):
+        with self._slots_lock:
+            if self._closed.is_set():
+                raise RuntimeError("변환기 세션이 이미 종료되었습니다.")
+            if self._idle_thread is None and self.idle_timeout:
+                self._idle_thread = threading.Thread(target=self._idle_loop, daemon=True)
+                self._idle_thread.start()
+            return self._slots.setdefault(file_type, _Slot())
+
+    @staticmethod
+    def _pool_key(workers, backend, backend_options, max_documents, max_rss_mb):
+        options = tuple(sorted((backend_options or {}).items()))
+        return max(1, int(workers)), backend, options, max_documents or None, max_rss_mb or None
+
+    def _ensure_pool(self, slot, file_type, workers, backend, backend_options, timeout,
+                     max_documents, max_rss_mb, log, on_instance):
+        """설정이 같고 응답하는 풀이면 그대로, 아니면 새로 띄운 풀 반환 (slot.lock 안에서 호출)"""
+        key = self._pool_key(workers, backend, backend_options, max_documents, max_rss_mb)
+        pool = slot.pool
+        if pool is not None and slot.key != key:
+            self.log(f"{TYPE_LABELS.get(file_type, file_type)} 변환기 설정이 바뀌어 다시 시작합니다.")
+            self._close_pool(slot)
+            pool = None
+        if pool is not None:
+            pool.log = log or self.log
+            pool.on_instance = on_instance
+            if not pool.health_check(self.health_timeout):
+                self.log(f"⚠️ {TYPE_LABELS.get(file_type, file_type)} 변환기가 응답하지 않아 다시 시작합니다.")
+                self._close_pool(slot)
+                pool = None
+        if pool is None:
+            pool = ConversionPool(file_type, workers=workers, backend=backend, backend_options=backend_options,
+                                  log=log or self.log, max_documents=max_documents, max_rss_mb=max_rss_mb,
+                                  on_instance=on_instance)
+            pool.start()
+            slot.pool, slot.key = pool, key
+        pool.timeout = timeout or None
+        return pool
+
+    @contextmanager
+    def pool(self, file_type, workers=1, backend="com", backend_options=None, log=None, timeout=None,
+             max_documents=None, max_rss_mb=None, on_instance=None):
+        """ConversionPool 대신 쓰는 컨텍스트: 켜 둔 풀을 빌려 주고 끝나도 닫지 않음"""
+        slot = self._slot(file_type)
+        with slot.lock:
+            pool = self._ensure_pool(slot, file_type, workers, backend, backend_options, timeout,
+                                     max_documents, max_rss_mb, log, on_instance)
+            try:
+                yield pool
+            finally:
+                pool.log = self.log
+                pool.on_instance = None
+                slot.last_used = time.monotonic()
+                # 변환 중에 세션이 닫혔으면 (close()가 건너뛴 풀) 여기서 종료
+                if self._closed.is_set():
+                    self._close_pool(slot)
+
+    def prewarm(self, file_types=("hwp", "word"), **options):
+        """변환기를 백그라운드에서 미리 띄움 (options는 pool()과 같음)"""
+        def warm(file_type):
+            try:
+                with self.pool(file_type, **options) as pool:
+                    if pool.health_check(self.health_timeout):
+                        self.log(f"{TYPE_LABELS.get(file_type, file_type)} 변환기를 미리 띄워 두었습니다.")
+            except Exception as e:
+                self.log(f"⚠️ {TYPE_LABELS.get(file_type, file_type)} 변환기를 미리 띄우지 못했습니다: {e}")
+
+        threads = [threading.Thread(target=warm, args=(file_type,), daemon=True) for file_type in file_types]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    def _close_pool(self, slot):
+        if slot.pool is not None:
+            slot.pool.close()
+        slot.pool = slot.key = None
+
+    def _idle_loop(self):
+        interval = min(30.0, self.idle_timeout / 4)
+        while not self._closed.wait(interval):
+            with self._slots_lock:
+                slots = list(self._slots.items())
+            for file_type, slot in slots:
+                if slot.pool is None or time.monotonic() - slot.last_used < self.idle_timeout:
+                    continue
+                # 변환 중인 풀은 건너뜀
+                if not slot.lock.acquire(blocking=False):
+                    continue
+                try:
+                    if slot.pool is not None and time.monotonic() - slot.last_used >= self.idle_timeout:
+                        self.log(f"💤 {TYPE_LABELS.get(file_type, file_type)} 변환기를 "
+                                 f"{self.idle_timeout / 60:g}분 동안 쓰지 않아 종료합니다.")
+                        self._close_pool(slot)
+                finally:
+                    slot.lock.release()
+
+    def close(self, wait=30):
+        """켜 둔 변환기를 모두 종료
+
+        변환 중인 풀은 wait초까지 끝나길 기다리고, 그래도 쓰는 중이면 닫지 않고 건너뛴다
+        (빌려 간 배치가 풀을 돌려줄 때 닫음).
+        """
+        with self._slots_lock:
+            self._closed.set()
+            slots = list(self._slots.items())
+        for file_type, slot in slots:
+            if not slot.lock.acquire(timeout=wait):
+                self.log(f"⚠️ {TYPE_LABELS.get(file_type, file_type)} 변환기가 아직 변환 중이라 "
+                         f"변환이 끝난 뒤 종료합니다.")
+                continue
+            try:
+                self._close_pool(slot)
+            finally:
+                slot.lock.release()
@@ -0,0 +1,586 @@
+import os
+import hmac
+import json
+import time
+import uuid
+import shutil
+import hashlib
+import secrets
+import sqlite3
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from app_paths import app_data_dir
+from engine import make_job, stem_index
+from instance_session import InstanceSession
+from preflight import check, describe
+from scanner import FILE_TYPES
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 47615
+DEFAULT_URL = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}"
+DB_NAME = "jobs.sqlite3"
+MAX_UPLOAD_BYTES = 512 * 1024 * 1024
+MAX_LIST_LIMIT = 1000
+# 접속 토큰: 서버 데이터 폴더의 TOKEN_FILE (다른 사용자는 TOKEN_ENV 또는 --token으로 전달)
+TOKEN_FILE = "server_token"
+TOKEN_ENV = "TO_PDF_SERVER_TOKEN"
+TOKEN_HEADER = "X-To-Pdf-Token"
+# 클라이언트 키: 사용자별로 만들어 두며, 작업을 보낸 클라이언트만 그 작업을 보고 PDF를 받음
+CLIENT_KEY_FILE = "client_key"
+CLIENT_HEADER = "X-To-Pdf-Client"
+
+QUEUED = "queued"
+RUNNING = "running"
+CANCELLED = "cancelled"
+REJECTED = "rejected"
+# 끝난 작업 상태 (변환 결과 done/failed/timeout 포함)
+FINISHED = ("done", "failed", "timeout", CANCELLED, REJECTED)
+
+
+class JobServerError(Exception):
+    """서버가 요청을 거절함 (HTTP 4xx/5xx)"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _read_secret(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def _secret(path, create=False):
+    """파일에 저장한 비밀 값 (없고 create면 새로 만들어 소유자만 읽을 수 있게 저장)"""
+    value = _read_secret(path)
+    if value is None and create:
+        value = secrets.token_urlsafe(32)
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            # 다른 프로세스가 먼저 만듦
+            return _read_secret(path)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(value)
+    return value
+
+
+def load_token(data_folder=None, create=False):
+    """서버 접속 토큰 (서버가 처음 시작할 때 데이터 폴더에 만듦, 없으면 None)"""
+    return _secret(os.path.join(data_folder or app_data_dir("server"), TOKEN_FILE), create)
+
+
+def client_key():
+    """이 사용자의 클라이언트 키 (처음 쓸 때 사용자 데이터 폴더에 만듦)"""
+    return _secret(os.path.join(app_data_dir("client"), CLIENT_KEY_FILE), create=True)
+
+
+def _owner(key):
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+class JobStore:
+    """변환 작업 대기열 (SQLite 파일에 저장해 서버를 다시 켜도 남음)
+
+    우선순위가 높은 작업부터, 같으면 먼저 들어온 작업부터 꺼낸다.
+    서버가 비정상 종료돼 실행 중으로 남은 작업은 다시 열 때 대기 상태로 돌린다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                source TEXT NOT NULL, filename TEXT NOT NULL, file_type TEXT,
+                output_folder TEXT NOT NULL, output TEXT,
+                priority INTEGER NOT NULL DEFAULT 0, status TEXT NOT NULL, error TEXT,
+                client TEXT, uploaded INTEGER NOT NULL DEFAULT 0,
+                submitted REAL NOT NULL, started REAL, finished REAL, elapsed REAL, owner TEXT)""")
+        if "owner" not in {row["name"] for row in self._db.execute("PRAGMA table_info(jobs)")}:
+            self._db.execute("ALTER TABLE jobs ADD COLUMN owner TEXT")
+        self._db.execute("CREATE INDEX IF NOT EXISTS jobs_queue ON jobs (status, file_type, priority DESC, id)")
+        self._db.execute("UPDATE jobs SET status = ?, started = NULL WHERE status = ?", (QUEUED, RUNNING))
+
+    def _row(self, row):
+        if row is None:
+            return None
+        job = dict(row)
+        job["uploaded"] = bool(job["uploaded"])
+        return job
+
+    def add(self, source, output_folder, file_type, priority=0, client=None, uploaded=False,
+            status=QUEUED, error=None, owner=None, index=None):
+        job = make_job(source, output_folder, index=index)
+        with self._lock:
+            cursor = self._db.execute(
+                "INSERT INTO jobs (source, filename, file_type, output_folder, output, priority, status, error,"
+                " client, uploaded, submitted, owner) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (job["source"], job["filename"], file_type, os.path.abspath(output_folder), job["output"],
+                 int(priority), status, error, client, int(uploaded), time.time(), owner))
+            return self.get(cursor.lastrowid)
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def get(self, job_id):
+        rows = self._query("SELECT * FROM jobs WHERE id = ?", (job_id,))
+        return self._row(rows[0]) if rows else None
+
+    def list(self, status=None, limit=200, owner=None):
+        where = [(column, value) for column, value in (("status", status), ("owner", owner)) if value]
+        sql = "SELECT * FROM jobs"
+        if where:
+            sql += " WHERE " + " AND ".join(f"{column} = ?" for column, _ in where)
+        rows = self._query(sql + " ORDER BY id DESC LIMIT ?", tuple(value for _, value in where) + (limit,))
+        return [self._row(row) for row in rows]
+
+    def counts(self):
+        return {status: count for status, count in self._query("SELECT status, COUNT(*) FROM jobs GROUP BY status")}
+
+    def has_queued(self, file_type):
+        return bool(self._query("SELECT 1 FROM jobs WHERE status = ? AND file_type = ? LIMIT 1", (QUEUED, file_type)))
+
+    def claim(self, file_type):
+        """가장 먼저 처리할 대기 작업 하나를 실행 중으로 바꿔 반환 (없으면 None)"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT * FROM jobs WHERE status = ? AND file_type = ? ORDER BY priority DESC, id LIMIT 1",
+                (QUEUED, file_type)).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE jobs SET status = ?, started = ? WHERE id = ?", (RUNNING, time.time(), row["id"]))
+        return dict(self._row(row), status=RUNNING)
+
+    def finish(self, job_id, status, error=None, elapsed=None):
+        with self._lock:
+            self._db.execute("UPDATE jobs SET status = ?, error = ?, elapsed = ?, finished = ? WHERE id = ?",
+                             (status, error, elapsed, time.time(), job_id))
+
+    def requeue(self, job_ids):
+        with self._lock:
+            self._db.executemany("UPDATE jobs SET status = ?, started = NULL WHERE id = ? AND status = ?",
+                                 [(QUEUED, job_id, RUNNING) for job_id in job_ids])
+
+    def cancel(self, job_id, owner=None):
+        """대기 중인 작업 취소 (이미 시작했거나 끝났거나 다른 클라이언트의 작업이면 False)"""
+        with self._lock:
+            cursor = self._db.execute(
+                "UPDATE jobs SET status = ?, finished = ? WHERE id = ? AND status = ? AND owner IS ?",
+                (CANCELLED, time.time(), job_id, QUEUED, owner))
+            return cursor.rowcount > 0
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class JobServer:
+    """여러 사용자의 변환 요청을 한 대기열로 받아 공용 변환기 인스턴스로 처리하는 로컬 서버
+
+    localhost에서만 HTTP로 요청을 받는다. 같은 PC의 파일 경로를 보내거나 파일 내용을
+    올릴 수 있으며(올린 파일의 PDF는 /jobs/<id>/pdf로 내려받음), 종류별로 하나의
+    워커 풀을 모든 요청이 함께 쓴다.
+
+    모든 요청에는 데이터 폴더의 접속 토큰(X-To-Pdf-Token)이 있어야 하고, 브라우저가 보낸
+    다른 출처(Origin)의 요청은 거절한다. 작업 조회/취소와 PDF 내려받기는 작업을 보낸
+    클라이언트 키(X-To-Pdf-Client)로만 할 수 있다.
+    """
+
+    def __init__(self, data_folder=None, host=DEFAULT_HOST, port=DEFAULT_PORT, workers=1, backend="com",
+                 backend_options=None, timeout=None, max_documents=None, max_rss_mb=None, preflight=True,
+                 log=None):
+        self.data_folder = data_folder or app_data_dir("server")
+        self.host = host
+        self.port = port
+        self.preflight = preflight
+        self.log = log or (lambda message: None)
+        self.pool_options = {"workers": workers, "backend": backend, "backend_options": backend_options,
+                             "timeout": timeout, "max_documents": max_documents, "max_rss_mb": max_rss_mb}
+        os.makedirs(self.data_folder, exist_ok=True)
+        self.token = load_token(self.data_folder, create=True)
+        self.store = JobStore(os.path.join(self.data_folder, DB_NAME))
+        self.session = InstanceSession(log=self.log)
+        self._wake = {file_type: threading.Event() for file_type in ("hwp", "word")}
+        self._stop = threading.Event()
+        self._httpd = None
+
+    # 작업 접수
+    def submit(self, path, output_folder, priority=0, client=None, uploaded=False, owner=None, index=None):
+        """파일 하나를 대기열에 추가하고 작업 정보 반환 (변환할 수 없는 파일은 rejected로 기록)
+
+        PDF 이름은 여기서 정해 대기열에 저장한다 (index는 원본 폴더의 stem_index 결과).
+        """
+        path = os.path.abspath(path)
+        file_type = FILE_TYPES.get(os.path.splitext(path)[1].lower())
+        error = None
+        if file_type is None:
+            error = "지원하지 않는 파일 형식입니다."
+        elif not os.path.isfile(path):
+            error = "파일이 존재하지 않습니다."
+        elif self.preflight:
+            action, verdict = check(path, file_type)
+            if action == "rejected":
+                error = describe(verdict)
+            elif action == "routed":
+                file_type = verdict.file_type
+        job = self.store.add(path, output_folder, file_type, priority=priority, client=client, uploaded=uploaded,
+                             status=REJECTED if error else QUEUED, error=error, owner=owner, index=index)
+        if not error:
+            self._wake[file_type].set()
+        return job
+
+    def submit_many(self, paths, output_folder, priority=0, client=None, owner=None):
+        """여러 파일을 대기열에 추가 (PDF 이름을 정할 때 원본 폴더 목록은 폴더마다 한 번만 읽음)"""
+        indexes = {}
+        jobs = []
+        for path in paths:
+            folder = os.path.dirname(os.path.abspath(path))
+            if folder not in indexes:
+                indexes[folder] = stem_index(folder)
+            jobs.append(self.submit(path, output_folder, priority=priority, client=client, owner=owner,
+                                    index=indexes[folder]))
+        return jobs
+
+    def submit_upload(self, filename, data, priority=0, client=None, owner=None):
+        """올린 파일을 서버 폴더에 저장하고 대기열에 추가"""
+        folder = os.path.join(self.data_folder, "uploads", uuid.uuid4().hex)
+        os.makedirs(folder)
+        path = os.path.join(folder, os.path.basename(filename))
+        with open(path, "wb") as f:
+            f.write(data)
+        return self.submit(path, folder, priority=priority, client=client, uploaded=True, owner=owner)
+
+    # 변환
+    def _claimed_jobs(self, file_type, claimed):
+        """대기열에서 워커가 받을 준비가 될 때마다 하나씩 꺼냄 (비면 끝)"""
+        while not self._stop.is_set():
+            record = self.store.claim(file_type)
+            if record is None:
+                return
+            claimed.add(record["id"])
+            # 출력 경로는 추가할 때 정해 둔 값을 그대로 씀 (원본 폴더를 다시 읽지 않음)
+            yield {"source": record["source"], "output": record["output"], "filename": record["filename"],
+                   "job_id": record["id"]}
+
+    def _dispatch(self, file_type):
+        while not self._stop.is_set():
+            if not self.store.has_queued(file_type):
+                self._wake[file_type].wait(1.0)
+                self._wake[file_type].clear()
+                continue
+            claimed = set()
+
+            def on_start(job):
+                self.log(f"[{job['job_id']}] 변환 중: {job['filename']}")
+
+            def on_result(result):
+                claimed.discard(result["job_id"])
+                self.store.finish(result["job_id"], result["status"], result.get("error"), result.get("elapsed"))
+                mark = "✅" if result["status"] == "done" else "❌"
+                self.log(f"{mark} [{result['job_id']}] {result['filename']} {result['status']}"
+                         + (f": {result['error']}" if result.get("error") else ""))
+
+            try:
+                with self.session.pool(file_type, log=self.log, **self.pool_options) as pool:
+                    pool.run(self._claimed_jobs(file_type, claimed), on_start=on_start, on_result=on_result,
+                             should_stop=self._stop.is_set)
+            except Exception as e:
+                self.log(f"❌ {file_type} 변환 중 오류: {e}")
+                self._stop.wait(5.0)
+            finally:
+                # 중지로 워커에 전달되지 못한 작업은 다음에 다시 처리
+                self.store.requeue(claimed)
+            if claimed and not self._stop.is_set():
+                # 변환기를 띄우지 못함: 잠시 뒤 다시 시도
+                self._stop.wait(5.0)
+
+    # 실행/종료
+    def start(self):
+        handler = type("Handler", (_RequestHandler,), {"server_app": self})
+        self._httpd = ThreadingHTTPServer((self.host, self.port), handler)
+        self.port = self._httpd.server_address[1]
+        self._threads = [threading.Thread(target=self._httpd.serve_forever, daemon=True)]
+        self._threads += [threading.Thread(target=self._dispatch, args=(file_type,), daemon=True)
+                          for file_type in self._wake]
+        for thread in self._threads:
+            thread.start()
+        self.log(f"🖧 변환 서버 시작: http://{self.host}:{self.port} (대기 중인 작업 {self.store.counts().get(QUEUED, 0)}개)")
+        self.log(f"🔑 접속 토큰: {os.path.join(self.data_folder, TOKEN_FILE)}")
+
+    def serve_forever(self, should_stop=None):
+        self.start()
+        try:
+            while not self._stop.wait(0.5):
+                if should_stop and should_stop():
+                    break
+        finally:
+            self.stop()
+
+    def stop(self):
+        self._stop.set()
+        for event in self._wake.values():
+            event.set()
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+        for thread in getattr(self, "_threads", []):
+            thread.join(timeout=30)
+        self.session.close()
+        self.store.close()
+        self.log("변환 서버 종료")
+
+    def status(self):
+        return {"counts": self.store.counts(), "workers": self.pool_options["workers"],
+                "backend": self.pool_options["backend"]}
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """GET /status, GET /jobs[?status=&limit=], GET /jobs/<id>, GET /jobs/<id>/pdf,
+    POST /jobs (JSON: paths, output_folder, priority), POST /uploads?filename=&priority= (파일 내용),
+    DELETE /jobs/<id>
+
+    모든 요청에 X-To-Pdf-Token, 작업을 다루는 요청에 X-To-Pdf-Client 헤더가 필요하다.
+    """
+
+    server_app = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, data, status=200):
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status, message):
+        self._send_json({"error": message}, status)
+
+    def _route(self):
+        url = urllib.parse.urlsplit(self.path)
+        parts = [p for p in url.path.split("/") if p]
+        return parts, dict(urllib.parse.parse_qsl(url.query))
+
+    def _job_id(self, parts):
+        try:
+            return int(parts[1])
+        except ValueError:
+            return None
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_UPLOAD_BYTES:
+            raise ValueError("파일이 너무 큽니다.")
+        return self.rfile.read(length)
+
+    def _rejected(self):
+        """토큰이 없거나 틀렸거나 다른 출처(브라우저 페이지)에서 온 요청이면 오류 응답을 보내고 True"""
+        app = self.server_app
+        origin = self.headers.get("Origin")
+        if origin is not None and origin not in {f"http://{host}:{app.port}" for host in (app.host, "localhost")}:
+            self._error(403, "다른 출처의 요청은 받지 않습니다.")
+            return True
+        if not hmac.compare_digest(self.headers.get(TOKEN_HEADER, "").encode("utf-8"), app.token.encode("utf-8")):
+            self._error(401, "접속 토큰이 없거나 올바르지 않습니다.")
+            return True
+        return False
+
+    def _owner(self):
+        key = self.headers.get(CLIENT_HEADER)
+        if not key:
+            raise ValueError("클라이언트 키(X-To-Pdf-Client)가 필요합니다.")
+        return _owner(key)
+
+    def _content_type(self, expected):
+        if self.headers.get_content_type() != expected:
+            raise ValueError(f"Content-Type은 {expected}이어야 합니다.")
+
+    def _own_job(self, parts, owner):
+        """요청한 클라이언트의 작업 (없거나 다른 클라이언트의 작업이면 None)"""
+        job = self.server_app.store.get(self._job_id(parts))
+        if job is None or job["owner"] != owner:
+            return None
+        return job
+
+    def do_GET(self):
+        if self._rejected():
+            return None
+        app = self.server_app
+        parts, query = self._route()
+        try:
+            if parts == ["status"]:
+                return self._send_json(app.status())
+            owner = self._owner()
+            if parts == ["jobs"]:
+                try:
+                    limit = int(query.get("limit", 200))
+                except ValueError:
+                    raise ValueError("limit은 정수여야 합니다.") from None
+                if not 1 <= limit <= MAX_LIST_LIMIT:
+                    raise ValueError(f"limit은 1~{MAX_LIST_LIMIT} 사이여야 합니다.")
+                return self._send_json({"jobs": app.store.list(query.get("status"), limit, owner=owner)})
+            if len(parts) in (2, 3) and parts[0] == "jobs":
+                job = self._own_job(parts, owner)
+                if job is None:
+                    return self._error(404, "작업이 없습니다.")
+                if len(parts) == 2:
+                    return self._send_json(job)
+                if parts[2] == "pdf":
+                    if job["status"] != "done" or not os.path.exists(job["output"]):
+                        return self._error(409, "변환된 PDF가 없습니다.")
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/pdf")
+                    self.send_header("Content-Length", str(os.path.getsize(job["output"])))
+                    self.end_headers()
+                    with open(job["output"], "rb") as f:
+                        shutil.copyfileobj(f, self.wfile)
+                    return None
+        except ValueError as e:
+            return self._error(400, str(e))
+        except OSError as e:
+            return self._error(500, str(e))
+        return self._error(404, "알 수 없는 경로입니다.")
+
+    def do_POST(self):
+        if self._rejected():
+            return None
+        app = self.server_app
+        parts, query = self._route()
+        try:
+            owner = self._owner()
+            if parts == ["jobs"]:
+                self._content_type("application/json")
+                request = json.loads(self._body() or b"{}")
+                if not isinstance(request, dict):
+                    raise ValueError("요청 본문은 JSON 객체여야 합니다.")
+                paths = request.get("paths") or []
+                if not isinstance(paths, list) or not all(isinstance(path, str) for path in paths):
+                    raise ValueError("paths는 경로 문자열 목록이어야 합니다.")
+                if not paths or not isinstance(request.get("output_folder"), str):
+                    raise ValueError("paths와 output_folder가 필요합니다.")
+                priority = int(request.get("priority") or 0)
+                jobs = app.submit_many(paths, request["output_folder"], priority=priority,
+                                       client=request.get("client"), owner=owner)
+                return self._send_json({"jobs": jobs}, 201)
+            if parts == ["uploads"]:
+                # 파일 내용은 그대로 보냄 (브라우저가 사전 확인 없이 보낼 수 있는 형식은 받지 않음)
+                self._content_type("application/octet-stream")
+                if not query.get("filename"):
+                    raise ValueError("filename이 필요합니다.")
+                job = app.submit_upload(query["filename"], self._body(), priority=int(query.get("priority", 0)),
+                                        client=query.get("client"), owner=owner)
+                return self._send_json({"jobs": [job]}, 201)
+        except (ValueError, TypeError) as e:
+            return self._error(400, str(e))
+        except OSError as e:
+            return self._error(500, str(e))
+        return self._error(404, "알 수 없는 경로입니다.")
+
+    def do_DELETE(self):
+        if self._rejected():
+            return None
+        parts, _ = self._route()
+        try:
+            owner = self._owner()
+        except ValueError as e:
+            return self._error(400, str(e))
+        if len(parts) == 2 and parts[0] == "jobs":
+            if self.server_app.store.cancel(self._job_id(parts), owner=owner):
+                return self._send_json({"cancelled": True})
+            return self._error(409, "보낸 작업 중 대기 중인 작업만 취소할 수 있습니다.")
+        return self._error(404, "알 수 없는 경로입니다.")
+
+
+class JobClient:
+    """변환 서버에 작업을 보내고 상태를 확인하는 클라이언트
+
+    token을 주지 않으면 TO_PDF_SERVER_TOKEN 환경 변수나 이 사용자의 서버 데이터 폴더에서 읽는다.
+    """
+
+    def __init__(self, url=DEFAULT_URL, timeout=30, client=None, token=None, key=None):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+        self.client = client or f"{os.environ.get('USERNAME') or os.environ.get('USER') or ''}@{os.getpid()}"
+        self.token = token or os.environ.get(TOKEN_ENV) or load_token()
+        self.key = key or client_key()
+
+    def _request(self, method, path, data=None, content_type="application/json"):
+        if not self.token:
+            raise JobServerError(401, f"접속 토큰이 없습니다 (--token 또는 {TOKEN_ENV} 환경 변수로 지정).")
+        request = urllib.request.Request(self.url + path, data=data, method=method)
+        request.add_header(TOKEN_HEADER, self.token)
+        request.add_header(CLIENT_HEADER, self.key)
+        if data is not None:
+            request.add_header("Content-Type", content_type)
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                body = response.read()
+                if response.headers.get_content_type() == "application/json":
+                    return json.loads(body)
+                return body
+        except urllib.error.HTTPError as e:
+            try:
+                message = json.loads(e.read())["error"]
+            except (ValueError, KeyError):
+                message = str(e)
+            raise JobServerError(e.code, message) from None
+
+    def status(self):
+        return self._request("GET", "/status")
+
+    def submit(self, paths, output_folder, priority=0):
+        data = json.dumps({"paths": [os.path.abspath(p) for p in paths], "output_folder": os.path.abspath(output_folder),
+                           "priority": priority, "client": self.client}).encode("utf-8")
+        return self._request("POST", "/jobs", data)["jobs"]
+
+    def upload(self, path, priority=0):
+        query = urllib.parse.urlencode({"filename": os.path.basename(path), "priority": priority, "client": self.client})
+        with open(path, "rb") as f:
+            data = f.read()
+        return self._request("POST", f"/uploads?{query}", data, "application/octet-stream")["jobs"][0]
+
+    def job(self, job_id):
+        return self._request("GET", f"/jobs/{job_id}")
+
+    def jobs(self, status=None):
+        return self._request("GET", "/jobs" + (f"?status={status}" if status else ""))["jobs"]
+
+    def cancel(self, job_id):
+        return self._request("DELETE", f"/jobs/{job_id}")
+
+    def download(self, job_id, output):
+        data = self._request("GET", f"/jobs/{job_id}/pdf")
+        tmp_path = output + ".download.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, output)
+
+    def wait(self, job_ids, poll_interval=1.0, on_result=None, should_stop=None):
+        """작업이 모두 끝날 때까지 기다리며 끝난 순서대로 on_result 호출, 마지막 상태 목록 반환"""
+        remaining = list(job_ids)
+        finished = {}
+        while remaining and not (should_stop and should_stop()):
+            for job_id in list(remaining):
+                job = self.job(job_id)
+                if job["status"] in FINISHED:
+                    remaining.remove(job_id)
+                    finished[job_id] = job
+                    if on_result:
+                        on_result(job)
+            if remaining:
+                time.sleep(poll_interval)
+        return [finished[job_id] for job_id in job_ids if job_id in finished]
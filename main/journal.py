@@ -0,0 +1,115 @@
+import os
+import json
+import time
+import threading
+
+JOURNAL_NAME = ".to_pdf_journal.jsonl"
+
+PENDING = "pending"
+IN_PROGRESS = "in_progress"
+DONE = "done"
+FAILED = "failed"
+
+
+def read_journal(output_folder):
+    """이전 기록의 (실행 정보, 파일별 마지막 상태) 반환. 기록이 없으면 None
+
+    비정상 종료로 마지막 줄이 잘려 있으면 그 줄은 무시한다.
+    """
+    run_info = None
+    states = {}
+    try:
+        with open(os.path.join(output_folder, JOURNAL_NAME), "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if "source" in record:
+                    states[record["source"]] = record
+                elif record.get("event") == "run" and run_info is None:
+                    run_info = {k: v for k, v in record.items() if k not in ("event", "time")}
+    except OSError:
+        return None
+    return run_info or {}, states
+
+
+class Journal:
+    """출력 폴더에 남기는 파일별 변환 상태 기록 (미리 쓰기 로그)
+
+    상태가 바뀔 때마다 한 줄씩 덧붙여 쓰므로 프로그램이 비정상 종료돼도
+    마지막 상태가 남는다. resume=True로 열면 이전 기록을 읽어 완료된 파일을
+    건너뛰고, 실패/진행 중/대기 중이었던 파일과 아직 보지 못한 파일만 변환한다.
+    """
+
+    def __init__(self, output_folder, resume=False, run_info=None, fsync_every=20):
+        self.path = os.path.join(output_folder, JOURNAL_NAME)
+        self.resume = resume
+        self.fsync_every = fsync_every
+        self.run_info = run_info or {}
+        self.states = {}
+        self._lock = threading.Lock()
+        self._unsynced = 0
+        if resume:
+            previous = read_journal(output_folder)
+            if previous is not None:
+                self.run_info, self.states = previous
+        self._file = open(self.path, "a" if resume else "w", encoding="utf-8")
+        if resume:
+            self._write({"event": "resume", "time": time.time()})
+        else:
+            self._write(dict(self.run_info, event="run", time=time.time()))
+
+    def _write(self, record):
+        with self._lock:
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._file.flush()
+            self._unsynced += 1
+            if self._unsynced >= self.fsync_every:
+                os.fsync(self._file.fileno())
+                self._unsynced = 0
+
+    def mark(self, job, state, error=None):
+        record = {
+            "source": job["source"],
+            "output": job["output"],
+            "filename": job["filename"],
+            "state": state,
+            "error": error,
+            "time": time.time(),
+        }
+        with self._lock:
+            self.states[job["source"]] = record
+        self._write(record)
+
+    def mark_result(self, result):
+        state = DONE if result["status"] == "done" else FAILED
+        self.mark(result, state, error=result.get("error"))
+
+    def counts(self):
+        """이전 기록의 상태별 파일 수"""
+        counts = {}
+        with self._lock:
+            for record in self.states.values():
+                counts[record["state"]] = counts.get(record["state"], 0) + 1
+        return counts
+
+    def track(self, jobs, on_skip=None):
+        """작업을 대기 상태로 기록하며 전달 (이어서 변환이면 완료된 파일은 건너뜀)"""
+        for job in jobs:
+            previous = self.states.get(job["source"]) if self.resume else None
+            if previous is not None and previous["state"] == DONE and os.path.exists(job["output"]):
+                if on_skip:
+                    on_skip(job)
+                continue
+            self.mark(job, PENDING)
+            yield job
+
+    def close(self):
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
@@ -0,0 +1,230 @@
+import os
+import json
+import time
+import socket
+import hashlib
+import threading
+
+LEASE_DIR_NAME = ".to_pdf_leases"
+DEFAULT_LEASE_SECONDS = 120
+
+CLAIMED = "claimed"
+HELD = "held"
+FINISHED = "finished"
+FAILED = "failed"
+
+
+def _signature(path):
+    st = os.stat(path)
+    # 네트워크 드라이브마다 수정시각 정밀도가 달라 초 단위로 비교
+    return st.st_size, int(st.st_mtime)
+
+
+class LeaseBoard:
+    """공유 출력 폴더의 임대(lease) 파일로 여러 PC/프로세스가 파일을 나눠 변환
+
+    파일마다 출력 폴더의 .to_pdf_leases 아래에 임대 파일을 배타적으로 만든 쪽만 그 파일을
+    변환한다. 변환하는 동안 주기적으로 임대 파일의 수정시각을 갱신하며, lease_seconds 동안
+    갱신되지 않은 임대는 그 PC가 죽은 것으로 보고 다른 PC가 회수한다.
+    변환에 성공한 파일은 결과 기록을 남겨 두므로 원본이 바뀌지 않는 한 다시 변환하지 않는다.
+    실패(시간 초과 포함)한 파일은 이번 실행에서는 다른 PC가 다시 시도하지 않고, 다음 실행에서
+    다시 변환한다. PC들의 시계가 맞아 있어야 한다 (도메인 PC는 보통 자동으로 맞춰짐).
+    """
+
+    def __init__(self, output_folder, lease_seconds=DEFAULT_LEASE_SECONDS, node=None, log=None):
+        self.output_folder = os.path.abspath(output_folder)
+        self.folder = os.path.join(self.output_folder, LEASE_DIR_NAME)
+        self.lease_seconds = lease_seconds
+        self.node = node or f"{socket.gethostname()}-{os.getpid()}"
+        self.log = log or (lambda message: None)
+        self.waiting = []
+        self.finished_elsewhere = 0
+        self.failed_elsewhere = 0
+        self.started = time.time()
+        self._held = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._heartbeat = None
+        os.makedirs(self.folder, exist_ok=True)
+
+    def _key(self, job):
+        # 쪽 구간 작업은 원래 문서 단위로, 로컬에 임시 저장하는 작업은 최종 경로로 임대
+        job = job.get("parent", job)
+        relpath = os.path.relpath(job.get("final_output", job["output"]), self.output_folder)
+        return hashlib.sha1(relpath.replace("\\", "/").lower().encode("utf-8")).hexdigest()
+
+    def _lease_path(self, key):
+        return os.path.join(self.folder, key + ".lease")
+
+    def _result_path(self, key):
+        return os.path.join(self.folder, key + ".json")
+
+    def _finished(self, key, job):
+        """다른 PC(또는 이전 실행)가 이미 변환한 파일이면 FINISHED, 이번 실행 중 다른 PC가 실패한
+        파일이면 FAILED, 아니면 None (원본이 바뀌었거나 이전 실행에서 실패했으면 None)"""
+        try:
+            with open(self._result_path(key), "r", encoding="utf-8") as f:
+                record = json.load(f)
+            if record.get("signature") != list(_signature(job["source"])):
+                return None
+        except (OSError, ValueError):
+            return None
+        if record.get("state") == "done":
+            return FINISHED
+        if record.get("finished", 0) >= self.started:
+            return FAILED
+        return None
+
+    def _expired(self, path):
+        try:
+            return time.time() - os.stat(path).st_mtime > self.lease_seconds
+        except FileNotFoundError:
+            return True
+
+    def _reclaim(self, lease):
+        """만료된 임대를 치움 (여러 PC가 동시에 회수해도 이름 바꾸기는 한 쪽만 성공)"""
+        stale = f"{lease}.{self.node}.stale"
+        try:
+            os.rename(lease, stale)
+        except OSError:
+            return False
+        try:
+            if not self._expired(stale):
+                # 그 사이 다른 PC가 회수하고 새로 잡은 임대였음: 되돌려 놓음
+                os.rename(stale, lease)
+                return False
+            with open(stale, "r", encoding="utf-8") as f:
+                owner = json.load(f).get("node")
+        except (OSError, ValueError):
+            owner = None
+        try:
+            os.remove(stale)
+        except OSError:
+            pass
+        self.log(f"♻️ 응답 없는 노드({owner or '알 수 없음'})의 임대를 회수합니다.")
+        return True
+
+    def _try_claim(self, job):
+        key = self._key(job)
+        with self._lock:
+            if key in self._held:
+                return CLAIMED
+        state = self._finished(key, job)
+        if state is not None:
+            return state
+        lease = self._lease_path(key)
+        for _ in range(2):
+            try:
+                fd = os.open(lease, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                if not self._expired(lease) or not self._reclaim(lease):
+                    return HELD
+        else:
+            return HELD
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"node": self.node, "source": job["source"], "acquired": time.time()}, f, ensure_ascii=False)
+        # 확인과 임대 사이에 다른 PC가 끝냈을 수 있음
+        state = self._finished(key, job)
+        if state is not None:
+            self._remove(lease)
+            return state
+        with self._lock:
+            self._held[key] = lease
+        self._start_heartbeat()
+        return CLAIMED
+
+    def claim(self, jobs, on_skip=None):
+        """임대를 잡은 작업만 전달 (다른 PC가 변환 중인 작업은 waiting에 모아 둠)"""
+        for job in jobs:
+            state = self._try_claim(job)
+            if state == CLAIMED:
+                yield job
+            elif state == HELD:
+                self.waiting.append(job)
+            elif job.get("chunk", 0) == 0:
+                self._count(state)
+                if on_skip:
+                    on_skip(job.get("parent", job))
+
+    def _count(self, state):
+        if state == FINISHED:
+            self.finished_elsewhere += 1
+        else:
+            self.failed_elsewhere += 1
+
+    def reclaim_waiting(self, should_stop=None, poll_interval=None):
+        """다른 PC가 잡은 작업이 끝나길 기다리며, 그 PC가 죽어 임대가 만료된 작업을 묶음으로 내놓음"""
+        poll_interval = poll_interval or max(1.0, self.lease_seconds / 4)
+        if self.waiting:
+            self.log(f"⏳ 다른 PC가 변환 중인 {len(self.waiting)}개 파일이 끝나길 기다립니다.")
+        while self.waiting and not (should_stop and should_stop()):
+            claimed = []
+            for job in list(self.waiting):
+                state = self._try_claim(job)
+                if state != HELD:
+                    self.waiting.remove(job)
+                if state == CLAIMED:
+                    claimed.append(job)
+                elif state != HELD and job.get("chunk", 0) == 0:
+                    self._count(state)
+            if claimed:
+                yield claimed
+            elif self.waiting:
+                time.sleep(poll_interval)
+
+    def complete(self, result):
+        """변환 결과를 기록하고 임대 해제 (실패한 파일은 이번 실행에서만 다른 PC가 다시 시도하지 않음)"""
+        key = self._key(result)
+        with self._lock:
+            lease = self._held.pop(key, None)
+        try:
+            record = {"state": "done" if result["status"] == "done" else "failed", "node": self.node,
+                      "signature": list(_signature(result["source"])), "error": result.get("error"),
+                      "finished": time.time()}
+            tmp_path = f"{self._result_path(key)}.{self.node}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(record, f, ensure_ascii=False)
+            os.replace(tmp_path, self._result_path(key))
+        except OSError as e:
+            self.log(f"⚠️ {result['filename']} 분산 변환 결과 기록 실패: {e}")
+        if lease is not None:
+            self._remove(lease)
+
+    def _start_heartbeat(self):
+        with self._lock:
+            if self._heartbeat is None:
+                self._heartbeat = threading.Thread(target=self._heartbeat_loop, daemon=True)
+                self._heartbeat.start()
+
+    def _heartbeat_loop(self):
+        while not self._stop.wait(self.lease_seconds / 3):
+            with self._lock:
+                held = list(self._held.items())
+            for key, lease in held:
+                try:
+                    os.utime(lease)
+                except FileNotFoundError:
+                    self.log("⚠️ 임대 파일이 사라졌습니다 (다른 PC가 회수했을 수 있음).")
+                    with self._lock:
+                        self._held.pop(key, None)
+                except OSError:
+                    pass
+
+    def close(self):
+        """하트비트를 멈추고 아직 잡고 있는 임대를 풀어 다른 PC가 가져가게 함"""
+        self._stop.set()
+        if self._heartbeat is not None:
+            self._heartbeat.join(timeout=5)
+        with self._lock:
+            held = list(self._held.values())
+            self._held.clear()
+        for lease in held:
+            self._remove(lease)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
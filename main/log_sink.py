@@ -0,0 +1,86 @@
+import os
+import threading
+import logging
+import logging.handlers
+from collections import deque
+
+from app_paths import app_data_dir
+
+LOG_FILE_NAME = "convert.log"
+LOG_FILE_MAX_BYTES = 5 * 1024 * 1024
+LOG_FILE_BACKUP_COUNT = 5
+
+
+def default_log_file():
+    return os.path.join(app_data_dir("logs"), LOG_FILE_NAME)
+
+
+class LogSink:
+    """작업 스레드가 Tk 위젯을 건드리지 않고 로그/진행 상태/UI 작업을 넘기는 큐
+
+    메인 루프가 drain()으로 일정 간격마다 모아서 처리한다. 로그와 UI 작업은 한 큐에 넣은
+    순서대로 꺼내므로, UI 작업은 그보다 먼저 쓴 로그가 모두 화면에 반영된 뒤에 실행된다.
+    전체 로그는 회전 파일에 바로 기록된다.
+    """
+
+    def __init__(self, log_file=None, max_bytes=LOG_FILE_MAX_BYTES, backup_count=LOG_FILE_BACKUP_COUNT):
+        # (UI 작업 또는 None, 로그 문자열 또는 인자) 순서대로 쌓음 (꺼내는 쪽은 메인 스레드 하나)
+        self._entries = deque()
+        self._progress = None
+        self._progress_lock = threading.Lock()
+        self.log_file = log_file
+        self._logger = None
+        if log_file:
+            try:
+                handler = logging.handlers.RotatingFileHandler(
+                    log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+            except OSError:
+                self.log_file = None
+            else:
+                handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+                self._logger = logging.getLogger(f"to_pdf.{id(self)}")
+                self._logger.propagate = False
+                self._logger.setLevel(logging.INFO)
+                self._logger.addHandler(handler)
+
+    def write(self, message):
+        self._entries.append((None, message))
+        if self._logger is not None:
+            self._logger.info(message)
+
+    def set_progress(self, text):
+        # 진행 상태는 마지막 값만 의미가 있으므로 덮어씀
+        with self._progress_lock:
+            self._progress = text
+
+    def call(self, func, *args):
+        """메인 스레드에서 실행할 UI 작업 예약"""
+        self._entries.append((func, args))
+
+    def drain(self, max_messages=1000):
+        """(로그 목록, 새 진행 상태 또는 None, UI 작업 목록) 반환
+
+        로그를 먼저 반영하고 UI 작업을 실행하는 쪽에 맞춰, UI 작업 뒤에 쓴 로그나
+        max_messages를 넘는 로그는 다음 drain()으로 미룬다.
+        """
+        messages = []
+        calls = []
+        while self._entries:
+            func, item = self._entries[0]
+            if func is None:
+                if calls or len(messages) >= max_messages:
+                    break
+                messages.append(item)
+            else:
+                calls.append((func, item))
+            self._entries.popleft()
+        with self._progress_lock:
+            progress, self._progress = self._progress, None
+        return messages, progress, calls
+
+    def close(self):
+        if self._logger is not None:
+            for handler in list(self._logger.handlers):
+                handler.close()
+                self._logger.removeHandler(handler)
+            self._logger = None
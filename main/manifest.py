@@ -0,0 +1,118 @@
+import os
+import json
+import hashlib
+import threading
+
+MANIFEST_NAME = ".to_pdf_manifest.json"
+MANIFEST_VERSION = 1
+
+
+def file_hash(path, chunk_size=1024 * 1024):
+    """파일 내용의 SHA-256 해시"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _stat_signature(path):
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns
+
+
+class Manifest:
+    """출력 폴더에 저장되는 변환 기록 (원본 크기/수정시각/해시와 결과 PDF)"""
+
+    def __init__(self, output_folder, autosave_every=50):
+        self.path = os.path.join(output_folder, MANIFEST_NAME)
+        self.autosave_every = autosave_every
+        self.entries = {}
+        self._dirty = 0
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == MANIFEST_VERSION:
+            self.entries = data.get("files", {})
+
+    def save(self):
+        with self._lock:
+            data = {"version": MANIFEST_VERSION, "files": self.entries}
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self._dirty = 0
+
+    def is_up_to_date(self, source, output):
+        """원본과 PDF가 마지막 변환 이후 그대로인지 확인"""
+        source = os.path.abspath(source)
+        with self._lock:
+            entry = self.entries.get(source)
+        if not entry or entry.get("output") != os.path.abspath(output):
+            return False
+        try:
+            if list(_stat_signature(output)) != [entry["pdf_size"], entry["pdf_mtime_ns"]]:
+                return False
+            size, mtime_ns = _stat_signature(source)
+        except OSError:
+            return False
+        if size != entry["size"]:
+            return False
+        if mtime_ns == entry["mtime_ns"]:
+            return True
+        # 수정시각만 바뀐 경우(복사/touch) 내용 해시로 재확인
+        try:
+            if file_hash(source) != entry["sha256"]:
+                return False
+        except OSError:
+            return False
+        with self._lock:
+            entry["mtime_ns"] = mtime_ns
+            self._dirty += 1
+        return True
+
+    def record(self, source, output):
+        """변환 성공한 파일 기록"""
+        source = os.path.abspath(source)
+        output = os.path.abspath(output)
+        size, mtime_ns = _stat_signature(source)
+        pdf_size, pdf_mtime_ns = _stat_signature(output)
+        entry = {
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "sha256": file_hash(source),
+            "output": output,
+            "pdf_size": pdf_size,
+            "pdf_mtime_ns": pdf_mtime_ns,
+        }
+        with self._lock:
+            self.entries[source] = entry
+            self._dirty += 1
+            should_save = self._dirty >= self.autosave_every
+        if should_save:
+            self.save()
+
+    def iter_changed(self, jobs, on_skip=None):
+        """변경된 작업만 차례로 생성 (건너뛴 작업은 on_skip으로 전달)"""
+        for job in jobs:
+            if self.is_up_to_date(job["source"], job["output"]):
+                if on_skip:
+                    on_skip(job)
+            else:
+                yield job
+
+    def filter_jobs(self, jobs):
+        """변경되지 않은 작업을 걸러 (변환할 작업, 건너뛴 작업) 반환"""
+        skipped = []
+        to_convert = list(self.iter_changed(jobs, on_skip=skipped.append))
+        return to_convert, skipped
@@ -0,0 +1,119 @@
+import os
+import re
+import math
+import struct
+import zipfile
+
+from preflight import CompoundFile, OLE_SIGNATURE, PreflightError
+
+# 이 쪽 수를 넘는 워드 문서는 구간으로 나눠 여러 인스턴스에서 동시에 변환
+DEFAULT_SPLIT_PAGES = 500
+MIN_CHUNK_PAGES = 50
+# 구간 PDF를 합칠 때 메모리에 올려도 되는 합친 PDF의 예상 크기 상한 (merge_pdfs 참고)
+MAX_MERGE_MB = 1024
+# 쪽 수로 PDF 크기를 어림할 때 쓰는 쪽당 크기 (텍스트 위주 문서보다 넉넉하게)
+ESTIMATED_PAGE_BYTES = 50 * 1024
+
+SUMMARY_INFORMATION = "\x05SummaryInformation"
+PIDSI_PAGECOUNT = 14
+VT_I4 = 3
+
+
+def _docx_page_count(path):
+    with zipfile.ZipFile(path) as zf:
+        data = zf.read("docProps/app.xml")[:65536]
+    match = re.search(rb"<(?:\w+:)?Pages>(\d+)</", data)
+    return int(match.group(1)) if match else None
+
+
+def _doc_page_count(path):
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        if f.read(8) != OLE_SIGNATURE:
+            return None
+        cf = CompoundFile(f, size)
+        if SUMMARY_INFORMATION not in cf.entries:
+            return None
+        data = cf.read_stream(SUMMARY_INFORMATION, 4096)
+    # 속성 집합 헤더(28바이트) 다음 첫 구역의 (FMTID, 오프셋)
+    section = struct.unpack_from("<I", data, 44)[0]
+    _, count = struct.unpack_from("<II", data, section)
+    for i in range(count):
+        property_id, offset = struct.unpack_from("<II", data, section + 8 + i * 8)
+        if property_id == PIDSI_PAGECOUNT:
+            value_type, value = struct.unpack_from("<Hxxi", data, section + offset)
+            return value if value_type == VT_I4 else None
+    return None
+
+
+def estimate_pages(path):
+    """워드가 마지막으로 저장할 때 문서에 기록한 쪽 수 (알 수 없으면 None)"""
+    ext = os.path.splitext(path)[1].lower()
+    try:
+        if ext == ".docx":
+            return _docx_page_count(path)
+        if ext == ".doc":
+            return _doc_page_count(path)
+    except (OSError, KeyError, ValueError, struct.error, zipfile.BadZipFile, PreflightError):
+        return None
+    return None
+
+
+def plan_chunks(pages, workers, min_chunk_pages=MIN_CHUNK_PAGES):
+    """쪽 수를 워커 수 이하의 (시작 쪽, 끝 쪽) 구간으로 나눔"""
+    count = max(1, min(workers, pages // min_chunk_pages))
+    size = math.ceil(pages / count)
+    return [(start, min(start + size - 1, pages)) for start in range(1, pages + 1, size)]
+
+
+def chunk_jobs(job, chunks):
+    """변환 작업 하나를 구간별 작업으로 나눔 (구간 PDF는 출력 폴더의 숨김 파일)"""
+    folder, name = os.path.split(job["output"])
+    base = os.path.splitext(name)[0]
+    parent = {k: v for k, v in job.items() if k != "index"}
+    for i, (start, end) in enumerate(chunks):
+        yield dict(parent, output=os.path.join(folder, f".{base}.part{i + 1:03d}.pdf"),
+                   filename=f"{job['filename']} [{start}-{end}쪽]", page_from=start, page_to=end,
+                   last=i == len(chunks) - 1, chunk=i, chunks=len(chunks), parent=parent)
+
+
+def fits_in_merge(path, pages, max_mb=MAX_MERGE_MB):
+    """합친 PDF의 예상 크기(원본 크기와 쪽 수 어림값 중 큰 쪽)가 max_mb 이하인지"""
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        size = 0
+    return max(size, pages * ESTIMATED_PAGE_BYTES) <= max_mb * 1024 * 1024
+
+
+def merge_available():
+    try:
+        import pypdf  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def merge_pdfs(parts, output):
+    """구간별 PDF를 순서대로 이어 붙여 output에 저장하고 전체 쪽 수 반환 (pypdf 필요)
+
+    스트리밍으로 합치지 않는다: pypdf는 모든 구간의 쪽 객체를 메모리에 올린 뒤 한 번에 쓰므로
+    합친 PDF 크기 이상의 메모리가 필요하다. 그래서 예상 크기가 MAX_MERGE_MB를 넘는 문서는
+    나누지 않는다 (fits_in_merge). 결과는 임시 파일에 쓴 뒤 교체한다.
+    """
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    for part in parts:
+        writer.append(part)
+    pages = len(writer.pages)
+    tmp_path = output + ".merge.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            writer.write(f)
+        os.replace(tmp_path, output)
+    finally:
+        writer.close()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return pages
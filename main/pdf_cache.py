@@ -0,0 +1,150 @@
+import os
+import json
+import time
+import shutil
+import hashlib
+import threading
+
+from app_paths import app_data_dir
+from manifest import file_hash
+
+CACHE_DIR_NAME = "pdf_cache"
+INDEX_NAME = "index.json"
+INDEX_VERSION = 1
+DEFAULT_CACHE_MB = 2048
+
+
+class PdfCache:
+    """입력 파일 내용 + 변환기 버전을 키로 변환된 PDF를 보관하는 공용 캐시
+
+    같은 문서가 여러 폴더에 복사돼 있거나 다른 출력 폴더로 다시 변환할 때
+    한글/워드를 거치지 않고 캐시의 PDF를 복사해 내보낸다. 하드링크로 내보내면 출력 PDF끼리
+    같은 파일을 공유해, 하나를 제자리에서 덮어쓸 때 다른 폴더의 PDF까지 바뀌므로 항상 복사한다.
+    전체 크기가 max_bytes를 넘으면 가장 오래 쓰지 않은 항목부터 지운다.
+    """
+
+    def __init__(self, folder, max_bytes=DEFAULT_CACHE_MB * 1024 * 1024, autosave_every=50):
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self.autosave_every = autosave_every
+        self.index_path = os.path.join(folder, INDEX_NAME)
+        self.entries = {}
+        self._dirty = 0
+        self._lock = threading.Lock()
+        os.makedirs(folder, exist_ok=True)
+        self.load()
+
+    @classmethod
+    def default(cls, max_mb=DEFAULT_CACHE_MB):
+        return cls(app_data_dir(CACHE_DIR_NAME), max_bytes=max_mb * 1024 * 1024)
+
+    def load(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == INDEX_VERSION:
+            self.entries = data.get("entries", {})
+
+    def save(self):
+        with self._lock:
+            data = {"version": INDEX_VERSION, "entries": self.entries}
+            tmp_path = self.index_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.index_path)
+            self._dirty = 0
+
+    def _path(self, key):
+        return os.path.join(self.folder, key[:2], key + ".pdf")
+
+    def _touch(self):
+        # 호출하는 쪽이 잠금을 잡고 있어야 함
+        self._dirty += 1
+        return self._dirty >= self.autosave_every
+
+    def total_bytes(self):
+        with self._lock:
+            return sum(entry["size"] for entry in self.entries.values())
+
+    def key(self, source, version):
+        """원본 내용 해시와 변환기 버전으로 만든 캐시 키"""
+        return hashlib.sha256(f"{file_hash(source)}:{version}".encode("utf-8")).hexdigest()
+
+    def fetch(self, key, output):
+        """캐시에 있으면 output으로 내보내고 True (항목이 손상됐으면 지우고 False)"""
+        path = self._path(key)
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return False
+            try:
+                st = os.stat(path)
+                valid = (st.st_size, st.st_mtime_ns) == (entry["size"], entry["mtime_ns"])
+            except OSError:
+                valid = False
+            if not valid:
+                # 캐시 파일이 다른 곳에서 바뀌었거나 지워짐
+                del self.entries[key]
+                self._remove(path)
+                self._dirty += 1
+                return False
+            entry["last_used"] = time.time()
+            should_save = self._touch()
+
+        os.makedirs(os.path.dirname(output), exist_ok=True)
+        tmp_path = output + ".cache.tmp"
+        try:
+            shutil.copyfile(path, tmp_path)
+            os.replace(tmp_path, output)
+        except OSError:
+            self._remove(tmp_path)
+            raise
+        if should_save:
+            self.save()
+        return True
+
+    def store(self, key, pdf_path):
+        """변환된 PDF를 캐시에 복사해 두고 용량을 넘으면 오래된 항목 삭제"""
+        if self.max_bytes <= 0:
+            return
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 출력 파일은 나중에 덮어써질 수 있으므로 복사본을 보관
+        tmp_path = path + ".tmp"
+        shutil.copyfile(pdf_path, tmp_path)
+        os.replace(tmp_path, path)
+        st = os.stat(path)
+        with self._lock:
+            self.entries[key] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "last_used": time.time()}
+            self._evict()
+            should_save = self._touch()
+        if should_save:
+            self.save()
+
+    def _evict(self):
+        """max_bytes 이하가 될 때까지 가장 오래 쓰지 않은 항목 삭제 (잠금 안에서 호출)"""
+        total = sum(entry["size"] for entry in self.entries.values())
+        if total <= self.max_bytes:
+            return
+        for key, entry in sorted(self.entries.items(), key=lambda item: item[1]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            self._remove(self._path(key))
+            del self.entries[key]
+            total -= entry["size"]
+
+    def clear(self):
+        with self._lock:
+            for key in list(self.entries):
+                self._remove(self._path(key))
+            self.entries = {}
+            self._dirty += 1
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
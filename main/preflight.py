@@ -0,0 +1,256 @@
+import os
+import struct
+import zipfile
+from collections import namedtuple
+
+OLE_SIGNATURE = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+ZIP_SIGNATURES = (b"PK\x03\x04", b"PK\x05\x06")
+HWP_SIGNATURE = b"HWP Document File"
+
+# CFB 섹터 번호 중 실제 섹터를 가리키는 최대값 (그 위는 체인 끝/빈 섹터 표시)
+MAX_REGSECT = 0xFFFFFFFA
+MAX_DIRECTORY_SECTORS = 4096
+
+# HWP 5.0 FileHeader 속성 비트
+HWP_FLAG_PASSWORD = 1 << 1
+HWP_FLAG_DISTRIBUTION = 1 << 2
+HWP_FLAG_DRM = 1 << 4
+HWP_FLAG_CERT_ENCRYPTION = 1 << 8
+HWP_FLAG_CERT_DRM = 1 << 10
+
+# Word FIB 플래그 (fEncrypted, fObfuscated)
+DOC_IDENT = 0xA5EC
+DOC_FLAG_ENCRYPTED = 0x0100
+DOC_FLAG_OBFUSCATED = 0x8000
+
+PROBLEM_LABELS = {
+    "empty": "빈 파일",
+    "truncated": "잘린 파일",
+    "corrupt": "손상된 파일",
+    "encrypted": "암호가 걸린 문서",
+    "drm": "DRM 보안 문서",
+    "unknown": "알 수 없는 형식",
+    "unreadable": "읽을 수 없음",
+    "distribution": "배포용 문서",
+}
+# 변환기에 넘기지 않는 문제 (배포용 문서는 열리는 경우가 있어 경고만 함)
+BLOCKING_PROBLEMS = frozenset(PROBLEM_LABELS) - {"distribution"}
+
+Verdict = namedtuple("Verdict", ["format", "file_type", "problem", "detail"])
+
+
+class PreflightError(Exception):
+    def __init__(self, problem, detail):
+        super().__init__(detail)
+        self.problem = problem
+
+
+class CompoundFile:
+    """OLE 복합 문서(CFB)에서 디렉터리와 작은 스트림 앞부분만 읽는 최소 구현"""
+
+    def __init__(self, f, size):
+        self.f = f
+        self.size = size
+        f.seek(0)
+        header = f.read(512)
+        if len(header) < 512:
+            raise PreflightError("truncated", "복합 문서 헤더가 잘렸습니다.")
+        sector_shift, mini_shift = struct.unpack_from("<HH", header, 0x1E)
+        if sector_shift not in (9, 12) or mini_shift != 6:
+            raise PreflightError("corrupt", "복합 문서 헤더가 올바르지 않습니다.")
+        self.sector_size = 1 << sector_shift
+        (num_fat, self.first_dir, _, self.mini_cutoff, self.first_minifat, _,
+         first_difat, _) = struct.unpack_from("<8I", header, 0x2C)
+
+        per_sector = self.sector_size // 4
+        fat_sectors = list(struct.unpack_from("<109I", header, 0x4C))
+        sid, seen = first_difat, set()
+        while len(fat_sectors) < num_fat and sid <= MAX_REGSECT:
+            if sid in seen:
+                raise PreflightError("corrupt", "DIFAT 체인이 순환합니다.")
+            seen.add(sid)
+            values = struct.unpack(f"<{per_sector}I", self._read_sector(sid))
+            fat_sectors.extend(values[:-1])
+            sid = values[-1]
+        self.fat_sectors = fat_sectors[:num_fat]
+        self._fat = {}
+        self._minifat = None
+        self._mini_chain = None
+        self.entries = self._read_directory()
+
+    def _read_sector(self, sid):
+        offset = (sid + 1) * self.sector_size
+        if offset + self.sector_size > self.size:
+            raise PreflightError("truncated", "파일이 복합 문서 구조보다 짧습니다.")
+        self.f.seek(offset)
+        return self.f.read(self.sector_size)
+
+    def _next(self, sid):
+        per_sector = self.sector_size // 4
+        index = sid // per_sector
+        if index >= len(self.fat_sectors):
+            raise PreflightError("corrupt", "섹터 번호가 FAT 범위를 벗어났습니다.")
+        if index not in self._fat:
+            self._fat[index] = struct.unpack(f"<{per_sector}I", self._read_sector(self.fat_sectors[index]))
+        return self._fat[index][sid % per_sector]
+
+    def _chain(self, start, limit=None):
+        sid, count = start, 0
+        while sid <= MAX_REGSECT:
+            count += 1
+            if count > (limit or self.size // self.sector_size + 1):
+                raise PreflightError("corrupt", "섹터 체인이 순환합니다.")
+            yield sid
+            sid = self._next(sid)
+
+    def _read_directory(self):
+        entries = {}
+        for sid in self._chain(self.first_dir, MAX_DIRECTORY_SECTORS):
+            data = self._read_sector(sid)
+            for offset in range(0, len(data), 128):
+                raw = data[offset:offset + 128]
+                name_length, entry_type = struct.unpack_from("<HB", raw, 0x40)
+                if entry_type == 0 or not 2 <= name_length <= 64:
+                    continue
+                name = raw[:name_length - 2].decode("utf-16-le", "replace")
+                start, size = struct.unpack_from("<II", raw, 0x74)
+                entries.setdefault(name, (entry_type, start, size))
+        if "Root Entry" not in entries:
+            raise PreflightError("corrupt", "복합 문서에 루트 항목이 없습니다.")
+        return entries
+
+    def read_stream(self, name, length):
+        """스트림 앞부분 length바이트"""
+        _, start, size = self.entries[name]
+        length = min(length, size)
+        chunks, total = [], 0
+        if size < self.mini_cutoff:
+            if self._minifat is None:
+                self._minifat = []
+                for sid in self._chain(self.first_minifat):
+                    data = self._read_sector(sid)
+                    self._minifat.extend(struct.unpack(f"<{len(data) // 4}I", data))
+                _, root_start, _ = self.entries["Root Entry"]
+                self._mini_chain = list(self._chain(root_start))
+            per_sector = self.sector_size // 64
+            sid, seen = start, set()
+            while total < length and sid <= MAX_REGSECT:
+                if sid in seen or sid >= len(self._minifat) or sid // per_sector >= len(self._mini_chain):
+                    raise PreflightError("corrupt", f"{name} 스트림이 손상됐습니다.")
+                seen.add(sid)
+                sector = self._read_sector(self._mini_chain[sid // per_sector])
+                offset = (sid % per_sector) * 64
+                chunks.append(sector[offset:offset + 64])
+                total += 64
+                sid = self._minifat[sid]
+        else:
+            for sid in self._chain(start):
+                if total >= length:
+                    break
+                chunks.append(self._read_sector(sid))
+                total += self.sector_size
+        data = b"".join(chunks)[:length]
+        if len(data) < length:
+            raise PreflightError("truncated", f"{name} 스트림이 잘렸습니다.")
+        return data
+
+
+def _sniff_ole(f, size):
+    cf = CompoundFile(f, size)
+    if "FileHeader" in cf.entries:
+        header = cf.read_stream("FileHeader", 40)
+        if not header.startswith(HWP_SIGNATURE):
+            return Verdict("hwp", "hwp", "corrupt", "HWP 파일 헤더 서명이 올바르지 않습니다.")
+        flags = struct.unpack_from("<I", header, 36)[0]
+        if flags & (HWP_FLAG_PASSWORD | HWP_FLAG_CERT_ENCRYPTION):
+            return Verdict("hwp", "hwp", "encrypted", "암호가 설정된 HWP 문서입니다.")
+        if flags & (HWP_FLAG_DRM | HWP_FLAG_CERT_DRM):
+            return Verdict("hwp", "hwp", "drm", "DRM 보안이 적용된 HWP 문서입니다.")
+        if flags & HWP_FLAG_DISTRIBUTION:
+            return Verdict("hwp", "hwp", "distribution", "배포용 HWP 문서입니다 (저장/인쇄가 제한될 수 있음).")
+        return Verdict("hwp", "hwp", None, None)
+    if "EncryptedPackage" in cf.entries:
+        # 암호가 걸린 docx/hwpx 등은 OLE 안에 암호화된 ZIP을 담음
+        return Verdict("ooxml", "word", "encrypted", "암호가 설정된 Office 문서입니다.")
+    if "WordDocument" in cf.entries:
+        fib = cf.read_stream("WordDocument", 12)
+        # FibBase: wIdent(0), nFib, unused, lid, pnNext, 플래그(0x0A)
+        ident = struct.unpack_from("<H", fib, 0)[0]
+        flags = struct.unpack_from("<H", fib, 0x0A)[0]
+        if ident != DOC_IDENT:
+            return Verdict("doc", "word", "corrupt", "Word 문서 헤더(FIB)가 올바르지 않습니다.")
+        if flags & (DOC_FLAG_ENCRYPTED | DOC_FLAG_OBFUSCATED):
+            return Verdict("doc", "word", "encrypted", "암호가 설정된 Word 문서입니다.")
+        return Verdict("doc", "word", None, None)
+    return Verdict("ole", None, "unknown", "한글/워드 문서가 아닌 OLE 파일입니다.")
+
+
+def _sniff_zip(path):
+    try:
+        with zipfile.ZipFile(path) as zf:
+            names = set(zf.namelist())
+            mimetype = zf.read("mimetype")[:64] if "mimetype" in names else b""
+    except zipfile.BadZipFile as e:
+        return Verdict("zip", None, "corrupt", f"ZIP 구조가 손상됐거나 잘렸습니다: {e}")
+    except (KeyError, zipfile.LargeZipFile, NotImplementedError, RuntimeError) as e:
+        return Verdict("zip", None, "corrupt", str(e))
+    if mimetype.startswith(b"application/hwp+zip") or "Contents/content.hpf" in names:
+        if "Contents/header.xml" not in names:
+            return Verdict("hwpx", "hwp", "corrupt", "HWPX 필수 항목(Contents/header.xml)이 없습니다.")
+        return Verdict("hwpx", "hwp", None, None)
+    if "[Content_Types].xml" in names and "word/document.xml" in names:
+        return Verdict("docx", "word", None, None)
+    if "[Content_Types].xml" in names:
+        return Verdict("ooxml", None, "unknown", "Word 문서가 아닌 Office 파일입니다.")
+    return Verdict("zip", None, "unknown", "한글/워드 문서가 아닌 ZIP 파일입니다.")
+
+
+def sniff(path):
+    """파일 앞부분(과 ZIP 중앙 디렉터리)만 읽어 실제 형식과 문제 판별"""
+    try:
+        size = os.path.getsize(path)
+        if size == 0:
+            return Verdict(None, None, "empty", "크기가 0인 파일입니다.")
+        with open(path, "rb") as f:
+            head = f.read(512)
+            if head.startswith(OLE_SIGNATURE):
+                return _sniff_ole(f, size)
+    except PreflightError as e:
+        return Verdict("ole", None, e.problem, str(e))
+    except OSError as e:
+        return Verdict(None, None, "unreadable", str(e))
+
+    if head.startswith(ZIP_SIGNATURES):
+        return _sniff_zip(path)
+    if head.startswith(HWP_SIGNATURE):
+        # HWP 3.x 이하 문서
+        return Verdict("hwp3", "hwp", None, None)
+    if head.startswith(b"{\\rtf"):
+        return Verdict("rtf", "word", None, None)
+    text = head.lstrip(b"\xef\xbb\xbf \t\r\n").lower()
+    if text.startswith(b"<"):
+        if b"hwpml" in text:
+            return Verdict("hwpml", "hwp", None, None)
+        # Word XML/HTML로 저장한 .doc
+        return Verdict("markup", "word", None, None)
+    return Verdict(None, None, "unknown", "한글/워드 문서 형식이 아닙니다.")
+
+
+def check(path, expected_type):
+    """(처리 방법, 판별 결과) 반환. 처리 방법은 ok/warning/routed/rejected
+
+    확장자와 실제 형식이 다르면 실제 형식의 변환기로 보낸다(routed).
+    """
+    verdict = sniff(path)
+    if verdict.problem in BLOCKING_PROBLEMS:
+        return "rejected", verdict
+    if verdict.file_type and verdict.file_type != expected_type:
+        return "routed", verdict
+    if verdict.problem:
+        return "warning", verdict
+    return "ok", verdict
+
+
+def describe(verdict):
+    label = PROBLEM_LABELS.get(verdict.problem, verdict.problem or "")
+    return f"{label}: {verdict.detail}" if verdict.detail else label
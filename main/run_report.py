@@ -0,0 +1,185 @@
+import os
+import csv
+import json
+import time
+import threading
+
+from preflight import Verdict, describe
+
+# 파일별 단계 (dialog는 열기 중에 처리된 대화상자 시간으로 open과 겹침)
+FILE_STAGES = ("open", "dialog", "save", "close")
+# 변환기 인스턴스 단계
+INSTANCE_STAGES = ("startup", "quit")
+
+STAGE_LABELS = {
+    "startup": "시작",
+    "open": "열기",
+    "dialog": "대화상자",
+    "save": "PDF 저장",
+    "close": "닫기",
+    "quit": "종료",
+}
+
+PREFLIGHT_MARKS = {"rejected": "⛔", "routed": "↪️", "warning": "⚠️"}
+
+CSV_FIELDS = ["file_type", "filename", "status", "error", "elapsed", "worker",
+              "input_size", "output_size"] + [f"{stage}_time" for stage in FILE_STAGES] + ["source", "output"]
+
+
+def percentile(values, q):
+    """정렬된 값 목록의 q 백분위수 (선형 보간)"""
+    if not values:
+        return None
+    if len(values) == 1:
+        return values[0]
+    position = (len(values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+class RunReport:
+    """한 번의 변환 실행에 대한 파일별/단계별 시간 기록과 요약"""
+
+    def __init__(self, output_folder, slowest_count=5):
+        self.output_folder = output_folder
+        self.slowest_count = slowest_count
+        self.started_at = time.time()
+        self._started = time.perf_counter()
+        self.results = []
+        self.instances = []
+        self.preflight = []
+        self._lock = threading.Lock()
+
+    def add(self, result):
+        with self._lock:
+            self.results.append(result)
+
+    def add_instance(self, stats):
+        """변환기 인스턴스 시작/종료 시간 기록"""
+        with self._lock:
+            self.instances.append(stats)
+
+    def add_preflight(self, entries):
+        """사전 검사에서 제외/경로 변경/경고된 파일 기록"""
+        with self._lock:
+            self.preflight.extend(entries)
+
+    def summary(self):
+        with self._lock:
+            results = list(self.results)
+            instances = list(self.instances)
+            preflight = list(self.preflight)
+
+        elapsed = sorted(r["elapsed"] for r in results if r.get("elapsed") is not None)
+        stage_totals = {stage: 0.0 for stage in INSTANCE_STAGES + FILE_STAGES}
+        for r in results:
+            for stage, seconds in (r.get("timings") or {}).items():
+                stage_totals[stage] = stage_totals.get(stage, 0.0) + seconds
+        for instance in instances:
+            for stage in INSTANCE_STAGES:
+                stage_totals[stage] += instance.get(stage) or 0.0
+
+        slowest = sorted((r for r in results if r.get("elapsed") is not None),
+                         key=lambda r: r["elapsed"], reverse=True)[:self.slowest_count]
+        recycled = [i for i in instances if i.get("recycle_reason")]
+        reclaimed = sum(i["rss_before"] - i["rss_after"] for i in recycled
+                        if i.get("rss_before") is not None and i.get("rss_after") is not None)
+        statuses = {}
+        for r in results:
+            statuses[r["status"]] = statuses.get(r["status"], 0) + 1
+
+        return {
+            "started_at": self.started_at,
+            "wall_seconds": time.perf_counter() - self._started,
+            "files": len(results),
+            "statuses": statuses,
+            "instances": len(instances),
+            "recycles": len(recycled),
+            "reclaimed_bytes": max(0, reclaimed),
+            "stage_totals": stage_totals,
+            "elapsed_total": sum(elapsed),
+            "p50": percentile(elapsed, 50),
+            "p95": percentile(elapsed, 95),
+            "p99": percentile(elapsed, 99),
+            "input_bytes": sum(r.get("input_size") or 0 for r in results),
+            "output_bytes": sum(r.get("output_size") or 0 for r in results),
+            "slowest": [{"filename": r["filename"], "elapsed": r["elapsed"]} for r in slowest],
+            "preflight": preflight,
+        }
+
+    def format_summary(self, summary=None):
+        """로그에 표시할 요약 문장 목록"""
+        summary = summary or self.summary()
+        lines = self.format_preflight(summary["preflight"])
+        if not summary["files"]:
+            return lines
+        lines += [
+            f"⏱️ 전체 {summary['wall_seconds']:.1f}초, 파일당 p50 {summary['p50'] or 0:.2f}초"
+            f" / p95 {summary['p95'] or 0:.2f}초 / p99 {summary['p99'] or 0:.2f}초",
+        ]
+        stages = [f"{STAGE_LABELS[stage]} {seconds:.1f}초"
+                  for stage, seconds in summary["stage_totals"].items() if seconds]
+        if stages:
+            lines.append("단계별 합계: " + ", ".join(stages))
+        if summary["recycles"]:
+            lines.append(f"♻️ 변환기 재시작 {summary['recycles']}회, 메모리 {summary['reclaimed_bytes'] / 1048576:.0f}MB 회수")
+        lines.append(f"입력 {summary['input_bytes'] / 1048576:.1f}MB → PDF {summary['output_bytes'] / 1048576:.1f}MB")
+        if summary["slowest"]:
+            lines.append("가장 오래 걸린 파일: " + ", ".join(
+                f"{s['filename']} ({s['elapsed']:.1f}초)" for s in summary["slowest"]))
+        return lines
+
+    @staticmethod
+    def format_preflight(entries, limit=20):
+        if not entries:
+            return []
+        counts = {}
+        for entry in entries:
+            counts[entry["action"]] = counts.get(entry["action"], 0) + 1
+        lines = [f"🔎 사전 검사: 제외 {counts.get('rejected', 0)}개, 다른 변환기로 보냄 {counts.get('routed', 0)}개, "
+                 f"경고 {counts.get('warning', 0)}개"]
+        for entry in entries[:limit]:
+            mark = PREFLIGHT_MARKS[entry["action"]]
+            if entry["action"] == "routed":
+                lines.append(f"  {mark} {entry['filename']}: 실제 형식 {entry['format']}")
+            else:
+                lines.append(f"  {mark} {entry['filename']}: {describe(Verdict(entry['format'], None, entry['problem'], entry['detail']))}")
+        if len(entries) > limit:
+            lines.append(f"  ... 외 {len(entries) - limit}개")
+        return lines
+
+    def write(self, basename=None):
+        """출력 폴더에 JSONL/CSV 보고서를 쓰고 (jsonl 경로, csv 경로) 반환"""
+        if basename is None:
+            stamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(self.started_at))
+            basename = f"to_pdf_report_{stamp}"
+        jsonl_path = os.path.join(self.output_folder, basename + ".jsonl")
+        csv_path = os.path.join(self.output_folder, basename + ".csv")
+        summary = self.summary()
+
+        with self._lock:
+            results = list(self.results)
+            instances = list(self.instances)
+
+        with open(jsonl_path, "w", encoding="utf-8") as f:
+            for r in results:
+                f.write(json.dumps(dict(r, record="file"), ensure_ascii=False) + "\n")
+            for instance in instances:
+                f.write(json.dumps(dict(instance, record="instance"), ensure_ascii=False) + "\n")
+            for entry in summary["preflight"]:
+                f.write(json.dumps(dict(entry, record="preflight"), ensure_ascii=False) + "\n")
+            summary_record = {k: v for k, v in summary.items() if k != "preflight"}
+            f.write(json.dumps(dict(summary_record, record="summary"), ensure_ascii=False) + "\n")
+
+        # 엑셀에서 한글이 깨지지 않도록 BOM 포함
+        with open(csv_path, "w", encoding="utf-8-sig", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            for r in results:
+                row = dict(r)
+                for stage in FILE_STAGES:
+                    row[f"{stage}_time"] = (r.get("timings") or {}).get(stage)
+                writer.writerow(row)
+
+        return jsonl_path, csv_path
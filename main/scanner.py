@@ -0,0 +1,175 @@
+import os
+import threading
+from collections import namedtuple
+
+from backends import HWP_EXTENSIONS, WORD_EXTENSIONS
+from preflight import check
+
+FILE_TYPES = {ext: "hwp" for ext in HWP_EXTENSIONS}
+FILE_TYPES.update({ext: "word" for ext in WORD_EXTENSIONS})
+
+ScannedFile = namedtuple("ScannedFile", ["path", "relpath", "file_type", "size"])
+
+
+def iter_files(folder, recursive=False, errors=None):
+    """os.scandir로 폴더를 한 번만 훑으며 변환 대상 파일을 바로바로 생성"""
+    root = os.path.abspath(folder)
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            it = os.scandir(current)
+        except OSError as e:
+            if current == root:
+                raise
+            if errors is not None:
+                errors.append((current, e))
+            continue
+        subdirs = []
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            subdirs.append(entry.path)
+                        continue
+                    file_type = FILE_TYPES.get(os.path.splitext(entry.name)[1].lower())
+                    if file_type is None or not entry.is_file():
+                        continue
+                    size = entry.stat().st_size
+                except OSError as e:
+                    if errors is not None:
+                        errors.append((entry.path, e))
+                    continue
+                yield ScannedFile(entry.path, os.path.relpath(entry.path, root), file_type, size)
+        stack.extend(reversed(subdirs))
+
+
+class FolderScanner:
+    """입력 폴더를 백그라운드에서 한 번만 스캔하고 결과를 세션 동안 캐시
+
+    여러 소비자(한글/워드 변환)가 동시에 files()를 순회할 수 있으며,
+    스캔이 끝나기 전에도 이미 찾은 파일부터 받아 갈 수 있다.
+    preflight=True면 파일 헤더를 검사해 손상/암호 파일은 빼고, 확장자와 실제
+    형식이 다른 파일은 실제 형식의 종류로 내보낸다 (결과는 preflight_results).
+    """
+
+    BATCH_SIZE = 64
+
+    def __init__(self, folder, recursive=False, preflight=False):
+        self.folder = os.path.abspath(folder)
+        self.recursive = recursive
+        self.preflight = preflight
+        self.errors = []
+        self.error = None
+        self.done = False
+
+        self._items = []
+        self._preflight_results = []
+        self._counts = {"hwp": 0, "word": 0}
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def matches(self, folder, recursive, preflight=False):
+        return self.folder == os.path.abspath(folder) and self.recursive == recursive and self.preflight == preflight
+
+    def start(self):
+        with self._cond:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._scan, name="folder-scanner")
+            self._thread.daemon = True
+        self._thread.start()
+
+    def _scan(self):
+        batch = []
+        try:
+            for item in iter_files(self.folder, self.recursive, self.errors):
+                if self.preflight:
+                    item = self._check(item)
+                    if item is None:
+                        continue
+                batch.append(item)
+                # 첫 파일은 바로 내보내 변환이 즉시 시작되도록 함
+                if len(batch) >= self.BATCH_SIZE or not self._items:
+                    self._publish(batch)
+                    batch = []
+        except OSError as e:
+            self.error = e
+        finally:
+            self._publish(batch, done=True)
+
+    def _check(self, item):
+        """헤더 검사 결과에 따라 파일을 그대로/다른 종류로 내보내거나 제외(None)"""
+        action, verdict = check(item.path, item.file_type)
+        if action == "ok":
+            return item
+        with self._cond:
+            self._preflight_results.append({
+                "filename": item.relpath,
+                "source": item.path,
+                "file_type": item.file_type,
+                "action": action,
+                "format": verdict.format,
+                "problem": verdict.problem,
+                "detail": verdict.detail,
+            })
+        if action == "rejected":
+            return None
+        if action == "routed":
+            return item._replace(file_type=verdict.file_type)
+        return item
+
+    def preflight_results(self):
+        """지금까지의 사전 검사에서 문제가 있었던 파일 목록"""
+        with self._cond:
+            return list(self._preflight_results)
+
+    def _publish(self, batch, done=False):
+        with self._cond:
+            self._items.extend(batch)
+            for item in batch:
+                self._counts[item.file_type] += 1
+            if done:
+                self.done = True
+            self._cond.notify_all()
+
+    def files(self, file_type=None):
+        """스캔된 파일을 찾는 즉시 생성 (file_type: "hwp"/"word"/None)"""
+        self.start()
+        index = 0
+        while True:
+            with self._cond:
+                while index >= len(self._items) and not self.done:
+                    self._cond.wait()
+                if index >= len(self._items):
+                    if self.error is not None:
+                        raise self.error
+                    return
+                items = self._items[index:]
+                index = len(self._items)
+            for item in items:
+                if file_type is None or item.file_type == file_type:
+                    yield item
+
+    def has_files(self, file_type=None):
+        """해당 종류의 파일이 하나라도 있는지 (찾는 즉시 반환)"""
+        for _ in self.files(file_type):
+            return True
+        return False
+
+    def count(self, file_type=None):
+        """지금까지 찾은 파일 수"""
+        with self._cond:
+            if file_type is None:
+                return len(self._items)
+            return self._counts[file_type]
+
+    def wait(self):
+        """스캔 완료까지 대기"""
+        self.start()
+        with self._cond:
+            while not self.done:
+                self._cond.wait()
+        if self.error is not None:
+            raise self.error
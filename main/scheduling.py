@@ -0,0 +1,129 @@
+import os
+import json
+import heapq
+import threading
+
+from app_paths import app_data_dir
+
+ORDER_POLICIES = ("scan", "largest", "smallest", "cost")
+ORDER_LABELS = {
+    "scan": "스캔 순서",
+    "largest": "큰 파일 먼저",
+    "smallest": "작은 파일 먼저",
+    "cost": "예상 시간 긴 파일 먼저",
+}
+
+COST_HISTORY_NAME = "cost_history.json"
+
+# 기록이 없을 때 쓰는 대략적인 값 (파일당 고정 비용 + 바이트당 비용)
+DEFAULT_FIXED_COST = 1.0
+DEFAULT_BYTE_COST = 2e-6
+
+
+class CostModel:
+    """확장자별 변환 시간 = 고정 비용 + 바이트당 비용 × 크기 (과거 실행 결과로 최소제곱 적합)"""
+
+    def __init__(self, path=None):
+        self.path = path
+        self.sums = {}
+        self._lock = threading.Lock()
+        if path:
+            self.load()
+
+    @classmethod
+    def default(cls):
+        return cls(os.path.join(app_data_dir(), COST_HISTORY_NAME))
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.sums = json.load(f)
+        except (OSError, ValueError):
+            self.sums = {}
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.sums, f)
+            os.replace(tmp_path, self.path)
+
+    def update(self, results):
+        """성공한 변환 결과(input_size, elapsed)로 기록 갱신"""
+        with self._lock:
+            for r in results:
+                if r.get("status") != "done" or r.get("elapsed") is None or r.get("input_size") is None:
+                    continue
+                ext = os.path.splitext(r["source"])[1].lower()
+                s = self.sums.setdefault(ext, {"n": 0, "x": 0.0, "y": 0.0, "xx": 0.0, "xy": 0.0})
+                x, y = float(r["input_size"]), float(r["elapsed"])
+                s["n"] += 1
+                s["x"] += x
+                s["y"] += y
+                s["xx"] += x * x
+                s["xy"] += x * y
+
+    def coefficients(self, ext):
+        """(고정 비용, 바이트당 비용)"""
+        s = self.sums.get(ext)
+        if not s or s["n"] == 0:
+            return DEFAULT_FIXED_COST, DEFAULT_BYTE_COST
+        n = s["n"]
+        mean_y = s["y"] / n
+        denominator = n * s["xx"] - s["x"] * s["x"]
+        if n < 2 or denominator <= 0:
+            return mean_y, 0.0
+        slope = max(0.0, (n * s["xy"] - s["x"] * s["y"]) / denominator)
+        intercept = max(0.0, (s["y"] - slope * s["x"]) / n)
+        return intercept, slope
+
+    def predict(self, job):
+        fixed, per_byte = self.coefficients(os.path.splitext(job["source"])[1].lower())
+        return fixed + per_byte * job.get("size", 0)
+
+
+def _with_size(job):
+    if "size" not in job:
+        try:
+            job["size"] = os.stat(job["source"]).st_size
+        except OSError:
+            job["size"] = 0
+    return job
+
+
+def order_jobs(jobs, policy, cost_model=None):
+    """정책에 따라 작업 순서 정렬 (scan이면 그대로)"""
+    if policy == "scan":
+        return list(jobs)
+    jobs = [_with_size(job) for job in jobs]
+    if policy == "largest":
+        return sorted(jobs, key=lambda job: job["size"], reverse=True)
+    if policy == "smallest":
+        return sorted(jobs, key=lambda job: job["size"])
+    if policy == "cost":
+        model = cost_model or CostModel()
+        return sorted(jobs, key=model.predict, reverse=True)
+    raise ValueError(f"알 수 없는 처리 순서: {policy}")
+
+
+def estimate_seconds(jobs, workers, cost_model=None):
+    """주어진 순서대로 먼저 비는 워커에 배정할 때의 예상 전체 소요 시간(초)"""
+    model = cost_model or CostModel()
+    finish_times = [0.0] * max(1, workers)
+    for job in jobs:
+        earliest = heapq.heappop(finish_times)
+        heapq.heappush(finish_times, earliest + model.predict(_with_size(job)))
+    return max(finish_times)
+
+
+def format_duration(seconds):
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}초"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}분 {seconds}초"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}시간 {minutes}분"
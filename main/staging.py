@@ -0,0 +1,142 @@
+import os
+import sys
+import queue
+import shutil
+import uuid
+import threading
+
+from app_paths import app_data_dir
+
+DEFAULT_MOVE_THREADS = 4
+DEFAULT_MOVE_BATCH = 16
+DRIVE_REMOTE = 4
+
+
+def is_remote_path(path):
+    """네트워크 공유(UNC 경로 또는 네트워크 드라이브)인지 확인"""
+    path = os.path.abspath(path)
+    if path.startswith(("\\\\", "//")):
+        return True
+    if sys.platform != "win32":
+        return False
+    try:
+        import ctypes
+        root = os.path.splitdrive(path)[0] + "\\"
+        return ctypes.windll.kernel32.GetDriveTypeW(root) == DRIVE_REMOTE
+    except (ImportError, AttributeError, OSError):
+        return False
+
+
+class OutputStager:
+    """변환기는 로컬 임시 폴더에 PDF를 쓰고, 완성된 PDF만 백그라운드에서 출력 폴더로 옮김
+
+    출력 폴더가 느린 네트워크 공유여도 변환기가 원격 쓰기를 기다리지 않고, 중단되더라도
+    출력 폴더에 쓰다 만 PDF가 남지 않는다. 옮길 때는 대상 폴더에 임시 이름으로 복사한 뒤
+    이름을 바꾼다. 최종 PDF 이름은 작업을 만들 때 정해진 것(engine.output_name)을 그대로 쓴다.
+    """
+
+    def __init__(self, staging_folder=None, threads=DEFAULT_MOVE_THREADS, batch_size=DEFAULT_MOVE_BATCH, log=None):
+        self.folder = os.path.join(staging_folder or app_data_dir("staging"), uuid.uuid4().hex)
+        self.batch_size = batch_size
+        self.log = log or (lambda message: None)
+        self._counter = 0
+        self._pending = 0
+        self._made_dirs = set()
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._queue = queue.SimpleQueue()
+        os.makedirs(self.folder, exist_ok=True)
+        self._threads = [threading.Thread(target=self._mover, daemon=True) for _ in range(max(1, threads))]
+        for thread in self._threads:
+            thread.start()
+
+    def stage(self, jobs):
+        """작업의 출력 경로를 로컬 임시 폴더로 바꿔 전달 (최종 경로는 final_output)"""
+        for job in jobs:
+            with self._lock:
+                self._counter += 1
+                local = os.path.join(self.folder, f"{self._counter:06d}_{os.path.basename(job['output'])}")
+            yield dict(job, output=local, final_output=job["output"])
+
+    def deliver(self, result, on_delivered):
+        """변환된 PDF를 출력 폴더로 옮기는 작업을 예약
+
+        옮긴 뒤(실패하면 실패 결과로 바꿔) result["output"]을 최종 경로로 고치고
+        on_delivered(result, 로컬 PDF 경로)를 이동 스레드에서 호출한다.
+        """
+        with self._lock:
+            self._pending += 1
+        self._queue.put((result, on_delivered))
+
+    def discard(self, result):
+        """변환하지 못한 작업의 로컬 파일을 지우고 출력 경로를 최종 경로로 되돌림"""
+        _remove_quietly(result["output"])
+        result["output"] = result.pop("final_output", result["output"])
+
+    def _mover(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            # 같은 대상 폴더는 한 번만 확인/생성
+            for folder in {os.path.dirname(result["final_output"]) for result, _ in batch}:
+                if folder not in self._made_dirs:
+                    try:
+                        os.makedirs(folder, exist_ok=True)
+                        self._made_dirs.add(folder)
+                    except OSError:
+                        pass
+            for result, on_delivered in batch:
+                try:
+                    self._move(result, on_delivered)
+                finally:
+                    with self._lock:
+                        self._pending -= 1
+                        if self._pending == 0:
+                            self._idle.notify_all()
+
+    def _move(self, result, on_delivered):
+        local = result["output"]
+        final = result.pop("final_output")
+        tmp_path = os.path.join(os.path.dirname(final), f".{os.path.basename(final)}.{uuid.uuid4().hex[:8]}.part")
+        try:
+            shutil.copyfile(local, tmp_path)
+            os.replace(tmp_path, final)
+        except OSError as e:
+            _remove_quietly(tmp_path)
+            result["status"] = "failed"
+            result["error"] = f"PDF를 출력 폴더로 옮기지 못했습니다 ({local}에 남겨 둠): {e}"
+            self.log(f"❌ {result['filename']}: {result['error']}")
+            local = None
+        result["output"] = final
+        try:
+            on_delivered(result, local)
+        except Exception as e:
+            self.log(f"⚠️ {result['filename']} 결과 처리 중 오류: {e}")
+        finally:
+            if local is not None:
+                _remove_quietly(local)
+
+    def flush(self):
+        """예약된 이동이 모두 끝날 때까지 대기"""
+        with self._lock:
+            while self._pending:
+                self._idle.wait()
+
+    def close(self):
+        self.flush()
+        # 옮기지 못한 PDF가 없으면 임시 폴더 삭제
+        try:
+            os.rmdir(self.folder)
+        except OSError:
+            pass
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
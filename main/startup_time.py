@@ -0,0 +1,157 @@
+"""시작할 때 모듈을 불러오는 시간 측정 (python -X importtime 기반, Linux에서도 실행 가능)
+
+예) python startup_time.py
+    python startup_time.py --modules to_pdf hwpword_to_pdf cli --runs 9 --top 15
+    python startup_time.py --save startup_baseline.json
+    python startup_time.py --compare startup_baseline.json --tolerance 20
+
+모듈마다 새 파이썬 프로세스에서 import만 실행해 누적 import 시간(중앙값)을 잰다.
+시작할 때 불러오면 안 되는 모듈(LAZY_MODULES)이 딸려 오거나, --compare로 준 기준보다
+--tolerance%를 넘게 느려지면 종료 코드 1을 돌려준다.
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+import subprocess
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_MODULES = ("to_pdf", "hwpword_to_pdf", "cli", "engine")
+# 시작할 때 불러오면 안 되는 모듈 (필요할 때 또는 창이 뜬 뒤 백그라운드에서 불러옴)
+LAZY_MODULES = {
+    "to_pdf": ("tkinter", "cli", "engine", "hwpword_to_pdf"),
+    "hwpword_to_pdf": ("asyncio", "engine", "instance_session", "backends", "pythoncom", "win32com", "comtypes"),
+    "cli": ("tkinter", "asyncio", "http.server", "sqlite3", "job_server", "folder_watch"),
+    "engine": ("tkinter", "pythoncom", "win32com", "comtypes"),
+}
+
+
+def parse_importtime(stderr):
+    """-X importtime 출력을 [(모듈, 자체 μs, 누적 μs, 깊이)]로 변환"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+            entries.append((name.strip(), int(self_us), int(cumulative_us), depth))
+        except ValueError:
+            continue
+    return entries
+
+
+def measure_once(module, python=None, pycache=None):
+    """새 프로세스에서 module을 import하고 (import 항목, 프로세스 전체 시간 초) 반환
+
+    pycache를 주면 .pyc를 소스 폴더가 아닌 그 폴더에 쓰고 읽는다.
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [HERE, os.environ.get("PYTHONPATH")])))
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    if pycache:
+        env["PYTHONPYCACHEPREFIX"] = pycache
+    started = time.perf_counter()
+    completed = subprocess.run([python or sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                               cwd=HERE, env=env, capture_output=True, text=True, encoding="utf-8",
+                               errors="replace")
+    wall = time.perf_counter() - started
+    if completed.returncode != 0:
+        raise RuntimeError(f"{module} import 실패:\n{completed.stderr.strip()[-2000:]}")
+    return parse_importtime(completed.stderr), wall
+
+
+def measure(module, runs=5, top=10, python=None, pycache=None):
+    """module의 import 시간을 runs번 재서 중앙값과 가장 오래 걸린 모듈 반환"""
+    # 첫 실행은 .pyc를 만드는 데 쓰이므로 버림 (묶은 실행파일도 컴파일된 바이트코드를 씀)
+    measure_once(module, python, pycache)
+    totals, walls, self_times = [], [], {}
+    loaded = set()
+    for _ in range(max(1, runs)):
+        entries, wall = measure_once(module, python, pycache)
+        walls.append(wall)
+        totals.append(next((cumulative for name, _, cumulative, depth in entries
+                            if name == module and depth == 0), 0))
+        for name, self_us, _, _ in entries:
+            self_times.setdefault(name, []).append(self_us)
+            loaded.add(name)
+    heaviest = sorted(((statistics.median(values), name) for name, values in self_times.items()), reverse=True)
+    lazy = LAZY_MODULES.get(module, ())
+    return {
+        "module": module,
+        "runs": len(totals),
+        "import_ms": statistics.median(totals) / 1000,
+        "process_ms": statistics.median(walls) * 1000,
+        "modules_loaded": len(loaded),
+        "heaviest": [{"module": name, "self_ms": us / 1000} for us, name in heaviest[:top]],
+        "unexpected": sorted(name for name in loaded
+                             if any(name == lazy_name or name.startswith(lazy_name + ".") for lazy_name in lazy)),
+    }
+
+
+def compare(results, baseline, tolerance):
+    """기준보다 tolerance%를 넘게 느려진 모듈 목록 [(모듈, 기준 ms, 현재 ms)]"""
+    regressions = []
+    for result in results:
+        before = baseline.get(result["module"], {}).get("import_ms")
+        if before and result["import_ms"] > before * (1 + tolerance / 100):
+            regressions.append((result["module"], before, result["import_ms"]))
+    return regressions
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="프로그램 시작 시 모듈 import 시간 측정")
+    parser.add_argument("--modules", nargs="+", default=list(DEFAULT_MODULES), help="측정할 모듈")
+    parser.add_argument("--runs", type=int, default=5, help="모듈마다 측정할 횟수 (중앙값 사용)")
+    parser.add_argument("--top", type=int, default=10, help="가장 오래 걸린 모듈을 몇 개 보여줄지")
+    parser.add_argument("--python", default=None, help="측정에 쓸 파이썬 실행 파일 (기본: 현재 파이썬)")
+    parser.add_argument("--save", metavar="FILE", help="측정 결과를 기준 파일로 저장")
+    parser.add_argument("--compare", metavar="FILE", help="기준 파일과 비교해 느려졌으면 종료 코드 1")
+    parser.add_argument("--tolerance", type=float, default=20.0, help="허용할 import 시간 증가율(%%)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    # 측정용 .pyc는 임시 폴더에 만들어 소스 폴더에 __pycache__를 남기지 않음
+    pycache = tempfile.mkdtemp(prefix="to_pdf_pycache_")
+    try:
+        results = [measure(module, args.runs, args.top, args.python, pycache) for module in args.modules]
+    finally:
+        shutil.rmtree(pycache, ignore_errors=True)
+
+    regressions = []
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            regressions = compare(results, json.load(f).get("modules", {}), args.tolerance)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"python": sys.version.split()[0], "platform": sys.platform,
+                       "modules": {r["module"]: {"import_ms": round(r["import_ms"], 2)} for r in results}},
+                      f, ensure_ascii=False, indent=2)
+    failed = bool(regressions) or any(result["unexpected"] for result in results)
+
+    if args.json:
+        print(json.dumps({"results": results, "regressions": [
+            {"module": module, "baseline_ms": before, "import_ms": after} for module, before, after in regressions
+        ]}, ensure_ascii=False, indent=2))
+        return 1 if failed else 0
+
+    for result in results:
+        print(f"{result['module']}: import {result['import_ms']:.1f}ms, 프로세스 전체 {result['process_ms']:.1f}ms, "
+              f"모듈 {result['modules_loaded']}개 ({result['runs']}회 중앙값)")
+        for item in result["heaviest"]:
+            print(f"    {item['self_ms']:>7.2f}ms  {item['module']}")
+        if result["unexpected"]:
+            print(f"  ❌ 시작할 때 불러오면 안 되는 모듈: {', '.join(result['unexpected'])}")
+    for module, before, after in regressions:
+        print(f"❌ {module}: {before:.1f}ms → {after:.1f}ms (허용 {args.tolerance:g}% 초과)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,40 @@
+"""실행 파일 진입점: 인자가 있으면 명령줄 모드, 없으면 변환 창
+
+예) python to_pdf.py
+    python to_pdf.py convert 입력폴더 출력폴더 --type all
+
+창(tkinter)과 변환 모듈은 필요한 쪽에서만 불러온다. 변환 워커 프로세스도 이 파일을 다시
+불러오므로 여기서는 가벼운 모듈만 import한다.
+"""
+import os
+import sys
+import multiprocessing
+
+CLI_OUTPUT_FILE = "cli_output.log"
+
+
+def _redirect_missing_output():
+    """창 모드 실행파일은 표준출력/표준에러가 없음: 명령줄 출력을 로그 폴더의 파일에 남김
+
+    작업 스케줄러 등에서 결과를 받아야 하면 콘솔용 실행파일(to_pdf_cli.exe)을 쓴다.
+    """
+    if sys.stdout is not None and sys.stderr is not None:
+        return
+    from app_paths import app_data_dir
+    stream = open(os.path.join(app_data_dir("logs"), CLI_OUTPUT_FILE), "a", encoding="utf-8", buffering=1)
+    sys.stdout = sys.stdout or stream
+    sys.stderr = sys.stderr or stream
+
+
+def main():
+    multiprocessing.freeze_support()
+    if len(sys.argv) > 1:
+        _redirect_missing_output()
+        from cli import main as cli_main
+        return cli_main()
+    from hwpword_to_pdf import main as gui_main
+    return gui_main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,7 @@
+import sys
+
+from helpers import MAIN_DIR
+
+# 모듈이 main/ 폴더에 평평하게 있으므로 테스트에서 바로 import할 수 있게 경로 추가
+if MAIN_DIR not in sys.path:
+    sys.path.insert(0, MAIN_DIR)
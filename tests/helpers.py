@@ -0,0 +1,15 @@
+import os
+
+MAIN_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main")
+
+
+def make_sources(folder, count, ext=".hwp", prefix="doc", size=100):
+    """가짜 변환기로 변환할 입력 파일 count개 생성"""
+    os.makedirs(folder, exist_ok=True)
+    paths = []
+    for i in range(count):
+        path = os.path.join(folder, f"{prefix}{i:03d}{ext}")
+        with open(path, "wb") as f:
+            f.write(b"x" * size)
+        paths.append(path)
+    return paths
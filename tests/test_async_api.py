@@ -0,0 +1,43 @@
+import asyncio
+
+import async_api
+from async_api import convert_many
+from helpers import make_sources
+
+
+def test_converts_both_types(tmp_path):
+    paths = make_sources(str(tmp_path / "in"), 3) + make_sources(str(tmp_path / "in"), 2, ".docx", prefix="word")
+    paths.append(str(tmp_path / "in" / "note.txt"))
+
+    async def collect():
+        return [result async for result in convert_many(paths, str(tmp_path / "out"), backend="fake")]
+
+    results = asyncio.run(collect())
+    assert sorted(r["status"] for r in results) == ["done"] * 5 + ["failed"]
+    assert {r["file_type"] for r in results} == {"hwp", "word", None}
+
+
+def test_input_is_read_with_backpressure(tmp_path, monkeypatch):
+    monkeypatch.setattr(async_api, "FEED_SIZE", 2)
+    sources = make_sources(str(tmp_path / "in"), 40)
+    read = []
+
+    def paths():
+        for path in sources:
+            read.append(path)
+            yield path
+
+    async def first_results():
+        seen = []
+        async for result in convert_many(paths(), str(tmp_path / "out"), backend="fake",
+                                         backend_options={"delay": 0.05}):
+            seen.append((result, len(read)))
+            if len(seen) == 3:
+                break
+        return seen
+
+    seen = asyncio.run(first_results())
+    assert [result["status"] for result, _ in seen] == ["done"] * 3
+    # 입력 큐가 차면 더 읽지 않으므로 변환한 만큼만 조금 앞서 읽음
+    assert all(count < 15 for _, count in seen)
+    assert len(read) < len(sources)
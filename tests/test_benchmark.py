@@ -0,0 +1,41 @@
+import os
+import sys
+import json
+import subprocess
+
+from helpers import MAIN_DIR
+
+
+def run_benchmark(*args):
+    completed = subprocess.run(
+        [sys.executable, os.path.join(MAIN_DIR, "benchmark.py"), "--files", "16", "--workers", "1,2",
+         "--type", "hwp", "--open-latency", "fixed:0.05", "--save-latency", "fixed:0", *args],
+        cwd=MAIN_DIR, capture_output=True, text=True, encoding="utf-8", timeout=120)
+    assert completed.returncode == 0, completed.stderr
+    return completed.stdout
+
+
+def test_json_report_has_percentiles_and_scaling():
+    report = json.loads(run_benchmark("--json"))
+
+    assert report["scanned"] == 16
+    assert [run["workers"] for run in report["runs"]] == [1, 2]
+    for run in report["runs"]:
+        assert run["files"] == 16 and run["failed"] == 0
+        assert 0.05 <= run["p50"] <= run["p95"] <= run["p99"]
+    one, two = report["runs"]
+    assert one["speedup"] == 1.0
+    # 열기 지연이 대부분이라 워커를 늘리면 처리량이 늘어남
+    assert two["speedup"] > 1.0
+    assert two["speedup"] == two["files_per_second"] / one["files_per_second"]
+
+
+def test_text_report_has_a_row_per_worker_count():
+    lines = run_benchmark().splitlines()
+
+    assert lines[0].startswith("파일 16개")
+    assert lines[1].split() == ["workers", "files/s", "speedup", "p50", "p95", "p99", "failed"]
+    rows = [line.split() for line in lines[2:]]
+    assert [row[0] for row in rows] == ["1", "2"]
+    assert rows[0][2] == "1.00"
+    assert [row[-1] for row in rows] == ["0", "0"]
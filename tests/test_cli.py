@@ -0,0 +1,60 @@
+import os
+import sys
+import json
+import threading
+import subprocess
+
+import cli
+from helpers import MAIN_DIR, make_sources
+
+
+def run_cli(*args, cwd=None):
+    return subprocess.run([sys.executable, os.path.join(MAIN_DIR, "cli.py"), *args], cwd=cwd,
+                          capture_output=True, text=True, encoding="utf-8", timeout=120)
+
+
+def test_convert_json_without_tkinter(tmp_path):
+    make_sources(str(tmp_path / "in"), 3, ".hwp")
+    make_sources(str(tmp_path / "in"), 2, ".docx", prefix="word")
+    script = ("import sys, cli; code = cli.main(sys.argv[1:]); "
+              "sys.stderr.write('TKINTER=%s\\n' % ('tkinter' in sys.modules)); sys.exit(code)")
+    completed = subprocess.run(
+        [sys.executable, "-c", script, "convert", str(tmp_path / "in"), str(tmp_path / "out"), "--type", "all",
+         "--backend", "fake", "--no-preflight", "--json"],
+        cwd=MAIN_DIR, capture_output=True, text=True, encoding="utf-8", timeout=120)
+    assert completed.returncode == 0, completed.stderr
+    assert "TKINTER=False" in completed.stderr
+    events = [json.loads(line) for line in completed.stdout.splitlines()]
+    results = [event for event in events if event["event"] == "result"]
+    assert sorted(result["status"] for result in results) == ["done"] * 5
+    assert len(os.listdir(tmp_path / "out")) >= 5
+
+
+def test_missing_input_is_an_error(tmp_path):
+    completed = run_cli("convert", str(tmp_path / "missing"), str(tmp_path / "out"), "--backend", "fake")
+    assert completed.returncode == 2
+
+
+def test_all_type_runs_both_pipelines_at_once(tmp_path, monkeypatch):
+    make_sources(str(tmp_path / "in"), 2, ".hwp")
+    make_sources(str(tmp_path / "in"), 2, ".docx", prefix="word")
+    # 한글/워드 파이프라인이 차례로 돌면 두 번째가 오지 않아 시간 초과로 실패
+    both_started = threading.Barrier(2, timeout=30)
+    started_types = []
+    run_batch = cli.run_batch
+
+    def concurrent_run_batch(file_type, *args, **kwargs):
+        started_types.append(file_type)
+        both_started.wait()
+        return run_batch(file_type, *args, **kwargs)
+
+    monkeypatch.setattr(cli, "run_batch", concurrent_run_batch)
+    # 테스트 프로세스의 Ctrl+C 처리는 그대로 둠
+    monkeypatch.setattr(cli.signal, "signal", lambda signum, handler: None)
+    code = cli.main(["convert", str(tmp_path / "in"), str(tmp_path / "out"), "--type", "all", "--backend", "fake",
+                     "--no-preflight", "--cache-size", "0"])
+
+    assert code == 0
+    assert sorted(started_types) == ["hwp", "word"]
+    assert sorted(name for name in os.listdir(tmp_path / "out") if name.endswith(".pdf")) == [
+        "doc000.pdf", "doc001.pdf", "word000.pdf", "word001.pdf"]
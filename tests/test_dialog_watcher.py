@@ -0,0 +1,97 @@
+import sys
+import time
+import types
+
+import pytest
+
+import dialog_watcher
+from dialog_watcher import DialogWatcher
+
+
+class FakeDesktop:
+    """win32gui/win32con 대신 쓰는 가짜 창 목록 (N키를 받으면 창이 닫힘)"""
+
+    WM_KEYDOWN = 0x0100
+    WM_KEYUP = 0x0101
+
+    def __init__(self):
+        self.windows = {}
+        self.find_calls = 0
+        self.keys = []
+
+    def FindWindow(self, class_name, title):
+        self.find_calls += 1
+        return self.windows.get(title, 0)
+
+    def SetForegroundWindow(self, hwnd):
+        pass
+
+    def SendMessage(self, hwnd, message, key, param):
+        self.keys.append((hwnd, message, chr(key)))
+        if message == self.WM_KEYUP:
+            self.windows = {title: h for title, h in self.windows.items() if h != hwnd}
+
+    def IsWindow(self, hwnd):
+        return hwnd in self.windows.values()
+
+    def IsWindowVisible(self, hwnd):
+        return self.IsWindow(hwnd)
+
+
+@pytest.fixture
+def desktop(monkeypatch):
+    desktop = FakeDesktop()
+    module = types.SimpleNamespace(**{name: getattr(desktop, name) for name in dir(desktop) if name[0].isupper()})
+    monkeypatch.setitem(sys.modules, "win32gui", module)
+    monkeypatch.setitem(sys.modules, "win32con", module)
+    return desktop
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_falls_back_to_polling_only_while_converting(desktop, monkeypatch):
+    def no_hook(self):
+        raise OSError("훅 없음")
+
+    monkeypatch.setattr(DialogWatcher, "_run_hook", no_hook)
+    monkeypatch.setattr(dialog_watcher, "SETTLE_DELAY", 0)
+    messages = []
+    watcher = DialogWatcher(log=messages.append)
+    watcher.start()
+    try:
+        assert watcher.mode == "poll"
+        assert any("폴링" in message for message in messages)
+
+        # 변환 중인 파일이 없으면 창을 찾지 않음
+        time.sleep(0.2)
+        assert desktop.find_calls == 0
+
+        watcher.begin_file()
+        desktop.windows["경고"] = 42
+        wait_for(lambda: not desktop.windows)
+        seconds, count = watcher.end_file()
+        assert count == 1 and seconds >= 0
+        assert desktop.keys == [(42, desktop.WM_KEYDOWN, "N"), (42, desktop.WM_KEYUP, "N")]
+
+        # 파일 변환이 끝나면 폴링을 멈춤
+        time.sleep(0.1)
+        calls = desktop.find_calls
+        time.sleep(0.3)
+        assert desktop.find_calls == calls
+    finally:
+        watcher.stop()
+
+
+def test_check_now_dismisses_remaining_dialog(desktop, monkeypatch):
+    monkeypatch.setattr(dialog_watcher, "SETTLE_DELAY", 0)
+    watcher = DialogWatcher()
+    assert watcher.check_now() is False
+    desktop.windows["알림"] = 7
+    assert watcher.check_now() is True
+    assert not desktop.windows
+    assert watcher.end_file()[1] == 1
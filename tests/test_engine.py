@@ -0,0 +1,208 @@
+import os
+import signal
+import zipfile
+import multiprocessing
+
+import pytest
+
+import page_split
+from engine import ConversionPool, make_job, output_name, run_batch
+from run_report import RunReport
+from scheduling import CostModel
+from manifest import Manifest
+from staging import OutputStager
+from helpers import make_sources
+
+
+def fake_pool(workers=2, start_method=None, **options):
+    pool_keys = ("timeout", "max_documents", "on_instance", "log")
+    backend_options = {key: options.pop(key) for key in list(options) if key not in pool_keys}
+    pool = ConversionPool("hwp", workers=workers, backend="fake", backend_options=backend_options, **options)
+    if start_method:
+        pool._context = multiprocessing.get_context(start_method)
+    return pool
+
+
+
+def test_failed_and_hung_files_do_not_stop_the_batch(tmp_path):
+    sources = make_sources(str(tmp_path / "in"), 4)
+    sources += make_sources(str(tmp_path / "in"), 1, prefix="fail")
+    sources += make_sources(str(tmp_path / "in"), 1, prefix="hang")
+    jobs = [make_job(path, str(tmp_path / "out")) for path in sources]
+
+    with fake_pool(workers=2, timeout=1) as pool:
+        results = pool.run(jobs)
+        # 멈춘 워커는 새 워커로 교체됨
+        assert len(pool._alive_workers()) == 2
+
+    statuses = {os.path.basename(r["source"]): r["status"] for r in results}
+    assert statuses.pop("fail000.hwp") == "failed"
+    assert statuses.pop("hang000.hwp") == "timeout"
+    assert set(statuses.values()) == {"done"}
+
+
+def test_stop_request_ends_run_early(tmp_path):
+    sources = make_sources(str(tmp_path / "in"), 20)
+    jobs = iter([make_job(path, str(tmp_path / "out")) for path in sources])
+    finished = []
+
+    with fake_pool(workers=2, delay=0.05) as pool:
+        results = pool.run(jobs, on_result=finished.append, should_stop=lambda: len(finished) >= 3)
+
+    # 변환 중이던 파일까지만 처리하고 남은 작업은 보내지 않음
+    assert 3 <= len(results) <= 5
+    assert {r["status"] for r in results} == {"done"}
+    assert next(jobs, None) is not None
+
+
+def test_instances_recycle_after_max_documents(tmp_path):
+    sources = make_sources(str(tmp_path / "in"), 5)
+    jobs = [make_job(path, str(tmp_path / "out")) for path in sources]
+    instances = []
+
+    with fake_pool(workers=1, max_documents=2, on_instance=instances.append) as pool:
+        results = pool.run(jobs)
+
+    assert [r["status"] for r in results] == ["done"] * 5
+    # 2개씩 변환하고 다시 시작: 인스턴스 3개 (마지막은 종료 시 기록)
+    assert [stats.get("recycle_reason") for stats in instances] == ["문서 2개 변환", "문서 2개 변환", None]
+    assert [stats.get("documents") for stats in instances[:2]] == [2, 2]
+
+
+def test_instances_recycle_above_memory_threshold(tmp_path):
+    sources = make_sources(str(tmp_path / "in"), 4)
+    report = RunReport(str(tmp_path / "out"))
+    messages = []
+
+    # 가짜 변환기 메모리: 80MB에서 시작해 문서마다 50MB 증가, 150MB를 넘으면 다시 시작
+    results = run_batch("hwp", sources, str(tmp_path / "out"), backend="fake",
+                        backend_options={"base_mb": 80, "leak_mb": 50}, max_rss_mb=150,
+                        on_result=report.add, on_instance=report.add_instance, log=messages.append)
+
+    assert [r["status"] for r in results] == ["done"] * 4
+    recycled = [stats for stats in report.instances if stats.get("recycle_reason")]
+    assert [stats["recycle_reason"] for stats in recycled] == ["메모리 기준 초과"] * 2
+    assert [(stats["rss_before"] >> 20, stats["rss_after"] >> 20) for stats in recycled] == [(180, 80)] * 2
+    assert any("메모리 180MB → 80MB (100MB 회수)" in message for message in messages)
+
+    summary = report.summary()
+    assert (summary["recycles"], summary["reclaimed_bytes"] >> 20) == (2, 200)
+    assert "♻️ 변환기 재시작 2회, 메모리 200MB 회수" in report.format_summary(summary)
+
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGINT") or os.name != "posix", reason="워커에 SIGINT를 직접 보냄")
+def test_spawned_workers_ignore_ctrl_c(tmp_path):
+    sources = make_sources(str(tmp_path / "in"), 6)
+    jobs = [make_job(path, str(tmp_path / "out")) for path in sources]
+    interrupted = []
+
+    def on_start(job):
+        # 두 워커가 모두 변환을 시작하면 콘솔의 Ctrl+C처럼 워커 모두에 SIGINT 전달
+        if not interrupted and all(current is not None for current in pool._current.values()):
+            for process in pool._processes.values():
+                os.kill(process.pid, signal.SIGINT)
+            interrupted.append(True)
+
+    with fake_pool(workers=2, start_method="spawn", delay=0.3) as pool:
+        results = pool.run(jobs, on_start=on_start)
+        assert all(process.is_alive() for process in pool._processes.values())
+
+    assert interrupted
+    assert sorted(r["status"] for r in results) == ["done"] * 6
+    assert all(os.path.exists(job["output"]) for job in jobs)
+
+
+def test_output_name_is_decided_from_the_folder(tmp_path):
+    for name in ("a.docx", "a.hwp", "A.doc", "b.docx"):
+        (tmp_path / name).write_bytes(b"x")
+    names = {name: output_name(str(tmp_path / name)) for name in ("a.docx", "a.hwp", "A.doc", "b.docx")}
+    assert names["a.hwp"] == "a.pdf"
+    assert names["b.docx"] == "b.pdf"
+    if os.path.normcase("A") == os.path.normcase("a"):
+        assert (names["A.doc"], names["a.docx"]) == ("A (doc).pdf", "a (docx).pdf")
+
+
+@pytest.mark.parametrize("staged", [False, True])
+def test_same_stem_sources_keep_their_pdfs(tmp_path, staged):
+    source = tmp_path / "in"
+    source.mkdir()
+    (source / "a.hwp").write_bytes(b"h" * 100)
+    (source / "a.docx").write_bytes(b"w" * 200)
+    out = tmp_path / "out"
+    out.mkdir()
+    skipped = []
+
+    def convert(file_type, name):
+        manifest = Manifest(str(out))
+        stager = OutputStager(str(tmp_path / "staging")) if staged else None
+        try:
+            return run_batch(file_type, [str(source / name)], str(out), backend="fake", manifest=manifest,
+                             stager=stager, on_skip=lambda job: skipped.append(job["filename"]))
+        finally:
+            if stager is not None:
+                stager.close()
+            manifest.save()
+
+    # 워드를 먼저 변환해도 a.pdf는 한글 원본 몫
+    [word] = convert("word", "a.docx")
+    [hwp] = convert("hwp", "a.hwp")
+    assert os.path.basename(word["output"]) == "a (docx).pdf"
+    assert os.path.basename(hwp["output"]) == "a.pdf"
+    assert sorted(name for name in os.listdir(out) if name.endswith(".pdf")) == ["a (docx).pdf", "a.pdf"]
+
+    # 다시 실행하면 기록된 경로가 같아 둘 다 건너뜀
+    assert convert("word", "a.docx") == []
+    assert convert("hwp", "a.hwp") == []
+    assert skipped == ["a.docx", "a.hwp"]
+
+
+def test_split_document_counts_once_in_progress(tmp_path):
+    pytest.importorskip("pypdf")
+    source = tmp_path / "in"
+    source.mkdir()
+    with zipfile.ZipFile(source / "big.docx", "w") as zf:
+        zf.writestr("docProps/app.xml", "<Properties><Pages>200</Pages></Properties>")
+    (source / "small.docx").write_bytes(b"x" * 100)
+    started = []
+    results = run_batch("word", [str(source / "big.docx"), str(source / "small.docx")], str(tmp_path / "out"),
+                        workers=2, backend="fake", split_pages=100,
+                        on_start=lambda job: started.append((job["source"], job["index"])))
+
+    assert sorted(r["status"] for r in results) == ["done", "done"]
+    # 구간마다 변환을 시작해도 진행 번호는 원본 문서 기준
+    assert len(started) > 2
+    assert sorted({index for _, index in started}) == [1, 2]
+    assert len({index for path, index in started if path.endswith("big.docx")}) == 1
+
+
+def test_cost_model_learns_from_split_documents(tmp_path):
+    pytest.importorskip("pypdf")
+    source = tmp_path / "in"
+    source.mkdir()
+    with zipfile.ZipFile(source / "big.docx", "w") as zf:
+        zf.writestr("docProps/app.xml", "<Properties><Pages>200</Pages></Properties>")
+    cost_model = CostModel()
+    [result] = run_batch("word", [str(source / "big.docx")], str(tmp_path / "out"), workers=2, backend="fake",
+                         split_pages=100, cost_model=cost_model)
+
+    assert result["chunks"] == 2
+    assert cost_model.sums[".docx"]["n"] == 1
+
+
+def test_documents_too_large_to_merge_are_not_split(tmp_path, monkeypatch):
+    pytest.importorskip("pypdf")
+    source = tmp_path / "in"
+    source.mkdir()
+    # 쪽 수 어림으로 합친 PDF가 MAX_MERGE_MB를 넘는 문서 (200쪽 x 10MB)
+    monkeypatch.setattr(page_split, "ESTIMATED_PAGE_BYTES", 10 * 1024 * 1024)
+    with zipfile.ZipFile(source / "huge.docx", "w") as zf:
+        zf.writestr("docProps/app.xml", "<Properties><Pages>200</Pages></Properties>")
+    started = []
+    messages = []
+    [result] = run_batch("word", [str(source / "huge.docx")], str(tmp_path / "out"), workers=2, backend="fake",
+                         split_pages=100, log=messages.append, on_start=started.append)
+
+    assert result["status"] == "done"
+    assert [job.get("chunk") for job in started] == [None]
+    assert any("나누지 않고 변환" in message for message in messages)
@@ -0,0 +1,89 @@
+import os
+import threading
+
+from engine import run_batch
+from folder_watch import FolderWatcher
+from instance_session import InstanceSession
+from journal import DONE, Journal, read_journal
+from pdf_cache import PdfCache
+from helpers import make_sources
+
+
+def watch_until(watcher, count, timeout=60):
+    """결과가 count개 나올 때까지 감시 후 결과 목록 반환"""
+    results = []
+    done = threading.Event()
+
+    def on_result(result):
+        results.append(result)
+        if len(results) >= count:
+            done.set()
+
+    watcher.on_result = on_result
+    thread = threading.Thread(target=watcher.run, args=(done.is_set,), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive()
+    return results
+
+
+def test_only_converted_files_are_handled(tmp_path):
+    [ok] = make_sources(str(tmp_path / "in"), 1, prefix="ok")
+    [bad] = make_sources(str(tmp_path / "in"), 1, prefix="fail")
+    watcher = FolderWatcher(str(tmp_path / "in"), str(tmp_path / "out"), file_types=("hwp",), backend="fake",
+                            backend_options={"delay": 0.01}, settle_seconds=0.05, poll_interval=0.1, preflight=False)
+    results = watch_until(watcher, 2)
+
+    assert sorted(r["status"] for r in results) == ["done", "failed"]
+    assert ok in watcher._handled
+    # 실패한 파일은 처리한 것으로 기록하지 않고 재시도 시각을 잡아 둠
+    assert bad not in watcher._handled
+    assert bad in watcher._retry_at
+    # 감시하는 동안 켜 둔 변환기는 감시가 끝나면 종료
+    assert watcher._own_session is None
+
+
+def test_retries_failed_file_after_interval(tmp_path):
+    [bad] = make_sources(str(tmp_path / "in"), 1, prefix="fail")
+    watcher = FolderWatcher(str(tmp_path / "in"), str(tmp_path / "out"), file_types=("hwp",), backend="fake",
+                            backend_options={"delay": 0.01}, settle_seconds=0.05, poll_interval=0.1,
+                            retry_interval=0.2, preflight=False)
+    results = watch_until(watcher, 2)
+    assert [r["source"] for r in results] == [bad, bad]
+
+
+def test_borrows_session_instances(tmp_path):
+    make_sources(str(tmp_path / "in"), 2)
+    session = InstanceSession(idle_timeout=0)
+    try:
+        watcher = FolderWatcher(str(tmp_path / "in"), str(tmp_path / "out"), file_types=("hwp",), backend="fake",
+                                backend_options={"delay": 0.01}, settle_seconds=0.05, poll_interval=0.1,
+                                preflight=False, session=session)
+        results = watch_until(watcher, 2)
+        assert [r["status"] for r in results] == ["done", "done"]
+        # 감시가 끝나도 세션의 변환기는 그대로 켜져 있음
+        assert watcher._own_session is None
+        assert session._slots["hwp"].pool is not None
+    finally:
+        session.close()
+
+
+def test_uses_batch_cache_and_journal(tmp_path):
+    cache = PdfCache(str(tmp_path / "cache"))
+    [source] = make_sources(str(tmp_path / "in"), 1)
+    run_batch("hwp", [source], str(tmp_path / "earlier"), backend="fake", cache=cache)
+    os.makedirs(str(tmp_path / "out"))
+    journal = Journal(str(tmp_path / "out"))
+    try:
+        watcher = FolderWatcher(str(tmp_path / "in"), str(tmp_path / "out"), file_types=("hwp",), backend="fake",
+                                settle_seconds=0.05, poll_interval=0.1, preflight=False, journal=journal, cache=cache)
+        [result] = watch_until(watcher, 1)
+    finally:
+        journal.close()
+
+    # 일괄 변환과 같은 경로로 변환하므로 캐시와 상태 기록을 그대로 씀
+    assert result["status"] == "done" and result["cached"]
+    assert os.path.exists(result["output"])
+    _, states = read_journal(str(tmp_path / "out"))
+    assert states[source]["state"] == DONE
+    assert source in watcher._handled
@@ -0,0 +1,35 @@
+import time
+import threading
+
+from instance_session import InstanceSession
+
+
+def test_close_skips_busy_pool_until_released():
+    session = InstanceSession(idle_timeout=0)
+    borrowed = threading.Event()
+    release = threading.Event()
+    healthy = []
+
+    def batch():
+        with session.pool("hwp", backend="fake") as pool:
+            borrowed.set()
+            release.wait(30)
+            healthy.append(pool.health_check(10))
+
+    thread = threading.Thread(target=batch, daemon=True)
+    thread.start()
+    assert borrowed.wait(30)
+
+    # 변환 중인 풀은 기다리다 포기하고 건너뜀 (닫지 않음)
+    started = time.monotonic()
+    session.close(wait=0.2)
+    assert time.monotonic() - started < 5
+    slot = session._slots["hwp"]
+    assert slot.pool is not None
+
+    # 빌려 간 배치가 돌려줄 때 닫힘
+    release.set()
+    thread.join(30)
+    assert not thread.is_alive()
+    assert healthy == [True]
+    assert slot.pool is None
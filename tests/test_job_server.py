@@ -0,0 +1,120 @@
+import os
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from job_server import JobServer, JobClient, JobServerError, TOKEN_HEADER, CLIENT_HEADER
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "appdata"))
+    app = JobServer(str(tmp_path / "server"), port=0, backend="fake", backend_options={"delay": 0.01},
+                    preflight=False)
+    app.start()
+    yield app
+    app.stop()
+
+
+def raw(app, method, path, data=None, headers=None):
+    request = urllib.request.Request(f"http://{app.host}:{app.port}{path}", data=data, method=method,
+                                     headers=headers or {})
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def client(app, key):
+    return JobClient(f"http://{app.host}:{app.port}", token=app.token, key=key)
+
+
+def test_requires_token(server):
+    status, body = raw(server, "POST", "/jobs", b'{"paths": ["/etc/hosts"], "output_folder": "/tmp"}',
+                       {"Content-Type": "text/plain"})
+    assert status == 401
+    assert "error" in body
+    assert server.store.list() == []
+
+
+def test_rejects_browser_requests(server):
+    headers = {TOKEN_HEADER: server.token, CLIENT_HEADER: "k"}
+    status, _ = raw(server, "GET", "/status", headers=dict(headers, Origin="https://evil.example"))
+    assert status == 403
+    status, _ = raw(server, "POST", "/jobs", b'{"paths": ["a.hwp"], "output_folder": "/tmp"}',
+                    dict(headers, **{"Content-Type": "text/plain"}))
+    assert status == 400
+    status, _ = raw(server, "GET", "/status", headers=headers)
+    assert status == 200
+
+
+@pytest.mark.parametrize("method, path, data", [
+    ("GET", "/jobs?limit=abc", None),
+    ("GET", "/jobs?limit=0", None),
+    ("POST", "/jobs", b"[]"),
+    ("POST", "/jobs", b'{"paths": "a.hwp", "output_folder": "/tmp"}'),
+    ("POST", "/jobs", b"not json"),
+])
+def test_bad_requests_get_400(server, method, path, data):
+    headers = {TOKEN_HEADER: server.token, CLIENT_HEADER: "k", "Content-Type": "application/json"}
+    status, body = raw(server, method, path, data, headers)
+    assert status == 400
+    assert body["error"]
+
+
+def test_only_submitter_sees_job_and_pdf(server, tmp_path):
+    source = tmp_path / "a.hwp"
+    source.write_bytes(b"x" * 100)
+    owner, other = client(server, "owner-key"), client(server, "other-key")
+
+    job = owner.upload(str(source))
+    [finished] = owner.wait([job["id"]], poll_interval=0.05)
+    assert finished["status"] == "done"
+    owner.download(job["id"], str(tmp_path / "a.pdf"))
+    assert (tmp_path / "a.pdf").stat().st_size > 0
+
+    for call in (lambda: other.job(job["id"]), lambda: other.download(job["id"], str(tmp_path / "b.pdf"))):
+        with pytest.raises(JobServerError) as error:
+            call()
+        assert error.value.status == 404
+    assert other.jobs() == []
+    assert [j["id"] for j in owner.jobs()] == [job["id"]]
+
+
+def test_cancel_only_own_jobs(server, tmp_path):
+    server._stop.set()  # 변환하지 않고 대기열에만 둠
+    owner, other = client(server, "owner-key"), client(server, "other-key")
+    [job] = owner.submit([str(tmp_path / "missing.hwp")], str(tmp_path / "out"))
+    assert job["status"] == "rejected"
+    source = tmp_path / "a.hwp"
+    source.write_bytes(b"x")
+    [job] = owner.submit([str(source)], str(tmp_path / "out"))
+    with pytest.raises(JobServerError):
+        other.cancel(job["id"])
+    assert owner.cancel(job["id"]) == {"cancelled": True}
+
+
+def test_output_names_are_decided_once_at_submit(tmp_path, monkeypatch):
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "appdata"))
+    app = JobServer(str(tmp_path / "server"), port=0, backend="fake", preflight=False)
+    source = tmp_path / "in"
+    source.mkdir()
+    paths = []
+    for name in ["a.hwp", "a.docx"] + [f"doc{i:03d}.hwp" for i in range(20)]:
+        (source / name).write_bytes(b"x")
+        paths.append(str(source / name))
+
+    listed = []
+    listdir = os.listdir
+    monkeypatch.setattr(os, "listdir", lambda path=".": listed.append(path) or listdir(path))
+    jobs = app.submit_many(paths, str(tmp_path / "out"))
+    # 원본 폴더는 한 번만 읽고, 같은 이름의 원본은 겹치지 않는 PDF 이름을 받음
+    assert listed == [str(source)]
+    assert [os.path.basename(job["output"]) for job in jobs[:2]] == ["a.pdf", "a (docx).pdf"]
+
+    claimed = list(app._claimed_jobs("hwp", set()))
+    assert listed == [str(source)]
+    assert {job["output"] for job in claimed} == {job["output"] for job in jobs if job["file_type"] == "hwp"}
@@ -0,0 +1,54 @@
+import os
+
+from engine import run_batch
+from journal import Journal, read_journal, JOURNAL_NAME, DONE
+from helpers import make_sources
+
+
+def test_resume_skips_finished_files(tmp_path):
+    sources = make_sources(str(tmp_path / "in"), 8)
+    out = str(tmp_path / "out")
+    os.makedirs(out)
+
+    # 3개 변환한 뒤 중지된 실행
+    journal = Journal(out, run_info={"input": str(tmp_path / "in")})
+    finished = []
+    try:
+        run_batch("hwp", sources, out, backend="fake", journal=journal, on_result=finished.append,
+                  should_stop=lambda: len(finished) >= 3)
+    finally:
+        journal.close()
+    done = {r["source"] for r in finished if r["status"] == "done"}
+    assert 3 <= len(done) < len(sources)
+
+    run_info, states = read_journal(out)
+    assert run_info == {"input": str(tmp_path / "in")}
+    assert {source for source, record in states.items() if record["state"] == DONE} == done
+
+    # PDF가 지워진 파일은 완료 기록이 있어도 다시 변환
+    removed = sorted(done)[0]
+    os.remove(os.path.join(out, os.path.splitext(os.path.basename(removed))[0] + ".pdf"))
+
+    skipped = []
+    journal = Journal(out, resume=True)
+    try:
+        results = run_batch("hwp", sources, out, backend="fake", journal=journal,
+                            on_skip=lambda job: skipped.append(job["source"]))
+    finally:
+        journal.close()
+    assert sorted(skipped) == sorted(done - {removed})
+    assert sorted(r["source"] for r in results) == sorted({os.path.abspath(p) for p in sources} - set(skipped))
+    assert {record["state"] for record in read_journal(out)[1].values()} == {DONE}
+
+
+def test_truncated_last_line_is_ignored(tmp_path):
+    [source] = make_sources(str(tmp_path / "in"), 1)
+    journal = Journal(str(tmp_path), run_info={"input": "x"})
+    journal.mark({"source": source, "output": "a.pdf", "filename": "a.hwp"}, DONE)
+    journal.close()
+    with open(tmp_path / JOURNAL_NAME, "a", encoding="utf-8") as f:
+        f.write('{"source": "')
+
+    run_info, states = read_journal(str(tmp_path))
+    assert run_info == {"input": "x"}
+    assert states[source]["state"] == DONE
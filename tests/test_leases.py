@@ -0,0 +1,79 @@
+import os
+import multiprocessing
+
+from engine import make_job, run_batch
+from leases import LeaseBoard, CLAIMED, FAILED
+from helpers import make_sources
+
+
+def convert_node(sources, output_folder, lease_seconds, queue):
+    """다른 PC처럼 같은 출력 폴더를 임대로 나눠 변환하는 노드 (별도 프로세스)"""
+    leases = LeaseBoard(output_folder, lease_seconds=lease_seconds)
+    try:
+        results = run_batch("hwp", sources, output_folder, backend="fake", backend_options={"delay": 0.05},
+                            leases=leases)
+    finally:
+        leases.close()
+    queue.put([(r["source"], r["status"]) for r in results])
+
+
+def claim_and_die(sources, output_folder):
+    """임대를 잡은 채 변환하지 못하고 죽은 노드"""
+    leases = LeaseBoard(output_folder, lease_seconds=1)
+    claimed = list(leases.claim(make_job(path, output_folder) for path in sources))
+    assert len(claimed) == len(sources)
+    os._exit(0)
+
+
+def test_nodes_split_files_without_overlap(tmp_path):
+    sources = make_sources(str(tmp_path / "in"), 12)
+    out = str(tmp_path / "out")
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    nodes = [context.Process(target=convert_node, args=(sources, out, 30, queue)) for _ in range(3)]
+    for node in nodes:
+        node.start()
+    converted = [item for _ in nodes for item in queue.get(timeout=120)]
+    for node in nodes:
+        node.join(30)
+
+    # 파일마다 정확히 한 노드만 변환
+    assert sorted(source for source, _ in converted) == sorted(os.path.abspath(p) for p in sources)
+    assert {status for _, status in converted} == {"done"}
+
+
+def test_expired_lease_of_dead_node_is_reclaimed(tmp_path):
+    sources = make_sources(str(tmp_path / "in"), 3)
+    out = str(tmp_path / "out")
+    dead = multiprocessing.get_context("spawn").Process(target=claim_and_die, args=(sources, out))
+    dead.start()
+    dead.join(60)
+    assert dead.exitcode == 0
+
+    leases = LeaseBoard(out, lease_seconds=1)
+    try:
+        results = run_batch("hwp", sources, out, backend="fake", leases=leases)
+    finally:
+        leases.close()
+    assert sorted(r["status"] for r in results) == ["done"] * 3
+    assert all(os.path.exists(r["output"]) for r in results)
+
+
+def test_failed_files_are_retried_in_later_runs(tmp_path):
+    [source] = make_sources(str(tmp_path / "in"), 1)
+    out = str(tmp_path / "out")
+    job = make_job(source, out)
+    same_run = LeaseBoard(out, node="b")
+
+    failing = LeaseBoard(out, node="a")
+    assert list(failing.claim([job])) == [job]
+    failing.complete(dict(job, status="timeout", error="제한 시간 초과"))
+    failing.close()
+
+    # 이번 실행의 다른 노드는 다시 시도하지 않고, 다음 실행은 다시 변환
+    assert same_run._try_claim(job) == FAILED
+    next_run = LeaseBoard(out, node="c")
+    try:
+        assert next_run._try_claim(job) == CLAIMED
+    finally:
+        next_run.close()
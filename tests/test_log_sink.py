@@ -0,0 +1,63 @@
+import threading
+
+from log_sink import LogSink
+
+
+def test_calls_run_after_earlier_messages():
+    sink = LogSink()
+    order = []
+    for i in range(5):
+        sink.write(f"line {i}")
+    sink.call(order.append, "done")
+    sink.write("after")
+
+    messages, _, calls = sink.drain(max_messages=3)
+    # 앞선 로그가 다 반영되기 전에는 UI 작업을 꺼내지 않음
+    assert messages == ["line 0", "line 1", "line 2"] and calls == []
+    messages, _, calls = sink.drain(max_messages=3)
+    assert messages == ["line 3", "line 4"]
+    assert calls == [(order.append, ("done",))]
+    messages, _, calls = sink.drain()
+    assert messages == ["after"] and calls == []
+
+
+def test_progress_keeps_only_latest():
+    sink = LogSink()
+    sink.set_progress("1")
+    sink.set_progress("2")
+    assert sink.drain()[1] == "2"
+    assert sink.drain()[1] is None
+
+
+def test_concurrent_writers_keep_per_thread_order():
+    sink = LogSink()
+
+    def writer(name):
+        for i in range(500):
+            sink.write((name, i))
+
+    threads = [threading.Thread(target=writer, args=(name,)) for name in "ab"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    messages = []
+    while True:
+        batch = sink.drain(max_messages=100)[0]
+        if not batch:
+            break
+        messages += batch
+    for name in "ab":
+        assert [i for n, i in messages if n == name] == list(range(500))
+
+
+def test_writes_log_file_until_closed(tmp_path):
+    log_file = str(tmp_path / "convert.log")
+    sink = LogSink(log_file)
+    sink.write("before close")
+    sink.close()
+    sink.write("after close")
+    with open(log_file, encoding="utf-8") as f:
+        content = f.read()
+    assert "before close" in content
+    assert "after close" not in content
@@ -0,0 +1,37 @@
+import os
+
+from engine import run_batch
+from manifest import Manifest
+from helpers import make_sources
+
+
+def convert(sources, out):
+    manifest = Manifest(out)
+    skipped = []
+    try:
+        results = run_batch("hwp", sources, out, backend="fake", manifest=manifest,
+                            on_skip=lambda job: skipped.append(os.path.basename(job["source"])))
+    finally:
+        manifest.save()
+    return [os.path.basename(r["source"]) for r in results], skipped
+
+
+def test_unchanged_files_are_skipped(tmp_path):
+    sources = make_sources(str(tmp_path / "in"), 3)
+    out = str(tmp_path / "out")
+    os.makedirs(out)
+
+    assert convert(sources, out) == (["doc000.hwp", "doc001.hwp", "doc002.hwp"], [])
+    assert convert(sources, out) == ([], ["doc000.hwp", "doc001.hwp", "doc002.hwp"])
+
+    # 내용이 바뀐 파일과 PDF가 없어진 파일만 다시 변환
+    with open(sources[0], "ab") as f:
+        f.write(b"changed")
+    os.remove(os.path.join(out, "doc001.pdf"))
+    # 수정시각만 바뀐 파일은 해시가 같으므로 건너뜀
+    stat = os.stat(sources[2])
+    os.utime(sources[2], ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+    converted, skipped = convert(sources, out)
+    assert sorted(converted) == ["doc000.hwp", "doc001.hwp"]
+    assert skipped == ["doc002.hwp"]
@@ -0,0 +1,88 @@
+import os
+
+import pytest
+
+from engine import run_batch
+from pdf_cache import PdfCache
+from staging import OutputStager
+from helpers import make_sources
+
+
+def write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(content)
+    return path
+
+
+def test_hit_across_runs_and_output_folders(tmp_path):
+    cache = PdfCache(str(tmp_path / "cache"))
+    [source] = make_sources(str(tmp_path / "in"), 1)
+    [first] = run_batch("hwp", [source], str(tmp_path / "out1"), backend="fake", cache=cache)
+    [second] = run_batch("hwp", [source], str(tmp_path / "out2"), backend="fake", cache=cache)
+    [third] = run_batch("hwp", [source], str(tmp_path / "out3"), backend="fake", cache=cache)
+
+    assert [r.get("cached") for r in (first, second, third)] == [None, True, True]
+    assert os.path.getsize(second["output"]) == os.path.getsize(first["output"])
+    # 캐시에서 내보낸 PDF는 복사본이라 하나를 덮어써도 다른 출력은 그대로
+    with open(second["output"], "r+b") as f:
+        f.write(b"changed")
+    with open(third["output"], "rb") as f:
+        assert not f.read().startswith(b"changed")
+
+
+@pytest.mark.parametrize("staged", [False, True])
+def test_duplicates_in_one_batch_wait_for_the_first(tmp_path, staged):
+    cache = PdfCache(str(tmp_path / "cache"))
+    sources = [write(str(tmp_path / "in" / f"{name}.hwp"), b"same" * 50) for name in "abc"]
+    stager = OutputStager(str(tmp_path / "staging")) if staged else None
+    try:
+        results = run_batch("hwp", sources, str(tmp_path / "out"), backend="fake", cache=cache, stager=stager)
+    finally:
+        if stager is not None:
+            stager.close()
+
+    cached = {os.path.basename(r["source"]): r.get("cached") for r in results}
+    assert cached == {"a.hwp": None, "b.hwp": True, "c.hwp": True}
+    assert all(os.path.exists(r["output"]) for r in results)
+
+
+def test_duplicate_is_converted_when_first_conversion_failed(tmp_path):
+    cache = PdfCache(str(tmp_path / "cache"))
+    sources = [write(str(tmp_path / "in" / name), b"same" * 50) for name in ("fail.hwp", "ok.hwp")]
+    results = run_batch("hwp", sources, str(tmp_path / "out"), backend="fake", cache=cache)
+
+    statuses = {os.path.basename(r["source"]): (r["status"], r.get("cached")) for r in results}
+    assert statuses == {"fail.hwp": ("failed", None), "ok.hwp": ("done", None)}
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = PdfCache(str(tmp_path / "cache"), max_bytes=250)
+    pdfs = {key: write(str(tmp_path / f"{key}.pdf"), b"%" * 100) for key in ("aa1", "bb2", "cc3")}
+    cache.store("aa1", pdfs["aa1"])
+    cache.store("bb2", pdfs["bb2"])
+    # aa1을 최근에 쓴 것으로 만들면 bb2가 먼저 지워짐
+    cache.entries["bb2"]["last_used"] -= 10
+    assert cache.fetch("aa1", str(tmp_path / "out" / "a.pdf"))
+    cache.store("cc3", pdfs["cc3"])
+
+    assert sorted(cache.entries) == ["aa1", "cc3"]
+    assert cache.total_bytes() <= 250
+    assert not os.path.exists(cache._path("bb2"))
+
+
+@pytest.mark.parametrize("change", ["size", "mtime"])
+def test_changed_cache_file_is_invalidated(tmp_path, change):
+    cache = PdfCache(str(tmp_path / "cache"))
+    cache.store("key1", write(str(tmp_path / "a.pdf"), b"%" * 100))
+    path = cache._path("key1")
+    if change == "size":
+        with open(path, "ab") as f:
+            f.write(b"more")
+    else:
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+    assert not cache.fetch("key1", str(tmp_path / "out" / "a.pdf"))
+    assert "key1" not in cache.entries
+    assert not os.path.exists(str(tmp_path / "out" / "a.pdf"))
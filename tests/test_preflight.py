@@ -0,0 +1,130 @@
+import struct
+import zipfile
+
+import pytest
+
+from preflight import check, sniff, DOC_IDENT, DOC_FLAG_ENCRYPTED, DOC_FLAG_OBFUSCATED, HWP_SIGNATURE, HWP_FLAG_PASSWORD
+
+FREESECT = 0xFFFFFFFF
+ENDOFCHAIN = 0xFFFFFFFE
+FATSECT = 0xFFFFFFFD
+SECTOR = 512
+
+
+def _dir_entry(name, entry_type, start, size):
+    encoded = (name + "\0").encode("utf-16-le")
+    entry = bytearray(128)
+    entry[:len(encoded)] = encoded
+    struct.pack_into("<HB", entry, 0x40, len(encoded), entry_type)
+    struct.pack_into("<III", entry, 0x44, FREESECT, FREESECT, FREESECT)
+    struct.pack_into("<II", entry, 0x74, start, size)
+    return bytes(entry)
+
+
+def build_cfb(streams):
+    """스트림 이름 → 내용으로 최소 OLE 복합 문서 생성 (스트림은 4096바이트 이상으로 채워 일반 섹터에 둠)"""
+    fat = [FATSECT, ENDOFCHAIN]
+    data = b""
+    entries = [_dir_entry("Root Entry", 5, ENDOFCHAIN, 0)]
+    for name, content in streams.items():
+        content = content.ljust(4096, b"\0")
+        sectors = (len(content) + SECTOR - 1) // SECTOR
+        start = len(fat)
+        fat.extend(range(start + 1, start + sectors))
+        fat.append(ENDOFCHAIN)
+        entries.append(_dir_entry(name, 2, start, len(content)))
+        data += content.ljust(sectors * SECTOR, b"\0")
+    assert len(fat) <= SECTOR // 4 and len(entries) <= 4
+
+    header = bytearray(SECTOR)
+    header[:8] = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+    struct.pack_into("<HHHHH", header, 0x18, 0x3E, 3, 0xFFFE, 9, 6)
+    struct.pack_into("<8I", header, 0x2C, 1, 1, 0, 4096, ENDOFCHAIN, 0, ENDOFCHAIN, 0)
+    struct.pack_into("<109I", header, 0x4C, 0, *([FREESECT] * 108))
+    fat_sector = struct.pack(f"<{SECTOR // 4}I", *(fat + [FREESECT] * (SECTOR // 4 - len(fat))))
+    directory = b"".join(entries).ljust(SECTOR, b"\0")
+    return bytes(header) + fat_sector + directory + data
+
+
+def word_fib(flags):
+    fib = bytearray(32)
+    # FibBase: wIdent, nFib, unused, lid, pnNext, 플래그
+    struct.pack_into("<HHHHHH", fib, 0, DOC_IDENT, 0x00C1, 0, 0x0412, 0x1234, flags)
+    return bytes(fib)
+
+
+def write(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_bytes(content)
+    return str(path)
+
+
+def test_plain_doc_passes(tmp_path):
+    path = write(tmp_path, "plain.doc", build_cfb({"WordDocument": word_fib(0)}))
+    assert check(path, "word") == ("ok", sniff(path))
+    assert sniff(path).format == "doc"
+
+
+@pytest.mark.parametrize("flags", [DOC_FLAG_ENCRYPTED, DOC_FLAG_OBFUSCATED | DOC_FLAG_ENCRYPTED])
+def test_encrypted_doc_rejected(tmp_path, flags):
+    path = write(tmp_path, "secret.doc", build_cfb({"WordDocument": word_fib(flags)}))
+    action, verdict = check(path, "word")
+    assert action == "rejected"
+    assert verdict.problem == "encrypted"
+
+
+def test_doc_pn_next_is_not_read_as_flags(tmp_path):
+    # pnNext(오프셋 8)에 암호 비트와 같은 값이 있어도 암호 문서로 보지 않음
+    fib = bytearray(word_fib(0))
+    struct.pack_into("<H", fib, 8, DOC_FLAG_ENCRYPTED)
+    path = write(tmp_path, "plain.doc", build_cfb({"WordDocument": bytes(fib)}))
+    assert check(path, "word")[0] == "ok"
+
+
+def test_hwp_password_rejected(tmp_path):
+    header = bytearray(HWP_SIGNATURE.ljust(256, b"\0"))
+    struct.pack_into("<I", header, 36, HWP_FLAG_PASSWORD)
+    path = write(tmp_path, "secret.hwp", build_cfb({"FileHeader": bytes(header)}))
+    action, verdict = check(path, "hwp")
+    assert (action, verdict.problem) == ("rejected", "encrypted")
+
+
+def test_encrypted_package_rejected(tmp_path):
+    path = write(tmp_path, "secret.docx", build_cfb({"EncryptedPackage": b"x"}))
+    assert check(path, "word")[1].problem == "encrypted"
+
+
+def test_docx_with_hwp_extension_is_routed(tmp_path):
+    path = str(tmp_path / "letter.hwp")
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("[Content_Types].xml", "<Types/>")
+        zf.writestr("word/document.xml", "<document/>")
+    action, verdict = check(path, "hwp")
+    assert action == "routed"
+    assert (verdict.format, verdict.file_type) == ("docx", "word")
+
+
+def test_hwpx_without_header_is_corrupt(tmp_path):
+    path = str(tmp_path / "broken.hwpx")
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("mimetype", "application/hwp+zip")
+    assert check(path, "hwp") == ("rejected", sniff(path))
+    assert sniff(path).problem == "corrupt"
+
+
+@pytest.mark.parametrize("content, problem", [
+    (b"", "empty"),
+    (b"just some text", "unknown"),
+    (b"PK\x03\x04truncated", "corrupt"),
+    (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1" + b"\0" * 100, "truncated"),
+])
+def test_broken_files_rejected(tmp_path, content, problem):
+    path = write(tmp_path, "bad.docx", content)
+    action, verdict = check(path, "word")
+    assert action == "rejected"
+    assert verdict.problem == problem
+
+
+def test_rtf_and_hwp3_accepted(tmp_path):
+    assert check(write(tmp_path, "a.doc", b"{\\rtf1 hello}"), "word")[0] == "ok"
+    assert check(write(tmp_path, "a.hwp", HWP_SIGNATURE + b"\0" * 64), "hwp")[0] == "ok"
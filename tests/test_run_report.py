@@ -0,0 +1,75 @@
+import csv
+import json
+
+from run_report import RunReport, percentile
+
+
+def result(name, status="done", elapsed=1.0, **fields):
+    return dict({"file_type": "hwp", "filename": name, "source": f"in/{name}", "output": f"out/{name}.pdf",
+                 "status": status, "error": None if status == "done" else "실패", "elapsed": elapsed,
+                 "worker": 1, "input_size": 1048576, "output_size": 524288,
+                 "timings": {"open": elapsed / 2, "save": elapsed / 4}}, **fields)
+
+
+def test_percentile_interpolates():
+    assert percentile([], 50) is None
+    assert percentile([3.0], 99) == 3.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.5
+    assert percentile([1.0, 2.0, 3.0, 4.0], 100) == 4.0
+
+
+def test_summary_aggregates_results_and_instances(tmp_path):
+    report = RunReport(str(tmp_path), slowest_count=2)
+    for i, elapsed in enumerate([1.0, 4.0, 2.0]):
+        report.add(result(f"doc{i}.hwp", elapsed=elapsed))
+    report.add(result("bad.hwp", status="failed", elapsed=3.0))
+    report.add_instance({"worker": 1, "startup": 0.5, "quit": 0.25})
+    report.add_instance({"worker": 1, "startup": 0.5, "quit": 0.25, "recycle_reason": "memory",
+                         "rss_before": 300 * 1048576, "rss_after": 100 * 1048576})
+
+    summary = report.summary()
+    assert summary["files"] == 4
+    assert summary["statuses"] == {"done": 3, "failed": 1}
+    assert summary["instances"] == 2
+    assert (summary["recycles"], summary["reclaimed_bytes"]) == (1, 200 * 1048576)
+    assert summary["elapsed_total"] == 10.0
+    assert summary["p50"] == 2.5
+    assert summary["stage_totals"]["open"] == 5.0
+    assert summary["stage_totals"]["startup"] == 1.0
+    assert summary["input_bytes"] == 4 * 1048576
+    assert [s["filename"] for s in summary["slowest"]] == ["doc1.hwp", "bad.hwp"]
+
+    lines = report.format_summary(summary)
+    assert "단계별 합계: 시작 1.0초, 종료 0.5초, 열기 5.0초, PDF 저장 2.5초" in lines
+    assert "♻️ 변환기 재시작 1회, 메모리 200MB 회수" in lines
+    assert "입력 4.0MB → PDF 2.0MB" in lines
+
+
+def test_write_jsonl_and_csv(tmp_path):
+    report = RunReport(str(tmp_path))
+    report.add(result("보고서.hwp", elapsed=2.0, cached=True))
+    report.add_instance({"worker": 1, "startup": 0.5})
+    report.add_preflight([{"filename": "x.hwp", "action": "rejected", "format": "hwp", "problem": "encrypted",
+                           "detail": None}])
+
+    jsonl_path, csv_path = report.write("report")
+
+    assert jsonl_path == str(tmp_path / "report.jsonl")
+    with open(jsonl_path, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert [r["record"] for r in records] == ["file", "instance", "preflight", "summary"]
+    assert records[0]["filename"] == "보고서.hwp" and records[0]["cached"] is True
+    assert records[-1]["files"] == 1 and "preflight" not in records[-1]
+
+    with open(csv_path, "rb") as f:
+        assert f.read(3) == b"\xef\xbb\xbf"
+    with open(csv_path, encoding="utf-8-sig", newline="") as f:
+        [row] = list(csv.DictReader(f))
+    # 단계별 시간은 열로 펼치고, 열에 없는 값(cached)은 버림
+    assert row["filename"] == "보고서.hwp"
+    assert float(row["open_time"]) == 1.0 and row["dialog_time"] == ""
+    assert "cached" not in row
+
+
+def test_empty_report_has_no_timing_lines(tmp_path):
+    assert RunReport(str(tmp_path)).format_summary() == []
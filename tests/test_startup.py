@@ -0,0 +1,11 @@
+import pytest
+
+from startup_time import measure
+
+
+@pytest.mark.parametrize("module", ["to_pdf", "cli", "engine", "hwpword_to_pdf"])
+def test_heavy_modules_stay_lazy(module, tmp_path):
+    if module == "hwpword_to_pdf":
+        pytest.importorskip("tkinter")
+    result = measure(module, runs=1, top=0, pycache=str(tmp_path))
+    assert result["unexpected"] == [], f"{module}이 시작할 때 불러오면 안 되는 모듈: {result['unexpected']}"